@@ -0,0 +1,84 @@
+"""Store priority and status as SMALLINT
+
+Revision ID: 5b1f0c2d9e47
+Revises: 07ce7ae63b4a
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1f0c2d9e47'
+down_revision: Union[str, Sequence[str], None] = '07ce7ae63b4a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Enum member names in declaration order; a member is stored as its index
+# (see reeve.pulse.models.SmallIntEnum)
+COLUMNS = {
+    'priority': ('pulsepriority', ('CRITICAL', 'HIGH', 'NORMAL', 'LOW', 'DEFERRED')),
+    'status': ('pulsestatus', ('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED', 'CANCELLED')),
+}
+
+
+def _to_index(column: str, names: Sequence[str]) -> str:
+    whens = ' '.join(f"WHEN '{name}' THEN {index}" for index, name in enumerate(names))
+    return f'CASE {column} {whens} END'
+
+
+def _to_name(column: str, names: Sequence[str]) -> str:
+    whens = ' '.join(f"WHEN {index} THEN '{name}'" for index, name in enumerate(names))
+    return f'CASE {column} {whens} END'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    is_postgresql = op.get_context().dialect.name == 'postgresql'
+
+    if not is_postgresql:
+        # SQLite columns accept any value, so convert in place before the
+        # batch table copy changes the declared type
+        for column, (_, names) in COLUMNS.items():
+            op.execute(f'UPDATE pulses SET {column} = {_to_index(column, names)}')
+
+    with op.batch_alter_table('pulses') as batch_op:
+        for column, (type_name, names) in COLUMNS.items():
+            batch_op.alter_column(
+                column,
+                existing_type=sa.Enum(*names, name=type_name),
+                type_=sa.SmallInteger(),
+                existing_nullable=False,
+                postgresql_using=_to_index(column, names),
+            )
+
+    if is_postgresql:
+        for type_name, _ in COLUMNS.values():
+            op.execute(f'DROP TYPE IF EXISTS {type_name}')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    is_postgresql = op.get_context().dialect.name == 'postgresql'
+
+    if is_postgresql:
+        for type_name, names in COLUMNS.values():
+            sa.Enum(*names, name=type_name).create(op.get_bind(), checkfirst=True)
+
+    with op.batch_alter_table('pulses') as batch_op:
+        for column, (type_name, names) in COLUMNS.items():
+            batch_op.alter_column(
+                column,
+                existing_type=sa.SmallInteger(),
+                type_=sa.Enum(*names, name=type_name),
+                existing_nullable=False,
+                postgresql_using=f'({_to_name(column, names)})::{type_name}',
+            )
+
+    if not is_postgresql:
+        for column, (_, names) in COLUMNS.items():
+            op.execute(f'UPDATE pulses SET {column} = {_to_name(column, names)}')
@@ -0,0 +1,72 @@
+"""Store sticky_notes and tags as string lists
+
+Revision ID: 9c3e7a1d4f20
+Revises: 5b1f0c2d9e47
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+import json
+from typing import Any, Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3e7a1d4f20'
+down_revision: Union[str, Sequence[str], None] = '5b1f0c2d9e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = ('sticky_notes', 'tags')
+
+# Item prefix for the packed TEXT format (see reeve.pulse.models.StringList)
+SEPARATOR = '\x1f'
+
+
+def _pack(items: Optional[list]) -> Optional[str]:
+    return None if items is None else ''.join(SEPARATOR + item for item in items)
+
+
+def _unpack(value: Optional[str]) -> Optional[list]:
+    return None if value is None else value.split(SEPARATOR)[1:]
+
+
+def _load_json(value: Any) -> Optional[list]:
+    # SQLite hands back JSON as text; Postgres drivers may already decode it
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _convert(new_type: sa.types.TypeEngine, encode) -> None:
+    """Rewrite both columns as new_type, re-encoding every row with encode()."""
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(f"SELECT id, {', '.join(COLUMNS)} FROM pulses")).all()
+
+    with op.batch_alter_table('pulses') as batch_op:
+        for column in COLUMNS:
+            # Values are rewritten below, so Postgres can start the column off NULL
+            batch_op.alter_column(column, type_=new_type, postgresql_using='NULL')
+
+    update = sa.text(
+        f"UPDATE pulses SET {', '.join(f'{c} = :{c}' for c in COLUMNS)} WHERE id = :id"
+    ).bindparams(*(sa.bindparam(c, type_=new_type) for c in COLUMNS))
+    for row in rows:
+        bind.execute(update, {'id': row.id, **{c: encode(getattr(row, c)) for c in COLUMNS}})
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_context().dialect.name == 'postgresql':
+        _convert(postgresql.ARRAY(sa.Text()), _load_json)
+    else:
+        _convert(sa.Text(), lambda value: _pack(_load_json(value)))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name == 'postgresql':
+        _convert(sa.JSON(none_as_null=True), lambda value: value)
+    else:
+        _convert(sa.JSON(none_as_null=True), lambda value: _unpack(value))
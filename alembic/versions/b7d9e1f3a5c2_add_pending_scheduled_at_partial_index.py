@@ -0,0 +1,39 @@
+"""Add pending scheduled_at partial index
+
+Revision ID: b7d9e1f3a5c2
+Revises: e4a2b6c8d013
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d9e1f3a5c2'
+down_revision: Union[str, Sequence[str], None] = 'e4a2b6c8d013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# PENDING is stored as 0 (see 5b1f0c2d9e47)
+PENDING = sa.text('status = 0')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_pulse_pending_sched',
+        'pulses',
+        ['scheduled_at'],
+        unique=False,
+        sqlite_where=PENDING,
+        postgresql_where=PENDING,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_pulse_pending_sched', table_name='pulses')
@@ -0,0 +1,30 @@
+"""Replace execution index with due pulse index
+
+Revision ID: e4a2b6c8d013
+Revises: 9c3e7a1d4f20
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a2b6c8d013'
+down_revision: Union[str, Sequence[str], None] = '9c3e7a1d4f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_pulse_due', 'pulses', ['status', 'priority', 'scheduled_at'], unique=False)
+    op.drop_index('idx_pulse_execution', table_name='pulses')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('idx_pulse_execution', 'pulses', ['status', 'scheduled_at', 'priority'], unique=False)
+    op.drop_index('idx_pulse_due', table_name='pulses')
@@ -7,22 +7,33 @@ trigger pulses without using the MCP protocol.
 Endpoints:
     POST /api/pulse/schedule - Create a new pulse
     GET  /api/pulse/upcoming - List upcoming pulses
+    POST /api/pulse/bulk - Get details for multiple pulses
     GET  /api/health - Health check
     GET  /api/status - Daemon status
 """
 
+import json
 from datetime import datetime
-from typing import List, Literal, Optional, cast
+from typing import Any, Awaitable, Callable, List, Literal, Optional, cast
 
 from fastapi import Depends, FastAPI, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from starlette.routing import Route
 
-from reeve.pulse.enums import PulsePriority
+from reeve.pulse.enums import PulsePriority, PulseStatus
+from reeve.pulse.models import Pulse, StringList
 from reeve.pulse.queue import PulseQueue
 from reeve.utils.config import ReeveConfig
+from reeve.utils.text import preview
 from reeve.utils.time_parser import parse_time_string
 
+# Enum -> wire value lookups used when serializing pulse lists (avoids a
+# per-row .value attribute chain on every list item)
+_PRIORITY_VALUES = {member: member.value for member in PulsePriority}
+_STATUS_VALUES = {member: member.value for member in PulseStatus}
+
+
 # ========================================================================
 # Request/Response Models
 # ========================================================================
@@ -69,6 +80,13 @@ class SchedulePulseRequest(BaseModel):
         description="Source identifier (e.g., 'telegram', 'email', 'webhook')",
     )
 
+    @field_validator("sticky_notes", "tags")
+    @classmethod
+    def _storable_items(
+        cls, items: Optional[List[str]], info: ValidationInfo
+    ) -> Optional[List[str]]:
+        return StringList.check_items(cast(str, info.field_name), items)
+
 
 class SchedulePulseResponse(BaseModel):
     """Response after scheduling a pulse."""
@@ -115,6 +133,17 @@ class PulseDetailResponse(BaseModel):
     created_by: str
 
 
+class BulkPulseRequest(BaseModel):
+    """Request body for fetching multiple pulses at once."""
+
+    ids: List[int] = Field(
+        ...,
+        description="Pulse IDs to retrieve (results are returned in the same order)",
+        min_length=1,
+        max_length=100,
+    )
+
+
 class PulseListItem(BaseModel):
     """Single pulse item in pulse list."""
 
@@ -162,6 +191,86 @@ class ExecutionStatsResponse(BaseModel):
     recent_failures: List[RecentFailureItem]
 
 
+def _pulse_detail(pulse: Pulse) -> PulseDetailResponse:
+    """Build the full detail response for a pulse."""
+    return PulseDetailResponse(
+        id=cast(int, pulse.id),
+        scheduled_at=pulse.scheduled_at.isoformat(),
+        prompt=cast(str, pulse.prompt),
+        priority=pulse.priority.value,
+        status=pulse.status.value,
+        session_id=pulse.session_id,
+        sticky_notes=pulse.sticky_notes,
+        tags=pulse.tags,
+        executed_at=pulse.executed_at.isoformat() if pulse.executed_at else None,
+        execution_duration_ms=pulse.execution_duration_ms,
+        error_message=pulse.error_message,
+        retry_count=cast(int, pulse.retry_count),
+        max_retries=cast(int, pulse.max_retries),
+        created_at=pulse.created_at.isoformat(),
+        created_by=cast(str, pulse.created_by),
+    )
+
+
+# ========================================================================
+# Health Check (raw ASGI)
+# ========================================================================
+
+
+# Pre-rendered once at import: the health response never changes, so probes
+# skip FastAPI routing, dependency resolution, and JSON encoding entirely.
+_HEALTH_BODY = json.dumps(
+    {"status": "healthy", "service": "reeve-pulse-daemon"}, separators=(",", ":")
+).encode()
+_HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_BODY)).encode()),
+]
+_HEALTH_START = {"type": "http.response.start", "status": 200, "headers": _HEALTH_HEADERS}
+_HEALTH_RESPONSE = {"type": "http.response.body", "body": _HEALTH_BODY}
+# HEAD keeps the GET headers (including Content-Length) but sends no body
+_HEALTH_HEAD_RESPONSE = {"type": "http.response.body", "body": b""}
+
+# Other methods get the same 405 FastAPI returns for a GET-only route
+_METHOD_NOT_ALLOWED_BODY = b'{"detail":"Method Not Allowed"}'
+_METHOD_NOT_ALLOWED_START = {
+    "type": "http.response.start",
+    "status": 405,
+    "headers": [
+        (b"allow", b"GET, HEAD"),
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_METHOD_NOT_ALLOWED_BODY)).encode()),
+    ],
+}
+_METHOD_NOT_ALLOWED_RESPONSE = {"type": "http.response.body", "body": _METHOD_NOT_ALLOWED_BODY}
+
+
+class _HealthApp:
+    """
+    Minimal ASGI app serving the static health check response (no auth required).
+
+    Example:
+        curl -X GET http://localhost:8765/api/health
+    """
+
+    async def __call__(
+        self,
+        scope: dict[str, Any],
+        receive: Callable[[], Awaitable[dict[str, Any]]],
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        method = scope["method"]
+        if method == "GET":
+            await send(_HEALTH_START)
+            await send(_HEALTH_RESPONSE)
+        elif method == "HEAD":
+            await send(_HEALTH_START)
+            await send(_HEALTH_HEAD_RESPONSE)
+        else:
+            await send(_METHOD_NOT_ALLOWED_START)
+            await send(_METHOD_NOT_ALLOWED_RESPONSE)
+
+
 # ========================================================================
 # Authentication
 # ========================================================================
@@ -314,31 +423,18 @@ def create_app(queue: PulseQueue, config: ReeveConfig) -> FastAPI:
             UpcomingPulseItem(
                 id=cast(int, p.id),
                 scheduled_at=p.scheduled_at.isoformat(),
-                priority=p.priority.value,
-                prompt=(
-                    cast(str, p.prompt)[:100] + "..."
-                    if len(cast(str, p.prompt)) > 100
-                    else cast(str, p.prompt)
-                ),
-                status=p.status.value,
+                priority=_PRIORITY_VALUES[p.priority],
+                prompt=preview(p.prompt, 100),
+                status=_STATUS_VALUES[p.status],
             )
             for p in pulses
         ]
 
         return UpcomingPulsesResponse(count=len(pulse_items), pulses=pulse_items)
 
-    @app.get("/api/health")
-    async def health_check():
-        """
-        Health check endpoint (no auth required).
-
-        Returns:
-            Simple health status indicator
-
-        Example:
-            curl -X GET http://localhost:8765/api/health
-        """
-        return {"status": "healthy", "service": "reeve-pulse-daemon"}
+    # Health check is mounted as a raw ASGI route (see _HealthApp, which also
+    # answers HEAD and rejects other methods itself)
+    app.router.routes.append(Route("/api/health", _HealthApp(), include_in_schema=False))
 
     @app.get("/api/status")
     async def daemon_status(authorized: bool = Depends(verify_token)):
@@ -399,28 +495,23 @@ def create_app(queue: PulseQueue, config: ReeveConfig) -> FastAPI:
                 detail=f"Invalid status '{status}'. Must be one of: {', '.join(sorted(valid_statuses))}",
             )
 
+        # Build response items as rows stream in rather than listing the pulses first
         try:
-            pulses = await queue.get_pulses_by_status(status=status, limit=limit)
+            pulse_items = [
+                PulseListItem(
+                    id=cast(int, p.id),
+                    scheduled_at=p.scheduled_at.isoformat(),
+                    priority=_PRIORITY_VALUES[p.priority],
+                    prompt=preview(p.prompt, 100),
+                    status=_STATUS_VALUES[p.status],
+                    executed_at=p.executed_at.isoformat() if p.executed_at else None,
+                    error_message=p.error_message,
+                )
+                async for p in queue.stream_pulses_by_status(status=status, limit=limit)
+            ]
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to retrieve pulses: {str(e)}")
 
-        pulse_items = [
-            PulseListItem(
-                id=cast(int, p.id),
-                scheduled_at=p.scheduled_at.isoformat(),
-                priority=p.priority.value,
-                prompt=(
-                    cast(str, p.prompt)[:100] + "..."
-                    if len(cast(str, p.prompt)) > 100
-                    else cast(str, p.prompt)
-                ),
-                status=p.status.value,
-                executed_at=p.executed_at.isoformat() if p.executed_at else None,
-                error_message=p.error_message,
-            )
-            for p in pulses
-        ]
-
         return PulseListResponse(count=len(pulse_items), pulses=pulse_items)
 
     @app.get("/api/pulse/stats", response_model=PulseStatsResponse)
@@ -442,6 +533,34 @@ def create_app(queue: PulseQueue, config: ReeveConfig) -> FastAPI:
 
         return PulseStatsResponse(**stats)
 
+    @app.post("/api/pulse/bulk", response_model=List[PulseDetailResponse])
+    async def bulk_get_pulses(request: BulkPulseRequest, authorized: bool = Depends(verify_token)):
+        """
+        Get full details of multiple pulses in one request.
+
+        Fetches all requested pulses with a single query instead of one
+        /api/pulse/{id} round trip per pulse. Unknown IDs are omitted.
+
+        Args:
+            request: Body with up to 100 pulse IDs
+
+        Returns:
+            Pulse details in the same order as the requested IDs
+
+        Example:
+            curl -X POST http://localhost:8765/api/pulse/bulk \\
+                 -H "Authorization: Bearer your_token_here" \\
+                 -H "Content-Type: application/json" \\
+                 -d '{"ids": [123, 124, 125]}'
+        """
+        try:
+            pulses = await queue.get_pulses_by_ids(request.ids)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to retrieve pulses: {str(e)}")
+
+        by_id = {p.id: p for p in pulses}
+        return [_pulse_detail(by_id[i]) for i in request.ids if i in by_id]
+
     @app.get("/api/pulse/{pulse_id}", response_model=PulseDetailResponse)
     async def get_pulse_detail(pulse_id: int, authorized: bool = Depends(verify_token)):
         """
@@ -465,23 +584,7 @@ def create_app(queue: PulseQueue, config: ReeveConfig) -> FastAPI:
         if not pulse:
             raise HTTPException(status_code=404, detail=f"Pulse {pulse_id} not found")
 
-        return PulseDetailResponse(
-            id=cast(int, pulse.id),
-            scheduled_at=pulse.scheduled_at.isoformat(),
-            prompt=cast(str, pulse.prompt),
-            priority=pulse.priority.value,
-            status=pulse.status.value,
-            session_id=pulse.session_id,
-            sticky_notes=pulse.sticky_notes,
-            tags=pulse.tags,
-            executed_at=pulse.executed_at.isoformat() if pulse.executed_at else None,
-            execution_duration_ms=pulse.execution_duration_ms,
-            error_message=pulse.error_message,
-            retry_count=cast(int, pulse.retry_count),
-            max_retries=cast(int, pulse.max_retries),
-            created_at=pulse.created_at.isoformat(),
-            created_by=cast(str, pulse.created_by),
-        )
+        return _pulse_detail(pulse)
 
     @app.get("/api/stats", response_model=ExecutionStatsResponse)
     async def get_execution_stats(authorized: bool = Depends(verify_token)):
@@ -15,14 +15,15 @@ Usage:
 """
 
 import argparse
-import asyncio
 import logging
 import sys
 from datetime import datetime, timezone
 
+from reeve.debug.timing import TimingBreakdown
 from reeve.pulse.enums import PulsePriority
 from reeve.pulse.executor import PulseExecutor
 from reeve.pulse.queue import PulseQueue
+from reeve.utils import event_loop
 from reeve.utils.config import get_config
 
 # Configure logging for CLI output
@@ -112,16 +113,16 @@ async def run_trigger(args: argparse.Namespace) -> int:
 
         # Execute the pulse
         logger.info(f"Executing pulse #{pulse_id}...")
-        start_time = datetime.now(timezone.utc)
 
         try:
-            result = await executor.execute(
-                prompt=full_prompt,
-                session_id=pulse.session_id,
-            )
+            # Monotonic timing (perf_counter), unaffected by wall-clock adjustments
+            with TimingBreakdown("trigger_pulse", auto_log=False) as timing:
+                result = await executor.execute(
+                    prompt=full_prompt,
+                    session_id=pulse.session_id,
+                )
 
-            end_time = datetime.now(timezone.utc)
-            duration_ms = int((end_time - start_time).total_seconds() * 1000)
+            duration_ms = int(timing.get_breakdown()["total"])
 
             # Mark completed
             await queue.mark_completed(pulse_id, execution_duration_ms=duration_ms)
@@ -196,7 +197,7 @@ Examples:
     args = parser.parse_args()
 
     # Run the async workflow
-    exit_code = asyncio.run(run_trigger(args))
+    exit_code = event_loop.run(run_trigger(args))
     sys.exit(exit_code)
 
 
@@ -13,14 +13,15 @@ Validates the entire Reeve stack:
 - Service health
 """
 
-import json
+import functools
 import os
 import shutil
-import sqlite3
-import subprocess
+import socket
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, cast
 
 # Try to load .env file
 try:
@@ -35,12 +36,10 @@ except ImportError:
     _project_root = Path(__file__).parent.parent.parent
     _env_path = _project_root / ".env"
     if _env_path.exists():
-        with open(_env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, _, value = line.partition("=")
-                    os.environ.setdefault(key.strip(), value.strip())
+        for line in _env_path.read_text().splitlines():
+            key, sep, value = line.strip().partition("=")
+            if sep and key and not key.startswith("#"):
+                os.environ.setdefault(key.strip(), value.strip())
 
 
 # Constants
@@ -48,15 +47,15 @@ PASS = "\u2713"  # checkmark
 FAIL = "\u2717"  # X
 WARN = "!"
 
-EXPECTED_MIGRATION = "07ce7ae63b4a"
-
-REQUIRED_PERMISSIONS = [
+# Display order for the permission checks
+_ORDERED_PERMISSIONS: Tuple[str, ...] = (
     "mcp__pulse-queue__schedule_pulse",
     "mcp__pulse-queue__list_upcoming_pulses",
     "mcp__pulse-queue__cancel_pulse",
     "mcp__pulse-queue__reschedule_pulse",
     "mcp__telegram-notifier__send_notification",
-]
+)
+REQUIRED_PERMISSIONS: FrozenSet[str] = frozenset(_ORDERED_PERMISSIONS)
 
 
 def expand_path(path: str) -> str:
@@ -64,6 +63,12 @@ def expand_path(path: str) -> str:
     return str(Path(os.path.expandvars(os.path.expanduser(path))).resolve())
 
 
+@functools.lru_cache(maxsize=64)
+def _which(cmd: str) -> Optional[str]:
+    """Memoized shutil.which, since the same commands are looked up across checks."""
+    return shutil.which(cmd)
+
+
 def extract_db_path(db_url: str) -> Optional[str]:
     """Extract file path from sqlite URL."""
     # Handle sqlite+aiosqlite:///path or sqlite:///path
@@ -80,34 +85,71 @@ class Doctor:
         self.passed = 0
         self.failed = 0
         self.warnings = 0
+        # Environment snapshot shared by all checks (taken after .env is loaded)
+        self._env: Dict[str, str] = dict(os.environ)
+        # Buffered (condition, message, required) results per section, printed by report()
+        self._pending: Dict[str, List[Tuple[bool, str, bool]]] = {}
+        self._local = threading.local()
+        # Parsed JSON files keyed by (path, mtime_ns) so edits invalidate the entry
+        self._json_cache: Dict[Tuple[Path, int], Any] = {}
 
     def check(self, condition: bool, message: str, required: bool = True) -> bool:
-        """Record a check result."""
-        if condition:
-            print(f"  {PASS} {message}")
-            self.passed += 1
-            return True
-        elif required:
-            print(f"  {FAIL} {message}")
-            self.failed += 1
-            return False
-        else:
-            print(f"  {WARN} {message}")
-            self.warnings += 1
-            return False
+        """Record a check result in the current section."""
+        self._pending[self._local.section].append((condition, message, required))
+        return condition
 
     def section(self, title: str) -> None:
-        """Print a section header."""
+        """Start buffering results for a section on the calling thread."""
+        self._local.section = title
+        self._pending[title] = []
+
+    def report(self, title: str) -> None:
+        """Print a section's buffered results and update the counters."""
         print(f"\n{title}:")
+        for condition, message, required in self._pending.pop(title, []):
+            if condition:
+                print(f"  {PASS} {message}")
+                self.passed += 1
+            elif required:
+                print(f"  {FAIL} {message}")
+                self.failed += 1
+            else:
+                print(f"  {WARN} {message}")
+                self.warnings += 1
+
+    def _scan_dir(self, directory: Path) -> Dict[str, "os.DirEntry[str]"]:
+        """List a directory's entries in one scandir call ({} if it doesn't exist)."""
+        try:
+            with os.scandir(directory) as it:
+                return {entry.name: entry for entry in it}
+        except FileNotFoundError:
+            return {}
+
+    def _load_json(self, path: Path, stat: Optional[os.stat_result] = None) -> Any:
+        """Parse a JSON file, reusing the cached result while the file is unchanged."""
+        import json
+
+        if stat is None:
+            stat = path.stat()
+        key = (path, stat.st_mtime_ns)
+        if key not in self._json_cache:
+            with open(path) as f:
+                self._json_cache[key] = json.load(f)
+        return self._json_cache[key]
+
+    def _run_section(self, check: Callable[..., Any], *args: Any) -> str:
+        """Run a check method and return the title of the section it recorded."""
+        check(*args)
+        return cast(str, self._local.section)
 
     def check_environment(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """Check environment variables."""
         self.section("Environment")
 
         # Required variables
-        api_token = os.getenv("PULSE_API_TOKEN")
-        desk_path = os.getenv("REEVE_DESK_PATH")
-        db_url = os.getenv("PULSE_DB_URL")
+        api_token = self._env.get("PULSE_API_TOKEN")
+        desk_path = self._env.get("REEVE_DESK_PATH")
+        db_url = self._env.get("PULSE_DB_URL")
 
         self.check(bool(api_token), "PULSE_API_TOKEN set")
 
@@ -124,15 +166,15 @@ class Doctor:
             self.check(False, "PULSE_DB_URL not set")
 
         # Optional variables (warnings only)
-        hapi_cmd = os.getenv("HAPI_COMMAND")
+        hapi_cmd = self._env.get("HAPI_COMMAND")
         if not hapi_cmd:
             self.check(False, "HAPI_COMMAND not set (using default 'hapi')", required=False)
 
-        api_port = os.getenv("PULSE_API_PORT")
+        api_port = self._env.get("PULSE_API_PORT")
         if not api_port:
             self.check(False, "PULSE_API_PORT not set (using default 8765)", required=False)
 
-        telegram_token = os.getenv("TELEGRAM_BOT_TOKEN")
+        telegram_token = self._env.get("TELEGRAM_BOT_TOKEN")
         if not telegram_token:
             self.check(False, "TELEGRAM_BOT_TOKEN not set (Telegram disabled)", required=False)
 
@@ -140,6 +182,9 @@ class Doctor:
 
     def check_database(self, db_url: Optional[str]) -> None:
         """Check database existence and migrations."""
+        import sqlite3
+        from urllib.parse import quote
+
         self.section("Database")
 
         if not db_url:
@@ -151,17 +196,18 @@ class Doctor:
             self.check(False, f"Cannot extract path from: {db_url}")
             return
 
-        # Check file exists
-        db_file = Path(db_path)
-        if not self.check(db_file.exists(), f"Database exists: {db_path}"):
+        # Open read-only: mode=ro never creates the file (so no separate exists()
+        # stat is needed) and never leaves a journal behind
+        try:
+            conn = sqlite3.connect(f"file:{quote(db_path)}?mode=ro", uri=True)
+        except sqlite3.OperationalError as e:
+            self.check(False, f"Database missing or unreadable: {db_path} ({e})")
             return
+        self.check(True, f"Database exists: {db_path}")
 
-        # Try to connect and query
+        # Try to query
         try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' LIMIT 1")
-            cursor.fetchone()
+            conn.execute("PRAGMA schema_version").fetchone()
             conn.close()
             self.check(True, "Can connect and query")
         except Exception as e:
@@ -170,47 +216,56 @@ class Doctor:
 
         # Check migrations
         try:
+            from sqlalchemy import create_engine
+
+            from alembic.config import Config
+            from alembic.runtime.migration import MigrationContext
+            from alembic.script import ScriptDirectory
+
             # Alembic needs a sync URL with an expanded path
             sync_url = f"sqlite:///{db_path}"
-            env = os.environ.copy()
-            env["PULSE_DB_URL"] = sync_url
-
-            result = subprocess.run(
-                ["uv", "run", "alembic", "current"],
-                capture_output=True,
-                text=True,
-                cwd=Path(__file__).parent.parent.parent,
-                env=env,
-                timeout=30,
-            )
-            output = result.stdout + result.stderr
-            if EXPECTED_MIGRATION in output and "(head)" in output:
-                self.check(True, f"Migrations current ({EXPECTED_MIGRATION})")
-            elif EXPECTED_MIGRATION in output:
-                self.check(False, f"Migration found but not at head: {output.strip()}")
+            cfg = Config(str(_project_root / "alembic.ini"))
+            cfg.set_main_option("sqlalchemy.url", sync_url)
+            head = ScriptDirectory.from_config(cfg).get_current_head()
+
+            engine = create_engine(sync_url)
+            try:
+                with engine.connect() as connection:
+                    current = MigrationContext.configure(connection).get_current_revision()
+            finally:
+                engine.dispose()
+
+            if current == head:
+                self.check(True, f"Migrations current ({current})")
+            elif current is None:
+                self.check(False, f"No migrations applied (head is {head})")
             else:
-                self.check(False, f"Unexpected migration state: {output.strip()}")
+                self.check(False, f"Migration {current} not at head ({head})")
         except Exception as e:
             self.check(False, f"Cannot check migrations: {e}")
 
     def check_mcp_config(self) -> None:
         """Check MCP server configuration."""
+        import json
+
         self.section("MCP Configuration")
 
         config_path = Path.home() / ".config" / "claude-code" / "mcp_config.json"
 
-        if not self.check(config_path.exists(), f"Config file: {config_path}"):
+        entry = self._scan_dir(config_path.parent).get(config_path.name)
+        if entry is None:
+            self.check(False, f"Config file: {config_path}")
             return
 
         try:
-            with open(config_path) as f:
-                config = json.load(f)
+            config = self._load_json(config_path, entry.stat())
         except json.JSONDecodeError as e:
-            self.check(False, f"Invalid JSON in config: {e}")
+            self.check(False, f"Invalid JSON in config {config_path}: {e}")
             return
         except Exception as e:
-            self.check(False, f"Cannot read config: {e}")
+            self.check(False, f"Cannot read config {config_path}: {e}")
             return
+        self.check(True, f"Config file: {config_path}")
 
         servers = config.get("mcpServers", {})
 
@@ -219,7 +274,7 @@ class Doctor:
             # Validate command exists
             pulse_config = servers["pulse-queue"]
             cmd = pulse_config.get("command", "")
-            if cmd and shutil.which(cmd):
+            if cmd and _which(cmd):
                 pass  # Command exists, good
             elif cmd:
                 self.check(False, f"pulse-queue command not found: {cmd}", required=False)
@@ -228,13 +283,15 @@ class Doctor:
         if self.check("telegram-notifier" in servers, "telegram-notifier server configured"):
             telegram_config = servers["telegram-notifier"]
             cmd = telegram_config.get("command", "")
-            if cmd and shutil.which(cmd):
+            if cmd and _which(cmd):
                 pass  # Command exists, good
             elif cmd:
                 self.check(False, f"telegram-notifier command not found: {cmd}", required=False)
 
     def check_desk_permissions(self, desk_path: Optional[str]) -> None:
         """Check Desk Claude Code permissions."""
+        import json
+
         self.section("Desk Permissions")
 
         if not desk_path:
@@ -243,41 +300,43 @@ class Doctor:
 
         settings_path = Path(desk_path) / ".claude" / "settings.json"
 
-        if not self.check(settings_path.exists(), f"Settings file: {settings_path}"):
+        entry = self._scan_dir(settings_path.parent).get(settings_path.name)
+        if entry is None:
+            self.check(False, f"Settings file: {settings_path}")
             return
 
         try:
-            with open(settings_path) as f:
-                settings = json.load(f)
+            settings = self._load_json(settings_path, entry.stat())
         except json.JSONDecodeError as e:
-            self.check(False, f"Invalid JSON in settings: {e}")
+            self.check(False, f"Invalid JSON in settings {settings_path}: {e}")
             return
         except Exception as e:
-            self.check(False, f"Cannot read settings: {e}")
+            self.check(False, f"Cannot read settings {settings_path}: {e}")
             return
+        self.check(True, f"Settings file: {settings_path}")
 
         # Get allowed permissions
         permissions = settings.get("permissions", {})
-        allowed = permissions.get("allow", [])
+        missing = REQUIRED_PERMISSIONS.difference(permissions.get("allow", []))
 
         # Check each required permission
-        for perm in REQUIRED_PERMISSIONS:
-            self.check(perm in allowed, f"{perm} allowed")
+        for perm in _ORDERED_PERMISSIONS:
+            self.check(perm not in missing, f"{perm} allowed")
 
     def check_commands(self) -> None:
         """Check required commands are available."""
         self.section("Commands")
 
         # Check hapi command
-        hapi_cmd = os.getenv("HAPI_COMMAND", "hapi")
-        hapi_path = shutil.which(hapi_cmd)
+        hapi_cmd = self._env.get("HAPI_COMMAND", "hapi")
+        hapi_path = _which(hapi_cmd)
         if hapi_path:
             self.check(True, f"hapi command available ({hapi_path})")
         else:
             self.check(False, f"hapi command not found: {hapi_cmd}")
 
         # Check uv command
-        uv_path = shutil.which("uv")
+        uv_path = _which("uv")
         if uv_path:
             self.check(True, f"uv command available ({uv_path})")
         else:
@@ -287,38 +346,39 @@ class Doctor:
         """Check if API service is running."""
         self.section("Services")
 
-        api_port = int(os.getenv("PULSE_API_PORT", "8765"))
-        api_url = f"http://127.0.0.1:{api_port}/api/health"
+        api_port = int(self._env.get("PULSE_API_PORT", "8765"))
 
+        # A TCP connect is enough for a liveness probe and bounds the wait when
+        # the port is firewalled (a full HTTP GET could block for seconds)
         try:
-            import urllib.request
-
-            req = urllib.request.Request(api_url, method="GET")
-            with urllib.request.urlopen(req, timeout=5) as response:
-                if response.status == 200:
-                    self.check(True, f"API responding at http://127.0.0.1:{api_port}")
-                else:
-                    self.check(
-                        False,
-                        f"API returned status {response.status}",
-                        required=False,
-                    )
-        except urllib.error.URLError:
+            with socket.create_connection(("127.0.0.1", api_port), timeout=0.5):
+                self.check(True, f"API listening at http://127.0.0.1:{api_port}")
+        except OSError:
             self.check(False, f"API not running at http://127.0.0.1:{api_port}", required=False)
-        except Exception as e:
-            self.check(False, f"Cannot connect to API: {e}", required=False)
 
     def run(self) -> int:
         """Run all health checks and return exit code."""
         print("=== Reeve Doctor ===")
 
-        # Run all checks
+        # Environment first: the remaining sections depend on its results
         api_token, desk_path, db_url = self.check_environment()
-        self.check_database(db_url)
-        self.check_mcp_config()
-        self.check_desk_permissions(desk_path)
-        self.check_commands()
-        self.check_services()
+        self.report("Environment")
+
+        # The remaining sections touch independent resources (SQLite, config files,
+        # PATH, the API port), so run them concurrently and print in a fixed order
+        sections: List[Tuple[Callable[..., Any], Tuple[Any, ...]]] = [
+            (self.check_database, (db_url,)),
+            (self.check_mcp_config, ()),
+            (self.check_desk_permissions, (desk_path,)),
+            (self.check_commands, ()),
+            (self.check_services, ()),
+        ]
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            futures = [executor.submit(self._run_section, check, *args) for check, args in sections]
+            titles = [future.result() for future in futures]
+
+        for title in titles:
+            self.report(title)
 
         # Summary
         print()
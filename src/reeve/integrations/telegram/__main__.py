@@ -6,11 +6,11 @@ Usage:
     LOG_LEVEL=DEBUG python -m reeve.integrations.telegram
 """
 
-import asyncio
 import logging
 import sys
 
 from reeve.integrations.telegram.listener import TelegramListener
+from reeve.utils import event_loop
 from reeve.utils.config import get_config
 from reeve.utils.logging import setup_logging
 
@@ -51,6 +51,7 @@ async def async_main() -> None:
     logger.info(f"API URL: {config.pulse_api_url}")
     logger.info(f"Chat ID: {config.telegram_chat_id}")
     logger.info(f"Log file: {log_file}")
+    logger.info(f"Event loop: {event_loop.loop_implementation()}")
     logger.info("=" * 60)
 
     # Create and start listener
@@ -68,7 +69,7 @@ async def async_main() -> None:
 def main() -> None:
     """Sync entry point."""
     try:
-        asyncio.run(async_main())
+        event_loop.run(async_main())
     except KeyboardInterrupt:
         pass  # Graceful exit (SIGINT handled by listener)
 
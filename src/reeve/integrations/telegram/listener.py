@@ -25,17 +25,25 @@ Usage:
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
 import signal
 from pathlib import Path
-from typing import Any, Callable, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 import aiohttp
 
 from reeve.utils.config import ReeveConfig
 
+# Compact JSON for pulse API request bodies (no whitespace after separators)
+_compact_json_dumps = functools.partial(json.dumps, separators=(",", ":"))
+
+# Read-only stand-in for updates without a "from" field
+_EMPTY_SENDER: Mapping[str, Any] = MappingProxyType({})
+
 
 class TelegramListener:
     """
@@ -78,20 +86,53 @@ class TelegramListener:
             raise ValueError(
                 "PULSE_API_TOKEN environment variable is required for API authentication"
             )
+        try:
+            # Telegram reports chat IDs as integers; compare against them directly
+            self._chat_id_int = int(self.chat_id)
+        except ValueError:
+            raise ValueError(f"TELEGRAM_CHAT_ID must be an integer chat ID, got {self.chat_id!r}")
+
+        # Request targets built once (reused by every poll and pulse trigger)
+        self._updates_url = f"https://api.telegram.org/bot{self.bot_token}/getUpdates"
+        self._updates_params: dict[str, Any] = {
+            "timeout": 100,  # Long polling: wait up to 100s for new messages
+        }
+        self._schedule_pulse_url = f"{self.api_url}/api/pulse/schedule"
+        self._pulse_headers = {
+            "Authorization": f"Bearer {self.api_token}",
+            "Content-Type": "application/json",
+        }
+        # Fields shared by every pulse triggered from Telegram (only the prompt varies);
+        # never mutated, so the tags list can be shared across requests
+        self._pulse_payload_template: dict[str, Any] = {
+            "scheduled_at": "now",
+            "priority": "critical",  # User messages are always critical priority
+            "source": "telegram",
+            "tags": ["telegram", "user_message"],
+        }
 
-        # HTTP sessions (initialized in start())
-        self.telegram_session: Optional[aiohttp.ClientSession] = None
-        self.api_session: Optional[aiohttp.ClientSession] = None
+        # HTTP sessions (created in start(), before anything uses them)
+        self.telegram_session: aiohttp.ClientSession
+        self.api_session: aiohttp.ClientSession
 
         # State
         self.running = False
         self.shutdown_event = asyncio.Event()
         self.last_update_id: Optional[int] = None
+        self._prefetched_updates: Optional[dict[str, Any]] = None
         self.offset_file = Path(config.reeve_home) / "telegram_offset.txt"
+        # Offset writes are batched: Telegram already forgets confirmed updates once
+        # the next getUpdates carries the new offset, so the file only needs to be
+        # roughly current (it is always flushed on shutdown)
+        self._dirty_offset_count = 0
+        self._offset_batch_size = 16
+        self._persisted_offset: Optional[int] = None  # Value currently on disk
 
         # Error handling
         self.error_count = 0
         self.max_consecutive_errors = 10
+        # Consecutive per-message failures; error_count only tracks getUpdates polls
+        self.message_error_count = 0
 
         # Logging
         self.logger = logging.getLogger("reeve.telegram")
@@ -103,7 +144,7 @@ class TelegramListener:
         This is the main entry point. It:
         1. Initializes HTTP sessions
         2. Loads offset from disk
-        3. Verifies bot token by calling Telegram getMe
+        3. Verifies bot token with a non-blocking getUpdates (first batch is kept)
         4. Registers signal handlers for graceful shutdown
         5. Starts polling loop
         6. Blocks until shutdown signal
@@ -114,15 +155,26 @@ class TelegramListener:
         self.logger.info("Starting Telegram listener...")
         self.running = True
 
-        try:
-            # Initialize HTTP sessions
-            self.telegram_session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=120)  # 120s for long polling
-            )
-            self.api_session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30)  # 30s for API calls
-            )
+        # Initialize HTTP sessions (neither API uses cookies, so skip the cookie jar)
+        # Each session talks to a single host: cache its DNS answer and keep idle
+        # connections around longer than the 15s default so they survive between messages
+        self.telegram_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=120),  # 120s for long polling
+            cookie_jar=aiohttp.DummyCookieJar(),
+            connector=aiohttp.TCPConnector(
+                limit=8, limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=75
+            ),
+        )
+        self.api_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),  # 30s for API calls
+            cookie_jar=aiohttp.DummyCookieJar(),
+            connector=aiohttp.TCPConnector(
+                limit=8, limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=75
+            ),
+            json_serialize=_compact_json_dumps,
+        )
 
+        try:
             # Load offset from disk
             self.last_update_id = self._load_offset()
             if self.last_update_id:
@@ -140,39 +192,40 @@ class TelegramListener:
             await self._polling_loop()
 
         finally:
-            # Cleanup
-            if self.telegram_session:
-                await self.telegram_session.close()
-            if self.api_session:
-                await self.api_session.close()
+            # Cleanup: persist the final offset exactly once, then close sessions
+            self._flush_offset()
+            await self.telegram_session.close()
+            await self.api_session.close()
 
             self.logger.info("Telegram listener stopped")
 
     async def _verify_bot_token(self) -> None:
         """
-        Verify bot token by calling Telegram getMe endpoint.
+        Verify bot token with a non-blocking getUpdates call (timeout=0).
+
+        This validates the token as well as getMe would, but also fetches any
+        pending updates, which are handed to the first polling loop iteration -
+        saving a separate round trip to Telegram at startup.
 
         Raises:
-            RuntimeError: If bot token is invalid or API is unreachable
+            RuntimeError: If bot token is invalid
         """
-        url = f"https://api.telegram.org/bot{self.bot_token}/getMe"
-
+        self._updates_params["timeout"] = 0
         try:
-            assert self.telegram_session is not None
-            async with self.telegram_session.get(url) as response:
-                data = await response.json()
+            data = await self._get_updates()  # Raises RuntimeError on 401/404
+        finally:
+            self._updates_params["timeout"] = 100
 
-                if not data.get("ok"):
-                    error_msg = data.get("description", "Unknown error")
-                    raise RuntimeError(f"Bot token verification failed: {error_msg}")
+        if data is None:
+            # Network trouble - the polling loop will retry with backoff
+            return
 
-                bot_info = data["result"]
-                self.logger.info(
-                    f"Bot verified: @{bot_info.get('username')} ({bot_info.get('first_name')})"
-                )
+        if not data.get("ok"):
+            error_msg = data.get("description", "Unknown error")
+            raise RuntimeError(f"Bot token verification failed: {error_msg}")
 
-        except aiohttp.ClientError as e:
-            raise RuntimeError(f"Failed to connect to Telegram API: {e}")
+        self.logger.info("Bot token verified")
+        self._prefetched_updates = data
 
     async def _polling_loop(self) -> None:
         """
@@ -180,9 +233,9 @@ class TelegramListener:
 
         The loop:
         1. Calls getUpdates with long polling (100s timeout)
-        2. Processes each update via _process_update()
-        3. Saves offset after successful batch
-        4. Sleeps 1 second between batches
+        2. Processes the batch's updates concurrently via _process_update()
+        3. Saves offset once every 16 processed updates (and on shutdown)
+        4. Immediately re-polls (long polling paces the loop); pauses 1s after a failed poll
         5. Handles errors with exponential backoff
 
         This loop runs until self.running is set to False (via signal handler).
@@ -191,37 +244,57 @@ class TelegramListener:
 
         while self.running:
             try:
-                # Fetch updates with long polling
-                updates_data = await self._get_updates()
+                # Fetch updates with long polling (the first batch may already be
+                # prefetched by _verify_bot_token)
+                updates_data = self._prefetched_updates
+                if updates_data is not None:
+                    self._prefetched_updates = None
+                else:
+                    updates_data = await self._get_updates()
 
                 if updates_data and updates_data.get("ok"):
                     updates = updates_data.get("result", [])
 
-                    # Process each update
-                    for update in updates:
+                    # Process the batch concurrently so pulse triggers overlap
+                    results = await asyncio.gather(
+                        *(self._process_update(update) for update in updates),
+                        return_exceptions=True,
+                    )
+                    for update, result in zip(updates, results):
                         try:
-                            await self._process_update(update)
+                            if isinstance(result, BaseException):
+                                raise result
 
                             # Update offset (always move to next update)
                             self.last_update_id = update["update_id"] + 1
 
                         except Exception as e:
+                            self.message_error_count += 1
                             self.logger.error(
                                 f"Error processing update {update.get('update_id')}: {e}",
-                                exc_info=True,
+                                exc_info=self._should_log_traceback(),
                             )
                             # Continue to next update even if one fails
 
-                    # Save offset after successful batch
-                    if updates and self.last_update_id is not None:
-                        self._save_offset(self.last_update_id)
+                    # Persist offset once enough updates have accumulated
+                    if updates:
+                        self._dirty_offset_count += len(updates)
+                        if self._dirty_offset_count >= self._offset_batch_size:
+                            self._flush_offset()
                         self.logger.debug(f"Processed {len(updates)} updates")
 
                     # Reset error count on success
                     self.error_count = 0
 
-                # Sleep 1 second between polling cycles
-                await asyncio.sleep(1)
+                    if not updates:
+                        # Cooperative yield in case Telegram answers empty polls
+                        # immediately instead of holding the request
+                        await asyncio.sleep(0)
+                else:
+                    # Failed poll (network error, 5xx) - pause briefly rather than
+                    # retrying in a tight loop; successful polls go straight back
+                    # to long polling, which already paces the loop
+                    await asyncio.sleep(1)
 
             except asyncio.CancelledError:
                 # Shutdown requested
@@ -261,18 +334,14 @@ class TelegramListener:
                 ]
             }
         """
-        url = f"https://api.telegram.org/bot{self.bot_token}/getUpdates"
-        params = {
-            "timeout": 100,  # Long polling: wait up to 100s for new messages
-        }
-
         # Include offset if we have one (to acknowledge processed messages)
         if self.last_update_id is not None:
-            params["offset"] = self.last_update_id
+            self._updates_params["offset"] = self.last_update_id
 
         try:
-            assert self.telegram_session is not None
-            async with self.telegram_session.get(url, params=params) as response:
+            async with self.telegram_session.get(
+                self._updates_url, params=self._updates_params
+            ) as response:
                 # Handle HTTP errors
                 if response.status == 401:
                     raise RuntimeError("Invalid bot token (401 Unauthorized)")
@@ -328,8 +397,11 @@ class TelegramListener:
             return
 
         # Filter by chat ID (only process authorized user's messages)
-        chat_id = str(message.get("chat", {}).get("id"))
-        if chat_id != self.chat_id:
+        try:
+            chat_id = message["chat"]["id"]
+        except (KeyError, TypeError):
+            chat_id = None
+        if chat_id != self._chat_id_int:
             self.logger.warning(
                 f"Ignoring message from unauthorized chat: {chat_id} (expected: {self.chat_id})"
             )
@@ -342,8 +414,9 @@ class TelegramListener:
             return
 
         # Extract user info
-        user_first_name = message.get("from", {}).get("first_name", "User")
-        user_username = message.get("from", {}).get("username")
+        sender = message.get("from") or _EMPTY_SENDER
+        user_first_name = sender.get("first_name", "User")
+        user_username = sender.get("username")
         user_display = f"{user_first_name}"
         if user_username:
             user_display += f" (@{user_username})"
@@ -357,6 +430,7 @@ class TelegramListener:
         pulse_id = await self._trigger_pulse(prompt, user_display)
 
         if pulse_id:
+            self.message_error_count = 0
             self.logger.info(f"Triggered pulse {pulse_id} for message from {user_display}")
         else:
             self.logger.error(f"Failed to trigger pulse for message from {user_display}")
@@ -393,22 +467,12 @@ class TelegramListener:
                 "message": "Pulse scheduled successfully"
             }
         """
-        url = f"{self.api_url}/api/pulse/schedule"
-        headers = {
-            "Authorization": f"Bearer {self.api_token}",
-            "Content-Type": "application/json",
-        }
-        payload = {
-            "prompt": prompt,
-            "scheduled_at": "now",
-            "priority": "critical",  # User messages are always critical priority
-            "source": "telegram",
-            "tags": ["telegram", "user_message"],
-        }
+        payload = {"prompt": prompt, **self._pulse_payload_template}
 
         try:
-            assert self.api_session is not None
-            async with self.api_session.post(url, headers=headers, json=payload) as response:
+            async with self.api_session.post(
+                self._schedule_pulse_url, headers=self._pulse_headers, json=payload
+            ) as response:
                 # Handle authentication errors
                 if response.status == 401:
                     self.logger.error("API authentication failed (invalid token)")
@@ -430,7 +494,10 @@ class TelegramListener:
             return None
 
         except Exception as e:
-            self.logger.error(f"Unexpected error triggering pulse: {e}", exc_info=True)
+            self.message_error_count += 1
+            self.logger.error(
+                f"Unexpected error triggering pulse: {e}", exc_info=self._should_log_traceback()
+            )
             return None
 
     def _load_offset(self) -> Optional[int]:
@@ -455,6 +522,7 @@ class TelegramListener:
                 return None
 
             offset = int(content)
+            self._persisted_offset = offset
             return offset
 
         except (ValueError, IOError) as e:
@@ -465,8 +533,9 @@ class TelegramListener:
         """
         Save current offset to disk (atomic write).
 
-        Uses atomic write pattern (write to temp file + rename) to prevent
-        corruption if the process is killed mid-write.
+        Uses atomic write pattern (write + fsync temp file, then rename) to prevent
+        corruption if the process is killed mid-write or the machine loses power.
+        Skips the write if the offset on disk is already up to date.
 
         Args:
             offset: Update ID to save (typically last_update_id)
@@ -474,17 +543,42 @@ class TelegramListener:
         File Format:
             Plain text file containing a single integer: "123456\\n"
         """
+        if offset == self._persisted_offset:
+            return  # Already on disk
+
         try:
-            # Atomic write: write to temp file, then rename
+            # Atomic write: write and fsync temp file, then rename over the original
             temp_file = self.offset_file.with_suffix(".tmp")
-            temp_file.write_text(f"{offset}\n")
-            temp_file.replace(self.offset_file)
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, b"%d\n" % offset)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(temp_file, self.offset_file)
+            self._persisted_offset = offset
 
             self.logger.debug(f"Saved offset: {offset}")
 
         except IOError as e:
             self.logger.error(f"Failed to save offset to {self.offset_file}: {e}")
 
+    def _should_log_traceback(self) -> bool:
+        """
+        Decide whether a per-message error log should include a traceback.
+
+        Formatting tracebacks is comparatively expensive, so the hot paths only
+        include them at DEBUG level or for the first few errors since a message
+        last triggered a pulse successfully.
+        """
+        return self.logger.isEnabledFor(logging.DEBUG) or self.message_error_count <= 3
+
+    def _flush_offset(self) -> None:
+        """Persist the current offset if updates were processed since the last save."""
+        if self._dirty_offset_count and self.last_update_id is not None:
+            self._save_offset(self.last_update_id)
+        self._dirty_offset_count = 0
+
     async def _handle_error(self, error: Exception, context: str) -> None:
         """
         Handle errors with exponential backoff and fatal error detection.
@@ -494,7 +588,7 @@ class TelegramListener:
         2. Checks for fatal errors (auth failure, max retries)
         3. Calculates exponential backoff (up to 5 minutes)
         4. Logs error with full traceback
-        5. Sleeps for backoff duration
+        5. Waits for backoff duration (returns early on shutdown)
 
         Args:
             error: The exception that occurred
@@ -542,8 +636,11 @@ class TelegramListener:
         )
         self.logger.info(f"Backing off for {backoff_seconds}s before retry...")
 
-        # Sleep for backoff duration
-        await asyncio.sleep(backoff_seconds)
+        # Wait out the backoff, waking early if shutdown is requested meanwhile
+        try:
+            await asyncio.wait_for(self.shutdown_event.wait(), timeout=backoff_seconds)
+        except asyncio.TimeoutError:
+            pass
 
     def _register_signal_handlers(self) -> None:
         """
@@ -559,27 +656,20 @@ class TelegramListener:
         """
         loop = asyncio.get_event_loop()
 
-        def create_handler(s: signal.Signals) -> "Callable[[], None]":
-            def handler() -> None:
-                asyncio.create_task(self._handle_shutdown(s))
-
-            return handler
-
         for sig in (signal.SIGTERM, signal.SIGINT):
-            loop.add_signal_handler(sig, create_handler(sig))
+            loop.add_signal_handler(sig, self._handle_shutdown, sig)
 
         self.logger.info("Signal handlers registered (SIGTERM, SIGINT)")
 
-    async def _handle_shutdown(self, sig: signal.Signals) -> None:
+    def _handle_shutdown(self, sig: signal.Signals) -> None:
         """
-        Handle graceful shutdown.
+        Handle graceful shutdown (called synchronously from the signal handler).
 
         Shutdown process:
         1. Log shutdown signal
         2. Stop polling loop (self.running = False)
-        3. Save current offset to disk
-        4. Close HTTP sessions (handled in start() finally block)
-        5. Signal shutdown complete
+        3. Signal shutdown requested
+        4. Save final offset and close HTTP sessions (handled once in start() finally block)
 
         Args:
             sig: The signal that triggered shutdown (SIGTERM or SIGINT)
@@ -589,12 +679,5 @@ class TelegramListener:
         # Stop polling loop
         self.running = False
 
-        # Save offset to disk
-        if self.last_update_id is not None:
-            self._save_offset(self.last_update_id)
-            self.logger.info(f"Saved final offset: {self.last_update_id}")
-
-        # Signal shutdown complete
+        # Signal shutdown requested
         self.shutdown_event.set()
-
-        self.logger.info("Shutdown complete")
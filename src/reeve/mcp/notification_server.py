@@ -8,6 +8,8 @@ Environment Variables:
     TELEGRAM_BOT_TOKEN: Telegram bot token (required)
     TELEGRAM_CHAT_ID: User's Telegram chat ID (required)
     HAPI_BASE_URL: Base URL for Hapi sessions (optional, defaults to https://hapi.run)
+    TELEGRAM_DEDUP_SECONDS: Window in which identical messages are suppressed
+        (optional, defaults to 60; 0 disables de-duplication)
 
 Usage:
     Configure in ~/.config/claude-code/mcp_config.json:
@@ -26,24 +28,114 @@ Usage:
     }
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import os
-from typing import Annotated, Literal, Optional
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import Annotated, Any, AsyncIterator, Dict, List, Literal, Optional, Set
 
 import httpx
 from mcp.server.fastmcp import Context, FastMCP
-from pydantic import Field
-
-# Initialize the MCP server
-mcp = FastMCP("telegram-notifier")
+from pydantic import BaseModel, Field
 
 # Telegram Bot Configuration
 BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")  # The user's chat ID
 HAPI_BASE_URL = os.getenv("HAPI_BASE_URL", "https://hapi.run")
+DEDUP_SECONDS = float(os.getenv("TELEGRAM_DEDUP_SECONDS", "60"))
 
 if not BOT_TOKEN or not CHAT_ID:
     raise ValueError("TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID environment variables are required")
 
+# sendMessage path, relative to the client's base URL (computed once)
+_SEND_MESSAGE_PATH = f"/bot{BOT_TOKEN}/sendMessage"
+
+# Fire-and-forget sends still in flight (strong references so they aren't
+# garbage-collected before completing; drained by the lifespan on shutdown)
+_background_sends: Set["asyncio.Task[str]"] = set()
+
+# Shared Telegram client so notifications reuse a keep-alive connection instead
+# of paying a TCP + TLS handshake per message; HTTP/2 lets concurrent sends
+# share that one connection
+_client = httpx.AsyncClient(
+    base_url="https://api.telegram.org",
+    http2=True,
+    timeout=10,
+    limits=httpx.Limits(max_keepalive_connections=10, max_connections=10),
+)
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Finish queued notifications and close the shared client on shutdown."""
+    try:
+        yield
+    finally:
+        if _background_sends:
+            await asyncio.gather(*_background_sends, return_exceptions=True)
+        await _client.aclose()
+
+
+# Initialize the MCP server
+mcp = FastMCP("telegram-notifier", lifespan=_lifespan)
+
+# Request bodies are encoded once per message as compact UTF-8 JSON (emoji stay
+# as raw UTF-8 rather than 12-byte \uXXXX\uXXXX escapes)
+_encode_json = functools.partial(
+    json.dumps, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Retry policy for transient Telegram API failures
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRY_DELAY = 30.0
+
+
+class _RateLimiter:
+    """
+    Token-bucket limiter allowing `rate` acquisitions per `period` seconds.
+
+    The bucket starts full, so short bursts go out immediately; once drained,
+    callers wait (in FIFO order) for the next token to refill.
+    """
+
+    def __init__(self, rate: int, period: float = 1.0) -> None:
+        self._capacity = float(rate)
+        self._tokens = float(rate)
+        self._refill_per_second = rate / period
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated_at) * self._refill_per_second
+            )
+            self._updated_at = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._refill_per_second)
+                self._tokens = 1.0
+                self._updated_at = time.monotonic()
+            self._tokens -= 1
+
+
+# Digest of (message, parse_mode) -> monotonic time it was last sent, so bursts
+# of identical alerts cost one Telegram round-trip instead of one each
+_recent_sends: Dict[bytes, float] = {}
+_RECENT_SENDS_PRUNE_AT = 1024
+
+
+# Stay under Telegram's limits (~30 messages/sec per bot, ~1 message/sec per
+# chat) so bursts are shaped locally instead of being answered with 429s
+_global_limiter = _RateLimiter(30, 1.0)
+_chat_limiter = _RateLimiter(1, 1.0)
+
 
 # ============================================================================
 # Tool Definitions
@@ -96,6 +188,16 @@ async def send_notification(
             ),
         ),
     ] = None,
+    fire_and_forget: Annotated[
+        bool,
+        Field(
+            description=(
+                "If true, queue the notification and return immediately instead of waiting "
+                "for Telegram to confirm delivery (default: False). Use for status updates "
+                "where the delivery result doesn't matter."
+            ),
+        ),
+    ] = False,
 ) -> str:
     """
     Send a push notification to the user via Telegram.
@@ -114,6 +216,9 @@ async def send_notification(
     - normal: Standard notification with sound (default)
     - critical: High-priority alert with sound
 
+    Re-sending the exact same message (and parse_mode) within 60 seconds is
+    suppressed, so repeated alerts don't spam the user.
+
     When to use:
     - Proactive alerts: "Something happened you should know about"
     - Task updates: "I finished X, here's the result"
@@ -143,26 +248,129 @@ async def send_notification(
             priority="silent"
         )
 
+        # Status update that doesn't need a delivery confirmation
+        send_notification(
+            message="⏳ Still processing inbox (120 of 300 emails)",
+            priority="silent",
+            fire_and_forget=True
+        )
+
+    Returns:
+        Confirmation message or error details
+    """
+    session_link_url = _session_link_url(ctx)
+    if fire_and_forget:
+        task = asyncio.create_task(_deliver(message, priority, parse_mode, session_link_url))
+        _background_sends.add(task)
+        task.add_done_callback(_background_sends.discard)
+        return f"✓ Notification queued ({priority})"
+
+    return await _deliver(message, priority, parse_mode, session_link_url)
+
+
+class NotificationSpec(BaseModel):
+    """One notification in a send_notifications_batch call."""
+
+    message: str = Field(
+        description="The notification message to send (up to 4096 characters)",
+        min_length=1,
+        max_length=4096,
+    )
+    priority: Literal["silent", "normal", "critical"] = Field(
+        default="normal",
+        description="Notification priority level: 'silent', 'normal' (default), or 'critical'",
+    )
+    parse_mode: Literal["MarkdownV2", "HTML", "Markdown"] | None = Field(
+        default=None,
+        description="Optional message formatting mode: 'MarkdownV2', 'HTML', or 'Markdown'",
+    )
+
+
+@mcp.tool()
+async def send_notifications_batch(
+    ctx: Context,
+    notifications: Annotated[
+        List[NotificationSpec],
+        Field(
+            description=(
+                "The notifications to send, in order. Each item takes the same "
+                "message/priority/parse_mode fields as send_notification."
+            ),
+            min_length=1,
+            max_length=20,
+        ),
+    ],
+) -> str:
+    """
+    Send several push notifications to the user via Telegram in one call.
+
+    Use this instead of calling send_notification repeatedly when there are
+    multiple independent alerts to deliver (e.g., a batch of flight updates).
+    The messages are sent concurrently over one connection and still respect
+    Telegram's rate limits, duplicate suppression, and retry behavior. Each
+    message gets the same "View in Claude Code" session button as
+    send_notification.
+
+    Examples:
+        send_notifications_batch(
+            notifications=[
+                {"message": "🚨 Flight UA123 delayed 2 hours", "priority": "critical"},
+                {"message": "📋 Archived 47 old notes", "priority": "silent"},
+            ]
+        )
+
+    Returns:
+        One numbered confirmation or error line per notification
+    """
+    session_link_url = _session_link_url(ctx)
+    results = await asyncio.gather(
+        *(
+            _deliver(spec.message, spec.priority, spec.parse_mode, session_link_url)
+            for spec in notifications
+        )
+    )
+    return "\n".join(f"{i}. {result}" for i, result in enumerate(results, 1))
+
+
+# ============================================================================
+# Helper Functions
+# ============================================================================
+
+
+def _session_link_url(ctx: Context) -> Optional[str]:
+    """Build the Hapi URL for the calling session, if its ID is available."""
+    try:
+        session_id = getattr(ctx, "session_id", None)
+        if session_id:
+            return f"{HAPI_BASE_URL}/sessions/{session_id}"
+    except (RuntimeError, AttributeError):
+        # Session ID not available - no link button
+        pass
+    return None
+
+
+async def _deliver(
+    message: str,
+    priority: str,
+    parse_mode: Optional[str],
+    session_link_url: Optional[str],
+) -> str:
+    """
+    Send one notification, applying de-duplication, rate limits, and retries.
+
     Returns:
         Confirmation message or error details
     """
+    dedup_key = _dedup_key(message, parse_mode)
+    if _is_recent_duplicate(dedup_key):
+        return f"✓ Notification suppressed (duplicate within {DEDUP_SECONDS:g}s)"
+
     try:
         # Determine notification sound based on priority
         disable_notification = priority == "silent"
 
-        # Auto-generate Hapi URL from session ID
-        session_link_url = None
-        try:
-            session_id = getattr(ctx, "session_id", None)
-            if session_id:
-                session_link_url = f"{HAPI_BASE_URL}/sessions/{session_id}"
-        except (RuntimeError, AttributeError):
-            # Session ID not available - no link button
-            pass
-
         # Send via Telegram Bot API
-        url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
-        payload = {
+        payload: Dict[str, Any] = {
             "chat_id": CHAT_ID,
             "text": message,
             "disable_notification": disable_notification,
@@ -173,14 +381,14 @@ async def send_notification(
 
         # Add session link button if available
         if session_link_url:
-            reply_markup = {
-                "inline_keyboard": [[{"text": "View in Claude Code", "url": session_link_url}]]
-            }
-            payload["reply_markup"] = reply_markup  # type: ignore[assignment]
+            payload["reply_markup"] = _session_link_markup(session_link_url)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload, timeout=10)
-            response.raise_for_status()
+        # Acquire once per message (outside the retry loop) so retries of the
+        # same message don't consume extra tokens
+        await _global_limiter.acquire()
+        await _chat_limiter.acquire()
+        await _post_with_retry(_SEND_MESSAGE_PATH, payload)
+        _record_send(dedup_key)
 
         link_info = " with link" if session_link_url else ""
         return f"✓ Notification{link_info} sent successfully ({priority})"
@@ -189,6 +397,85 @@ async def send_notification(
         return f"✗ Failed to send notification: {str(e)}"
 
 
+@functools.lru_cache(maxsize=64)
+def _session_link_markup(session_link_url: str) -> Dict[str, Any]:
+    """
+    Build the "View in Claude Code" inline keyboard for a session link.
+
+    Cached per URL since a session usually sends several notifications; the
+    returned dict is shared between payloads and must not be mutated.
+    """
+    return {"inline_keyboard": [[{"text": "View in Claude Code", "url": session_link_url}]]}
+
+
+async def _post_with_retry(
+    url: str,
+    payload: dict,
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    jitter: float = 0.5,
+) -> httpx.Response:
+    """
+    POST to the Telegram Bot API, retrying transient failures.
+
+    Connection errors, timeouts, 5xx and 429 responses are retried with
+    exponential backoff plus jitter (capped at 30s); a 429's Retry-After
+    header overrides the computed delay. Other error statuses raise at once.
+
+    Raises:
+        httpx.HTTPError: If the request fails permanently or retries run out
+    """
+    # Encode once so retries resend the same bytes
+    body = _encode_json(payload).encode()
+    attempt = 0
+    while True:
+        delay: Optional[float] = None
+        try:
+            response = await _client.post(url, content=body, headers=_JSON_HEADERS)
+        except httpx.TransportError:
+            if attempt >= max_retries:
+                raise
+        else:
+            if response.status_code not in _RETRYABLE_STATUSES or attempt >= max_retries:
+                response.raise_for_status()
+                return response
+            if response.status_code == 429:
+                delay = _retry_after_seconds(response)
+
+        if delay is None:
+            delay = base_delay * 2**attempt * (1 + random.uniform(0, jitter))
+        await asyncio.sleep(min(delay, _MAX_RETRY_DELAY))
+        attempt += 1
+
+
+def _dedup_key(message: str, parse_mode: Optional[str]) -> bytes:
+    """Digest identifying a notification's content for de-duplication."""
+    return hashlib.blake2b(f"{parse_mode or ''}\0{message}".encode(), digest_size=16).digest()
+
+
+def _is_recent_duplicate(key: bytes) -> bool:
+    """Check whether the same content was sent within the de-duplication window."""
+    sent_at = _recent_sends.get(key)
+    return sent_at is not None and time.monotonic() - sent_at < DEDUP_SECONDS
+
+
+def _record_send(key: bytes) -> None:
+    """Remember a successful send, evicting expired entries once the cache grows."""
+    now = time.monotonic()
+    _recent_sends[key] = now
+    if len(_recent_sends) > _RECENT_SENDS_PRUNE_AT:
+        for stale in [k for k, sent_at in _recent_sends.items() if now - sent_at >= DEDUP_SECONDS]:
+            del _recent_sends[stale]
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Read a Retry-After header (in seconds), if present and valid."""
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
 # ============================================================================
 # Server Entry Point
 # ============================================================================
@@ -20,21 +20,34 @@ Usage:
 import os
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Annotated, Literal, Optional
 
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
 
 from reeve.pulse.enums import PulsePriority, PulseStatus
+from reeve.pulse.models import StringList
 from reeve.pulse.queue import PulseQueue
+from reeve.utils.text import preview
 from reeve.utils.time_parser import parse_time_string
 
 # Initialize the MCP server
 mcp = FastMCP("pulse-queue")
 
-# Initialize the pulse queue (database connection)
+# Pulse queue (database connection), created on first tool use so starting the
+# server doesn't open the database
 DB_PATH = os.getenv("PULSE_DB_PATH", "~/.reeve/pulse_queue.db")
-queue = PulseQueue(f"sqlite+aiosqlite:///{os.path.expanduser(DB_PATH)}")
+_DB_URL = f"sqlite+aiosqlite:///{Path(DB_PATH).expanduser()}"
+queue: Optional[PulseQueue] = None
+
+
+def _get_queue() -> PulseQueue:
+    """Get the shared pulse queue, creating it on first use."""
+    global queue
+    if queue is None:
+        queue = PulseQueue(_DB_URL)
+    return queue
 
 
 # ============================================================================
@@ -174,6 +187,8 @@ async def schedule_pulse(
     try:
         # Parse scheduled_at (handle relative times, keywords, etc.)
         parsed_time = parse_time_string(scheduled_at)
+        StringList.check_items("sticky_notes", sticky_notes)
+        StringList.check_items("tags", tags)
 
         # Determine session ID based on resume_in_current_session
         session_id = None
@@ -185,10 +200,10 @@ async def schedule_pulse(
                 pass
 
         # Create the pulse
-        pulse_id = await queue.schedule_pulse(
+        pulse_id = await _get_queue().schedule_pulse(
             scheduled_at=parsed_time,
             prompt=prompt,
-            priority=PulsePriority(priority),
+            priority=_PRIORITY_BY_VALUE[priority],
             session_id=session_id,
             sticky_notes=sticky_notes,
             tags=tags,
@@ -196,16 +211,20 @@ async def schedule_pulse(
         )
 
         # Format response
-        time_str = parsed_time.strftime("%Y-%m-%d %H:%M:%S %Z")
-        session_info = (
-            f"\nSession: Resume current ({session_id})" if session_id else "\nSession: New session"
+        time_str = parsed_time.isoformat(sep=" ", timespec="seconds")
+        session_line = (
+            f"Session: Resume current ({session_id})" if session_id else "Session: New session"
         )
-        return (
-            f"✓ Pulse scheduled successfully\n\n"
-            f"Pulse ID: {pulse_id}\n"
-            f"Scheduled: {time_str}\n"
-            f"Priority: {priority} {_priority_emoji(priority)}{session_info}\n"
-            f"Prompt: {prompt[:100]}{'...' if len(prompt) > 100 else ''}"
+        return "\n".join(
+            (
+                "✓ Pulse scheduled successfully",
+                "",
+                f"Pulse ID: {pulse_id}",
+                f"Scheduled: {time_str}",
+                f"Priority: {priority} {_PRIORITY_EMOJI.get(priority, '')}",
+                session_line,
+                f"Prompt: {preview(prompt, 100)}",
+            )
         )
     except Exception as e:
         return f"✗ Failed to schedule pulse: {str(e)}"
@@ -249,37 +268,42 @@ async def list_upcoming_pulses(
         Formatted list of pulses with time, priority, and prompt preview
     """
     try:
-        statuses = [PulseStatus.PENDING]
-        if include_completed:
-            statuses.extend([PulseStatus.COMPLETED, PulseStatus.PROCESSING])
-
-        pulses = await queue.get_upcoming_pulses(limit=limit, include_statuses=statuses)
+        statuses = _LISTED_STATUSES_WITH_COMPLETED if include_completed else _LISTED_STATUSES
+        pulses = await _get_queue().get_upcoming_pulses(limit=limit, include_statuses=statuses)
 
         if not pulses:
-            return "No upcoming pulses scheduled. The schedule is clear."
+            return _EMPTY_SCHEDULE_MESSAGE
 
         # Format as a table
         lines = ["Upcoming Pulses:\n"]
+        append = lines.append
         now = datetime.now(timezone.utc)
 
         for pulse in pulses:
             # Calculate time until pulse
-            time_delta = pulse.scheduled_at - now
-            if time_delta.total_seconds() < 0:
+            scheduled_at = pulse.scheduled_at
+            seconds = (scheduled_at - now).total_seconds()
+            if seconds < 0:
                 time_str = "OVERDUE"
-            elif time_delta.total_seconds() < 3600:
-                time_str = f"in {int(time_delta.total_seconds() / 60)}m"
-            elif time_delta.total_seconds() < 86400:
-                time_str = f"in {int(time_delta.total_seconds() / 3600)}h"
+            elif seconds < 3600:
+                time_str = f"in {int(seconds / 60)}m"
+            elif seconds < 86400:
+                time_str = f"in {int(seconds / 3600)}h"
             else:
-                time_str = pulse.scheduled_at.strftime("%b %d %H:%M")
-
-            emoji = _priority_emoji(pulse.priority.value)
-            status_emoji = _status_emoji(pulse.status.value)
-            prompt_preview = pulse.prompt[:60] + "..." if len(pulse.prompt) > 60 else pulse.prompt
-
-            lines.append(
-                f"{status_emoji} [{pulse.id:04d}] {emoji} {time_str:12s} | {prompt_preview}"
+                time_str = (
+                    f"{_MONTH_ABBREVIATIONS[scheduled_at.month - 1]} {scheduled_at.day:02d} "
+                    f"{scheduled_at.hour:02d}:{scheduled_at.minute:02d}"
+                )
+
+            append(
+                _PULSE_ROW_FORMAT
+                % (
+                    _STATUS_EMOJI.get(pulse.status.value, ""),
+                    pulse.id,
+                    _PRIORITY_EMOJI.get(pulse.priority.value, ""),
+                    time_str,
+                    preview(pulse.prompt, 60),
+                )
             )
 
         return "\n".join(lines)
@@ -310,7 +334,7 @@ async def cancel_pulse(
         Confirmation message or error if pulse couldn't be cancelled
     """
     try:
-        success = await queue.cancel_pulse(pulse_id)
+        success = await _get_queue().cancel_pulse(pulse_id)
 
         if success:
             return f"✓ Pulse {pulse_id} cancelled successfully"
@@ -356,10 +380,10 @@ async def reschedule_pulse(
     """
     try:
         parsed_time = parse_time_string(new_scheduled_at)
-        success = await queue.reschedule_pulse(pulse_id, parsed_time)
+        success = await _get_queue().reschedule_pulse(pulse_id, parsed_time)
 
         if success:
-            time_str = parsed_time.strftime("%Y-%m-%d %H:%M:%S %Z")
+            time_str = parsed_time.isoformat(sep=" ", timespec="seconds")
             return f"✓ Pulse {pulse_id} rescheduled to {time_str}"
         else:
             return (
@@ -374,26 +398,40 @@ async def reschedule_pulse(
 # ============================================================================
 
 
-def _priority_emoji(priority: str) -> str:
-    """Map priority to emoji for visual scanning."""
-    return {
-        "critical": "🚨",
-        "high": "🔔",
-        "normal": "⏰",
-        "low": "📋",
-        "deferred": "🕐",
-    }.get(priority, "")
-
-
-def _status_emoji(status: str) -> str:
-    """Map status to emoji for visual scanning."""
-    return {
-        "pending": "⏳",
-        "processing": "⚙️",
-        "completed": "✅",
-        "failed": "❌",
-        "cancelled": "🚫",
-    }.get(status, "")
+# Status filters and empty-result reply for list_upcoming_pulses
+_LISTED_STATUSES = (PulseStatus.PENDING,)
+_LISTED_STATUSES_WITH_COMPLETED = (
+    PulseStatus.PENDING,
+    PulseStatus.COMPLETED,
+    PulseStatus.PROCESSING,
+)
+_EMPTY_SCHEDULE_MESSAGE = "No upcoming pulses scheduled. The schedule is clear."
+
+# Month names for far-off list rows ("Jan 20 09:00"), formatted without strftime
+_MONTH_ABBREVIATIONS = tuple("Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split())
+
+# Row template for list_upcoming_pulses: status, ID, priority, time, preview
+_PULSE_ROW_FORMAT = "%s [%04d] %s %-12s | %s"
+
+# Priority literal -> enum member, avoiding the Enum lookup path per call
+_PRIORITY_BY_VALUE = {p.value: p for p in PulsePriority}
+
+# Emoji lookups for visual scanning, built once rather than per call
+_PRIORITY_EMOJI = {
+    "critical": "🚨",
+    "high": "🔔",
+    "normal": "⏰",
+    "low": "📋",
+    "deferred": "🕐",
+}
+
+_STATUS_EMOJI = {
+    "pending": "⏳",
+    "processing": "⚙️",
+    "completed": "✅",
+    "failed": "❌",
+    "cancelled": "🚫",
+}
 
 
 # ============================================================================
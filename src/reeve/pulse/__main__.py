@@ -9,11 +9,11 @@ Usage:
     LOG_LEVEL=DEBUG python -m reeve.pulse
 """
 
-import asyncio
 import logging
 import sys
 
 from reeve.pulse.daemon import PulseDaemon
+from reeve.utils import event_loop
 from reeve.utils.config import get_config
 from reeve.utils.logging import setup_logging
 
@@ -53,7 +53,8 @@ async def async_main() -> None:
 def main() -> None:
     """Synchronous entry point."""
     try:
-        asyncio.run(async_main())
+        # Runs on uvloop when installed (also serves the API via uvicorn)
+        event_loop.run(async_main())
     except KeyboardInterrupt:
         # Graceful exit on Ctrl+C (SIGINT is already handled by daemon)
         pass
@@ -2,7 +2,7 @@
 Pulse Daemon - Main orchestrator for pulse execution.
 
 This daemon runs continuously in the background, managing:
-1. Pulse scheduler (checks queue every 1 second)
+1. Pulse scheduler (sleeps until the next pulse is due or a new one is scheduled)
 2. Concurrent pulse execution
 3. Graceful shutdown handling
 
@@ -17,13 +17,33 @@ Usage:
 import asyncio
 import logging
 import signal
+import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from reeve.pulse.executor import PulseExecutor
 from reeve.pulse.models import Pulse
 from reeve.pulse.queue import PulseQueue
+from reeve.utils import event_loop
 from reeve.utils.config import ReeveConfig
+from reeve.utils.text import preview
+
+# Longest the scheduler sleeps between queue checks. In-process scheduling wakes
+# it immediately; this bounds the latency for pulses written by other processes
+# (e.g., the pulse MCP server), which can't signal the daemon directly.
+_MAX_IDLE_WAIT = 1.0
+
+# For file-backed SQLite, other processes' commits are instead detected by
+# stat()ing the database files every _CHANGE_CHECK_INTERVAL seconds, so an idle
+# daemon only re-queries after a change (or every _MAX_WATCHED_WAIT seconds)
+_CHANGE_CHECK_INTERVAL = 0.25
+_MAX_WATCHED_WAIT = 30.0
+
+# Database connections kept open beyond one per concurrent pulse
+_POOL_HEADROOM = 4
+
+# How long shutdown waits for in-flight pulses before cancelling them
+_SHUTDOWN_GRACE_PERIOD = 30.0
 
 
 class PulseDaemon:
@@ -43,10 +63,15 @@ class PulseDaemon:
             config: ReeveConfig instance with database URL, Hapi command, etc.
         """
         self.config = config
-        self.queue = PulseQueue(config.pulse_db_url)
+        # Keep a warm connection per concurrent pulse, plus headroom for the
+        # scheduler, the HTTP API, and the completion flusher
+        self.queue = PulseQueue(
+            config.pulse_db_url, pool_size=config.pulse_max_concurrent + _POOL_HEADROOM
+        )
         self.executor = PulseExecutor(
             hapi_command=config.hapi_command,
             desk_path=config.reeve_desk_path,
+            max_subprocesses=config.pulse_max_subprocesses,
         )
         self.logger = logging.getLogger("reeve.daemon")
 
@@ -54,11 +79,66 @@ class PulseDaemon:
         self.running = False
         self.scheduler_task: Optional[asyncio.Task] = None
         self.api_task: Optional[asyncio.Task] = None
+        # Strong references: the event loop only keeps weak ones, so this set is
+        # what keeps in-flight pulses alive; each task is removed once it finishes
         self.executing_pulses: set[asyncio.Task] = set()
         self.shutdown_event = asyncio.Event()
         self.max_concurrent = config.pulse_max_concurrent
 
-    async def _execute_pulse(self, pulse: Pulse) -> None:
+        # One slot per concurrently executing pulse; the scheduler blocks on it
+        # when saturated and each finished pulse releases its slot
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+
+        # Set to cut the scheduler's wait short (new pulse, freed capacity)
+        self._wake = asyncio.Event()
+        self.queue.on_pulse_scheduled = self.wake
+
+    def wake(self) -> None:
+        """Wake the scheduler loop to check the queue now."""
+        self._wake.set()
+
+    async def _wait_for_wake(self, timeout: float) -> None:
+        """Sleep up to `timeout` seconds, returning early if woken."""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _wait_for_queue_change(
+        self, timeout: float, change_token: Optional[Tuple[Tuple[int, int], ...]]
+    ) -> None:
+        """
+        Sleep up to `timeout` seconds, returning early if woken or the database changes.
+
+        Args:
+            timeout: Seconds until the next pending pulse is due
+            change_token: The queue's change token from before the last check,
+                or None if changes can't be watched (falls back to polling)
+        """
+        if change_token is None:
+            await self._wait_for_wake(min(timeout, _MAX_IDLE_WAIT))
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + min(timeout, _MAX_WATCHED_WAIT)
+        while (remaining := deadline - loop.time()) > 0:
+            await self._wait_for_wake(min(remaining, _CHANGE_CHECK_INTERVAL))
+            if self._wake.is_set() or self.queue.change_token() != change_token:
+                return
+
+    def _on_pulse_done(self, task: asyncio.Task) -> None:
+        """Stop tracking a finished pulse task and release its execution slot."""
+        self.executing_pulses.discard(task)
+        self._slots.release()
+
+    async def _execute_pulse(
+        self,
+        pulse_id: int,
+        prompt: str,
+        session_id: Optional[str],
+        sticky_notes: Optional[list[str]],
+        max_retries: int,
+    ) -> None:
         """
         Execute a single pulse and update database.
 
@@ -68,140 +148,185 @@ class PulseDaemon:
         3. Tracks execution duration
         4. Marks pulse as COMPLETED or FAILED (with retry)
 
+        Takes the pulse's fields rather than the Pulse row itself, so the ORM
+        instance isn't kept alive for the whole (possibly hour-long) execution.
+
         Args:
-            pulse: The Pulse model instance to execute
+            pulse_id: ID of the claimed pulse
+            prompt: The pulse's prompt
+            session_id: Hapi session to resume, if any
+            sticky_notes: Reminders appended to the prompt, if any
+            max_retries: The pulse's retry budget (reported in failure alerts)
         """
-        start_time = datetime.now(timezone.utc)
-        pulse_id = pulse.id
-        prompt_preview = pulse.prompt[:50] + "..." if len(pulse.prompt) > 50 else pulse.prompt
-
-        self.logger.info(f"Executing pulse {pulse_id}: {prompt_preview}")
+        # Monotonic, so NTP adjustments can't skew the reported duration
+        start_ns = time.perf_counter_ns()
+        self.logger.info("Executing pulse %s: %s", pulse_id, preview(prompt, 50))
 
         try:
             # Build full prompt with sticky notes appended
-            full_prompt = self.executor.build_prompt(pulse.prompt, pulse.sticky_notes)  # type: ignore[arg-type]
+            full_prompt = self.executor.build_prompt(prompt, sticky_notes)
 
             # Execute via PulseExecutor
             result = await self.executor.execute(
                 prompt=full_prompt,
-                session_id=pulse.session_id,  # type: ignore[arg-type]
+                session_id=session_id,
                 working_dir=self.config.reeve_desk_path,
             )
 
             # Calculate duration in milliseconds
-            duration_ms = int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+            # Keep only the session ID so the captured stdout/stderr can be freed
+            result_session_id = result.session_id
+            del result
 
             # Mark as completed
-            await self.queue.mark_completed(pulse_id, duration_ms)  # type: ignore[arg-type]
+            await self.queue.mark_completed(pulse_id, duration_ms)
 
             self.logger.info(
-                f"Pulse {pulse_id} completed successfully in {duration_ms}ms "
-                f"(session_id: {result.session_id})"
+                "Pulse %s completed successfully in %dms (session_id: %s)",
+                pulse_id,
+                duration_ms,
+                result_session_id,
             )
 
         except Exception as e:
             # Log the error with full traceback
-            self.logger.error(f"Pulse {pulse_id} failed: {e}", exc_info=True)
+            self.logger.error("Pulse %s failed: %s", pulse_id, e, exc_info=True)
 
             # Mark as failed (will auto-retry if retries remaining)
             retry_pulse_id = await self.queue.mark_failed(
-                pulse_id,  # type: ignore[arg-type]
+                pulse_id,
                 error_message=str(e),
                 should_retry=True,
             )
 
             if retry_pulse_id:
-                self.logger.info(f"Pulse {pulse_id} scheduled for retry as pulse {retry_pulse_id}")
+                self.logger.info(
+                    "Pulse %s scheduled for retry as pulse %s", pulse_id, retry_pulse_id
+                )
             else:
-                self.logger.error(f"Pulse {pulse_id} failed permanently (no retries left)")
-                self._send_sentinel_alert(pulse, str(e))
+                self.logger.error("Pulse %s failed permanently (no retries left)", pulse_id)
+                self._send_sentinel_alert(pulse_id, prompt, max_retries, str(e))
 
-    def _send_sentinel_alert(self, pulse: Pulse, error: str) -> None:
+    def _send_sentinel_alert(
+        self, pulse_id: int, prompt: str, max_retries: int, error: str
+    ) -> None:
         """Send a sentinel alert for a permanently failed pulse. Never raises."""
         try:
             from reeve.sentinel import send_alert
 
-            prompt_preview = pulse.prompt[:80] + "..." if len(pulse.prompt) > 80 else pulse.prompt
+            prompt_preview = preview(prompt, 80)
             error_preview = error[:200] if error else "Unknown error"
 
             message = (
                 f"Pulse failed permanently\n\n"
                 f'Prompt: "{prompt_preview}"\n'
                 f"Error: {error_preview}\n"
-                f"Retries: {pulse.max_retries}/{pulse.max_retries} exhausted"
-                f" | Pulse #{pulse.id}\n\n"
+                f"Retries: {max_retries}/{max_retries} exhausted"
+                f" | Pulse #{pulse_id}\n\n"
                 f"Check: reeve-logs"
             )
 
             send_alert(
                 message,
-                cooldown_key=f"pulse_failed_{pulse.id}",
+                cooldown_key=f"pulse_failed_{pulse_id}",
                 cooldown_seconds=3600,
             )
         except Exception:
             self.logger.debug("Sentinel alert failed (swallowed)", exc_info=True)
 
+    def _spawn_pulses(self, pulses: List[Pulse]) -> None:
+        """
+        Start a non-blocking execution task for each claimed pulse.
+
+        Only the fields execution needs are passed on, so the ORM rows (and their
+        sticky_notes/tags) aren't kept alive by running tasks.
+
+        Args:
+            pulses: Claimed pulses, already marked PROCESSING
+        """
+        for pulse in pulses:
+            pulse_id = pulse.id
+
+            # Log successful pickup (the prompt preview is logged once execution starts)
+            self.logger.info("Picked up pulse %s", pulse_id)
+
+            task = asyncio.create_task(
+                self._execute_pulse(
+                    pulse_id, pulse.prompt, pulse.session_id, pulse.sticky_notes, pulse.max_retries
+                ),
+                name=f"pulse-{pulse_id}",
+            )
+
+            # Track for graceful shutdown
+            self.executing_pulses.add(task)
+            task.add_done_callback(self._on_pulse_done)
+
     async def _scheduler_loop(self) -> None:
         """
-        Main scheduler loop: poll for due pulses every 1 second and execute concurrently.
+        Main scheduler loop: wait for due pulses and execute them concurrently.
 
         The loop:
-        1. Gets up to 10 due pulses (ordered by priority)
-        2. Marks each as PROCESSING (atomic check)
-        3. Spawns non-blocking execution tasks
-        4. Sleeps 1 second before next iteration
+        1. Waits for a free execution slot (bounded by max_concurrent)
+        2. Claims up to 10 due pulses (one per free slot, ordered by priority),
+           marking them PROCESSING in one atomic statement
+        3. Spawns non-blocking execution tasks, each releasing its slot when done,
+           and claims again right away if every free slot got a pulse
+        4. Once the due pulses are drained, sleeps until the next pending pulse is
+           due, waking early when a pulse is scheduled in-process or (for
+           file-backed SQLite) another process commits; other databases are
+           re-checked at least every second
         5. Handles errors gracefully without crashing
         """
         self.logger.info("Scheduler loop started")
 
         while self.running:
             try:
-                # Check available slots
-                current_executing = len(self.executing_pulses)
-                available_slots = self.max_concurrent - current_executing
-
-                if available_slots <= 0:
-                    self.logger.debug(
-                        f"At max capacity ({current_executing}/{self.max_concurrent}), waiting..."
-                    )
-                    await asyncio.sleep(1)
+                # Block until an execution slot is free, then take any others
+                # that are free without waiting (up to 10 per claim)
+                await self._slots.acquire()
+                acquired = 1
+                while acquired < 10 and not self._slots.locked():
+                    await self._slots.acquire()
+                    acquired += 1
+
+                # Clear/snapshot before checking the queue so wakes and commits
+                # during the check aren't lost
+                self._wake.clear()
+                change_token = self.queue.change_token()
+
+                # Claim due pulses (up to one per slot, ordered by priority) in one
+                # atomic UPDATE; claimed pulses are already marked PROCESSING
+                try:
+                    pulses = await self.queue.claim_due_pulses(limit=acquired)
+                except BaseException:
+                    for _ in range(acquired):
+                        self._slots.release()
+                    raise
+
+                # Hand back the slots no pulse was claimed for
+                claimed = len(pulses)
+                for _ in range(acquired - claimed):
+                    self._slots.release()
+
+                # Spawn execution tasks; no reference to the pulses or their tasks
+                # is left in this frame while the loop sleeps
+                self._spawn_pulses(pulses)
+                del pulses
+
+                # A full claim means more pulses may already be due: claim again
+                # (once a slot is free) before sleeping, so bursts drain at once
+                if claimed and claimed == acquired:
                     continue
 
-                # Fetch only what we can handle
-                fetch_limit = min(10, available_slots)
-
-                # Get due pulses (up to fetch_limit at a time, ordered by priority)
-                pulses = await self.queue.get_due_pulses(limit=fetch_limit)
-
-                # Spawn execution task for each pulse
-                for pulse in pulses:
-                    # Mark as processing (atomic, prevents duplicate execution)
-                    success = await self.queue.mark_processing(pulse.id)  # type: ignore[arg-type]
-                    if not success:
-                        # Pulse already processing or completed, skip
-                        self.logger.warning(
-                            f"Pulse {pulse.id} already processing/completed, skipping"
-                        )
-                        continue
-
-                    # Log successful pickup (before execution starts)
-                    prompt_preview = (
-                        pulse.prompt[:50] + "..." if len(pulse.prompt) > 50 else pulse.prompt
-                    )
-                    self.logger.info(f"Picked up pulse {pulse.id}: {prompt_preview}")
-
-                    # Create non-blocking task
-                    task = asyncio.create_task(
-                        self._execute_pulse(pulse),
-                        name=f"pulse-{pulse.id}",
-                    )
-
-                    # Track for graceful shutdown
-                    self.executing_pulses.add(task)
-                    task.add_done_callback(self.executing_pulses.discard)
-
-                # Sleep 1 second before next check
-                await asyncio.sleep(1)
+                # Sleep until the next pulse is due or the queue changes
+                wait = _MAX_WATCHED_WAIT
+                next_scheduled_at = await self.queue.get_next_scheduled_at()
+                if next_scheduled_at is not None:
+                    until_next = (next_scheduled_at - datetime.now(timezone.utc)).total_seconds()
+                    wait = min(max(until_next, 0.0), _MAX_WATCHED_WAIT)
+                await self._wait_for_queue_change(wait, change_token)
 
             except asyncio.CancelledError:
                 # Shutdown requested
@@ -209,7 +334,7 @@ class PulseDaemon:
                 break
             except Exception as e:
                 # Log error but don't crash - back off and retry
-                self.logger.error(f"Scheduler loop error: {e}", exc_info=True)
+                self.logger.error("Scheduler loop error: %s", e, exc_info=True)
                 await asyncio.sleep(5)  # Back off 5 seconds on error
 
         self.logger.info("Scheduler loop stopped")
@@ -232,7 +357,11 @@ class PulseDaemon:
 
         from reeve.api.server import create_app
 
-        self.logger.info(f"Starting API server on http://127.0.0.1:{self.config.pulse_api_port}")
+        self.logger.info(
+            "Starting API server on http://127.0.0.1:%s (event loop: %s)",
+            self.config.pulse_api_port,
+            event_loop.loop_implementation(),
+        )
 
         # Create FastAPI app
         app = create_app(self.queue, self.config)
@@ -254,7 +383,7 @@ class PulseDaemon:
             self.logger.info("API server cancelled, shutting down")
             # Uvicorn handles cleanup automatically
         except Exception as e:
-            self.logger.error(f"API server error: {e}", exc_info=True)
+            self.logger.error("API server error: %s", e, exc_info=True)
 
         self.logger.info("API server stopped")
 
@@ -295,7 +424,7 @@ class PulseDaemon:
         Args:
             sig: The signal that triggered shutdown
         """
-        self.logger.info(f"Received {sig.name}, shutting down gracefully...")
+        self.logger.info("Received %s, shutting down gracefully...", sig.name)
 
         # Stop accepting new pulses
         self.running = False
@@ -318,22 +447,29 @@ class PulseDaemon:
         # Wait for in-flight pulses (30-second grace period)
         if self.executing_pulses:
             pulse_count = len(self.executing_pulses)
-            self.logger.info(f"Waiting for {pulse_count} in-flight pulses to complete...")
+            self.logger.info("Waiting for %d in-flight pulses to complete...", pulse_count)
 
-            try:
-                # Use gather with return_exceptions=True to wait for all tasks
-                await asyncio.wait_for(
-                    asyncio.gather(*self.executing_pulses, return_exceptions=True),
-                    timeout=30.0,
-                )
-                self.logger.info("All in-flight pulses completed successfully")
-            except asyncio.TimeoutError:
+            # asyncio.wait (unlike gather) doesn't hold on to every result until the
+            # last task finishes, so finished pulses are released during the grace period
+            done, pending = await asyncio.wait(
+                self.executing_pulses, timeout=_SHUTDOWN_GRACE_PERIOD
+            )
+            for task in done:
+                if not task.cancelled():
+                    task.exception()  # Retrieve so asyncio doesn't warn; already logged
+                self.executing_pulses.discard(task)
+
+            if pending:
                 # Timeout exceeded - force cancel remaining tasks
                 self.logger.warning(
-                    f"Timeout after 30s, force cancelling {len(self.executing_pulses)} tasks"
+                    "Timeout after %.0fs, force cancelling %d tasks",
+                    _SHUTDOWN_GRACE_PERIOD,
+                    len(pending),
                 )
-                for task in self.executing_pulses:
+                for task in pending:
                     task.cancel()
+            else:
+                self.logger.info("All in-flight pulses completed successfully")
 
         # Close database connection
         await self.queue.close()
@@ -353,7 +489,7 @@ class PulseDaemon:
         4. Waits for shutdown signal
 
         Both the scheduler and API server run concurrently, allowing:
-        - Scheduler: Polls for due pulses and executes them
+        - Scheduler: Waits for due pulses and executes them
         - API: Accepts external pulse triggers via HTTP
 
         This method blocks until shutdown is triggered.
@@ -364,7 +500,11 @@ class PulseDaemon:
         # Initialize database
         await self.queue.initialize()
 
-        self.logger.info(f"Max concurrent pulses: {self.max_concurrent}")
+        self.logger.info(
+            "Max concurrent pulses: %d (Hapi processes: %s)",
+            self.max_concurrent,
+            self.executor.max_subprocesses or "unlimited",
+        )
 
         # Register signal handlers for graceful shutdown
         self._register_signal_handlers()
@@ -6,34 +6,142 @@ sessions with the pulse's prompt as the initial context.
 """
 
 import asyncio
+import contextlib
 import logging
+import os
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import AsyncContextManager, Deque, Optional
 
 from pydantic import BaseModel, Field
 
 from reeve.pulse.stream_parser import HapiStreamParser
 
+# Hapi output is parsed as it streams; only this much is kept for ExecutionResult
+# and error messages, so memory per pulse doesn't grow with session length
+_STDOUT_TAIL_LINES = 256
+_STDERR_TAIL_BYTES = 64 * 1024
+
+# Longest stdout line kept whole (stream-json events can embed large tool results);
+# longer lines are skipped
+_STREAM_LINE_LIMIT = 4 * 1024 * 1024
+
+# Physical RAM budgeted per running Hapi process when the subprocess limit is
+# derived from the machine's memory
+_HAPI_MEMORY_BUDGET = 2 * 1024**3
+
+# Separates sticky notes from the base prompt (blank line, then the header)
+_REMINDERS_HEADER = "\n\n📌 Reminders:\n"
+
 
 class ExecutionResult(BaseModel):
     """
     Result of a pulse execution.
 
     Attributes:
-        stdout: Standard output from Hapi/Claude Code
-        stderr: Standard error from Hapi/Claude Code
+        stdout: Standard output from Hapi/Claude Code (last lines only)
+        stderr: Standard error from Hapi/Claude Code (last 64 KB only)
         return_code: Process exit code (0 = success, -1 = timeout)
         timed_out: Whether the execution timed out
         session_id: Session ID of the executed session (new or resumed)
     """
 
-    stdout: str = Field(..., description="Standard output from Hapi/Claude Code")
-    stderr: str = Field(..., description="Standard error from Hapi/Claude Code")
+    stdout: str = Field(..., description="Standard output from Hapi/Claude Code (tail)")
+    stderr: str = Field(..., description="Standard error from Hapi/Claude Code (tail)")
     return_code: int = Field(..., description="Process exit code (0 = success, -1 = timeout)")
     timed_out: bool = Field(..., description="Whether the execution timed out")
     session_id: Optional[str] = Field(None, description="Session ID of the executed session")
 
 
+def default_max_subprocesses() -> Optional[int]:
+    """
+    Number of Hapi processes the machine's physical RAM can hold at once.
+
+    Returns:
+        One per _HAPI_MEMORY_BUDGET of RAM (at least 1), or None if the
+        platform doesn't report its memory size
+    """
+    try:
+        total_memory = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+    return max(1, total_memory // _HAPI_MEMORY_BUDGET)
+
+
+class _HapiProtocol(asyncio.SubprocessProtocol):
+    """
+    Subprocess protocol that parses Hapi's output as the pipes deliver it.
+
+    Stdout is split into lines that go straight to the stream parser and a
+    bounded tail; stderr only keeps its last _STDERR_TAIL_BYTES. Bypassing
+    StreamReader avoids buffering each chunk again before it is consumed.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, parser: HapiStreamParser, logger: logging.Logger
+    ):
+        self.parser = parser
+        self.logger = logger
+        self.stdout_tail: Deque[str] = deque(maxlen=_STDOUT_TAIL_LINES)
+        self.stderr_tail = bytearray()
+        # Resolved when the process exits / when it has exited and both pipes closed
+        self.exited: asyncio.Future[None] = loop.create_future()
+        self.finished: asyncio.Future[None] = loop.create_future()
+        self._partial = bytearray()  # Stdout line still waiting for its newline
+        self._skipping = False  # Inside an oversized stdout line
+
+    def pipe_data_received(self, fd: int, data: bytes) -> None:
+        if fd == 1:
+            self._feed_stdout(data)
+        else:
+            self.stderr_tail += data
+            del self.stderr_tail[:-_STDERR_TAIL_BYTES]
+
+    def pipe_connection_lost(self, fd: int, exc: Optional[Exception]) -> None:
+        # Like StreamReader.readline(), a final line without a newline still counts
+        if fd == 1 and self._partial:
+            self._emit_line(self._partial)
+            self._partial.clear()
+
+    def process_exited(self) -> None:
+        if not self.exited.done():
+            self.exited.set_result(None)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.process_exited()
+        if not self.finished.done():
+            self.finished.set_result(None)
+
+    def _feed_stdout(self, data: bytes) -> None:
+        """Emit each complete line in `data`, carrying any incomplete one over."""
+        start = 0
+        while (end := data.find(b"\n", start) + 1) > 0:
+            if self._skipping:
+                self._skipping = False
+            elif self._partial:
+                self._partial += data[start:end]
+                self._emit_line(self._partial)
+                self._partial.clear()
+            else:
+                self._emit_line(data[start:end])
+            start = end
+
+        if start < len(data) and not self._skipping:
+            self._partial += data[start:]
+            if len(self._partial) > _STREAM_LINE_LIMIT:
+                self.logger.debug("Skipping oversized Hapi output line")
+                self._partial.clear()
+                self._skipping = True
+
+    def _emit_line(self, raw: bytes | bytearray) -> None:
+        if len(raw) > _STREAM_LINE_LIMIT:
+            self.logger.debug("Skipping oversized Hapi output line")
+            return
+        line = raw.decode("utf-8", errors="replace")
+        self.parser.parse_line(line)
+        self.stdout_tail.append(line)
+
+
 class PulseExecutor:
     """
     Executes pulses by launching Hapi sessions.
@@ -41,7 +149,7 @@ class PulseExecutor:
     This executor is responsible for:
     1. Launching Hapi subprocess with correct working directory
     2. Building the full prompt (including sticky notes appended)
-    3. Capturing stdout/stderr
+    3. Streaming stdout/stderr (parsed incrementally, only the tail retained)
     4. Reporting success/failure
     5. Handling timeouts and crashes gracefully
     """
@@ -51,6 +159,7 @@ class PulseExecutor:
         hapi_command: str,
         desk_path: str,
         timeout_seconds: int = 3600,
+        max_subprocesses: Optional[int] = None,
     ):
         """
         Initialize the executor.
@@ -59,12 +168,28 @@ class PulseExecutor:
             hapi_command: Path to Hapi executable (e.g., "hapi", "/usr/local/bin/hapi")
             desk_path: Path to the user's Desk directory (working directory for Hapi)
             timeout_seconds: Maximum execution time in seconds (default: 3600 = 1 hour)
+            max_subprocesses: Maximum Hapi processes running at once across all
+                executions; further executions wait for one to exit. Defaults to one
+                per 2 GB of physical RAM (unlimited if that can't be determined).
         """
         self.hapi_command = hapi_command
         self.desk_path = Path(desk_path).expanduser().resolve()
+        # Spellings of the desk path that need no resolving (callers typically pass
+        # the configured path)
+        self._desk_path_aliases = {desk_path, str(self.desk_path)}
         self.timeout_seconds = timeout_seconds
         self.logger = logging.getLogger("reeve.executor")
-        self.stream_parser = HapiStreamParser()
+
+        # Hapi processes are memory-heavy, so how many run at once is bounded by
+        # the machine rather than by how many pulses the scheduler has in flight
+        if max_subprocesses is None:
+            max_subprocesses = default_max_subprocesses()
+        self.max_subprocesses = max_subprocesses
+        self._subprocess_slots: AsyncContextManager = (
+            asyncio.Semaphore(max_subprocesses)
+            if max_subprocesses is not None
+            else contextlib.nullcontext()
+        )
 
     async def execute(
         self,
@@ -90,10 +215,13 @@ class PulseExecutor:
         Raises:
             RuntimeError: If Hapi execution fails (non-zero exit code)
         """
-        cwd = Path(working_dir).expanduser().resolve() if working_dir else self.desk_path
         timeout = timeout_override if timeout_override is not None else self.timeout_seconds
 
         # Validate working directory exists
+        if not working_dir or working_dir in self._desk_path_aliases:
+            cwd = self.desk_path
+        else:
+            cwd = Path(working_dir).expanduser().resolve()
         if not cwd.exists():
             raise RuntimeError(f"Working directory does not exist: {cwd}")
 
@@ -109,12 +237,14 @@ class PulseExecutor:
         # Add prompt as positional argument (must be last)
         cmd.append(prompt)
 
-        self.logger.debug(f"Executing: {' '.join(cmd)} (cwd: {cwd}, timeout: {timeout}s)")
+        # Guarded: joining the command copies the (possibly multi-KB) prompt
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Executing: %s (cwd: %s, timeout: %ss)", " ".join(cmd), cwd, timeout)
 
         # Handle dry run mode - log command without executing
         if dry_run:
-            self.logger.info(f"[DRY RUN] Would execute: {' '.join(cmd)}")
-            self.logger.info(f"[DRY RUN] Working directory: {cwd}")
+            self.logger.info("[DRY RUN] Would execute: %s", " ".join(cmd))
+            self.logger.info("[DRY RUN] Working directory: %s", cwd)
             return ExecutionResult(
                 stdout="[DRY RUN] Execution skipped",
                 stderr="",
@@ -125,40 +255,47 @@ class PulseExecutor:
 
         # Execute Hapi as subprocess
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                cwd=str(cwd),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            # Wait for completion with timeout
-            try:
-                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
-                timed_out = False
-            except asyncio.TimeoutError:
-                self.logger.warning(f"Hapi execution timed out after {timeout}s")
-                # Kill the process
-                process.kill()
-                await process.wait()
-                timed_out = True
-                stdout = b""
-                stderr = b"Execution timed out"
-
-            stdout_str = stdout.decode("utf-8", errors="replace")
-            stderr_str = stderr.decode("utf-8", errors="replace")
-            # After communicate()/wait(), returncode is always set, but mypy doesn't know this
-            return_code = (
-                -1 if timed_out else (process.returncode if process.returncode is not None else -1)
-            )
+            # Parse stream-json output line by line as it arrives (extracting
+            # session_id and error details, even on failure) instead of buffering it.
+            # Each execution gets its own parser since pulses run concurrently.
+            stream_parser = HapiStreamParser()
+            loop = asyncio.get_running_loop()
+
+            # Hold a subprocess slot from spawn until the process has exited
+            async with self._subprocess_slots:
+                transport, protocol = await loop.subprocess_exec(
+                    lambda: _HapiProtocol(loop, stream_parser, self.logger),
+                    *cmd,
+                    cwd=str(cwd),
+                    stdin=None,
+                )
 
-            # Parse stream-json output to extract session_id and error details
-            # This works for both success AND failure cases
-            parse_result = self.stream_parser.parse_all(stdout_str)
+                try:
+                    # Wait for completion with timeout
+                    try:
+                        await asyncio.wait_for(protocol.finished, timeout=timeout)
+                        timed_out = False
+                        stderr_str = protocol.stderr_tail.decode("utf-8", errors="replace")
+                    except asyncio.TimeoutError:
+                        self.logger.warning("Hapi execution timed out after %ss", timeout)
+                        # Kill the process
+                        transport.kill()
+                        await protocol.exited
+                        timed_out = True
+                        stderr_str = "Execution timed out"
+                    returncode = transport.get_returncode()
+                finally:
+                    transport.close()
+
+            stdout_str = "".join(protocol.stdout_tail)
+            # After exit, returncode is always set, but the transport API doesn't say so
+            return_code = -1 if timed_out else (returncode if returncode is not None else -1)
+
+            parse_result = stream_parser.result()
             extracted_session_id = parse_result.session_id  # Available even on failure!
 
             if parse_result.tool_call_count > 0:
-                self.logger.debug(f"Session made {parse_result.tool_call_count} tool calls")
+                self.logger.debug("Session made %d tool calls", parse_result.tool_call_count)
 
             result = ExecutionResult(
                 stdout=stdout_str,
@@ -172,15 +309,15 @@ class PulseExecutor:
             if timed_out:
                 raise RuntimeError(f"Hapi execution timed out after {timeout}s: {result.stderr}")
 
-            if process.returncode != 0:
+            if returncode != 0:
                 # Use error from parsed stdout (actual error details) over stderr (often empty)
                 error_detail = parse_result.error_message or stderr_str or "Unknown error"
                 raise RuntimeError(
-                    f"Hapi execution failed (exit code {process.returncode}): {error_detail}"
+                    f"Hapi execution failed (exit code {returncode}): {error_detail}"
                 )
 
             self.logger.info(
-                f"Hapi execution completed successfully (session_id: {extracted_session_id})"
+                "Hapi execution completed successfully (session_id: %s)", extracted_session_id
             )
             return result
 
@@ -227,11 +364,4 @@ class PulseExecutor:
         if not sticky_notes:
             return base_prompt
 
-        parts = [base_prompt, ""]  # Base prompt + blank line
-
-        # Add sticky notes section
-        parts.append("📌 Reminders:")
-        for note in sticky_notes:
-            parts.append(f"  - {note}")
-
-        return "\n".join(parts)
+        return base_prompt + _REMINDERS_HEADER + "\n".join("  - " + note for note in sticky_notes)
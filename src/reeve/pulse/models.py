@@ -5,12 +5,11 @@ SQLAlchemy ORM models for the pulse queue system.
 """
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from enum import Enum
+from typing import List, Optional, Type
 
-from sqlalchemy import DateTime
-from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Index, Integer, String, Text, TypeDecorator
-from sqlalchemy.dialects.sqlite import JSON
+from sqlalchemy import DateTime, Index, Integer, SmallInteger, String, Text, TypeDecorator, text
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -51,6 +50,88 @@ class TZDateTime(TypeDecorator):
         return value
 
 
+class SmallIntEnum(TypeDecorator):
+    """
+    Stores an Enum as a SMALLINT holding the member's declaration index.
+
+    Python code keeps working with the enum members, while the database compares,
+    sorts, and indexes 1-2 byte integers instead of variable-length strings (and
+    Postgres needs no named ENUM type). Members declared first get lower values,
+    so PulsePriority sorts CRITICAL first.
+
+    Members must only ever be appended, since reordering would change stored values.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._indexes = {member: index for index, member in enumerate(self._members)}
+
+    def process_bind_param(self, value, dialect):
+        """Convert an enum member (or its value) to its declaration index."""
+        if value is None:
+            return None
+        if not isinstance(value, self.enum_class):
+            value = self.enum_class(value)
+        return self._indexes[value]
+
+    def process_result_value(self, value, dialect):
+        """Convert a stored index back to the enum member."""
+        if value is None:
+            return None
+        return self._members[value]
+
+
+class StringList(TypeDecorator):
+    """
+    Stores a list of strings without a JSON round trip.
+
+    Postgres uses a native TEXT[] column. Elsewhere (SQLite) the list is packed
+    into TEXT with each item prefixed by the ASCII unit separator, so [] and
+    [""] stay distinct and decoding is a single split. Items therefore can't
+    contain that separator; see check_items().
+    """
+
+    impl = Text
+    cache_ok = True
+
+    SEPARATOR = "\x1f"
+
+    @classmethod
+    def check_items(cls, field: str, items: Optional[List[str]]) -> Optional[List[str]]:
+        """
+        Reject items the packed format can't store, naming the offending field.
+
+        Callers accepting user input run this first so the error surfaces there
+        rather than from the database layer. Returns items unchanged.
+        """
+        if items and any(cls.SEPARATOR in item for item in items):
+            raise ValueError(f"{field} must not contain the \\x1f (unit separator) character")
+        return items
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.ARRAY(Text))
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value, dialect):
+        """Pack the list into TEXT (passed through as-is for Postgres arrays)."""
+        if value is None or dialect.name == "postgresql":
+            return value
+        self.check_items("StringList items", value)
+        return "".join(self.SEPARATOR + item for item in value)
+
+    def process_result_value(self, value, dialect):
+        """Unpack TEXT back into a list."""
+        if value is None or dialect.name == "postgresql":
+            return value
+        return value.split(self.SEPARATOR)[1:]
+
+
 class Pulse(Base):
     """
     Represents a scheduled wake-up event for Reeve.
@@ -89,7 +170,7 @@ class Pulse(Base):
     )
 
     priority: Mapped[PulsePriority] = mapped_column(
-        SQLEnum(PulsePriority),
+        SmallIntEnum(PulsePriority),
         nullable=False,
         default=PulsePriority.NORMAL,
         index=True,
@@ -105,7 +186,7 @@ class Pulse(Base):
     )
 
     sticky_notes: Mapped[Optional[List[str]]] = mapped_column(
-        JSON,
+        StringList,
         nullable=True,
         comment="Optional list of reminder strings to inject into the prompt. "
         "Example: ['Check if user replied to ski trip', 'Follow up on PR review']",
@@ -113,7 +194,7 @@ class Pulse(Base):
 
     # Execution State
     status: Mapped[PulseStatus] = mapped_column(
-        SQLEnum(PulseStatus),
+        SmallIntEnum(PulseStatus),
         nullable=False,
         default=PulseStatus.PENDING,
         index=True,
@@ -170,7 +251,7 @@ class Pulse(Base):
     )
 
     tags: Mapped[Optional[List[str]]] = mapped_column(
-        JSON,
+        StringList,
         nullable=True,
         comment="Optional tags for categorization/filtering. "
         "Example: ['hourly_check', 'calendar_sync', 'snowboarding']",
@@ -178,10 +259,20 @@ class Pulse(Base):
 
     # Database Indexes
     __table_args__ = (
-        # Most common query: "Get all pending/processing pulses due before now, ordered by priority"
-        Index("idx_pulse_execution", "status", "scheduled_at", "priority"),
+        # Most common query: "Get all pending pulses due before now, ordered by priority".
+        # Column order matches the ORDER BY (priority is stored CRITICAL-first), so
+        # due pulses come off the index already sorted
+        Index("idx_pulse_due", "status", "priority", "scheduled_at"),
         # For listing upcoming pulses: "What's on Reeve's schedule?"
         Index("idx_pulse_upcoming", "scheduled_at", "status"),
+        # Pending pulses by time only, for listing overdue pulses. Completed/failed
+        # history never enters it, so it stays small (status 0 is PENDING)
+        Index(
+            "idx_pulse_pending_sched",
+            "scheduled_at",
+            sqlite_where=text("status = 0"),
+            postgresql_where=text("status = 0"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -13,6 +13,9 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+# Shared decoder; raw_decode parses from an offset, so prefixed lines aren't sliced
+_DECODER = json.JSONDecoder()
+
 
 class HapiEventType(str, Enum):
     """
@@ -149,19 +152,19 @@ class HapiStreamParser:
         if not line:
             return None
 
-        # Strip terminal escape sequences (e.g., ]9;9;/path/to/dir before JSON)
+        # Skip terminal escape sequences (e.g., ]9;9;/path/to/dir before JSON)
         # WSL and some terminals prepend escape codes to output
         json_start = line.find("{")
         if json_start > 0:
-            self.logger.debug(f"Stripping {json_start} chars of prefix before JSON")
-            line = line[json_start:]
+            self.logger.debug(f"Skipping {json_start} chars of prefix before JSON")
         elif json_start == -1:
             self.logger.debug(f"Skipping non-JSON line: {line[:50]}...")
             return None
 
-        # Parse JSON (skip non-JSON lines like status messages)
+        # Parse JSON in place from the first brace, without copying the line
+        # (skip non-JSON lines like status messages)
         try:
-            data = json.loads(line)
+            data, _ = _DECODER.raw_decode(line, json_start)
         except json.JSONDecodeError:
             self.logger.debug(f"Skipping non-JSON line: {line[:50]}...")
             return None
@@ -248,6 +251,15 @@ class HapiStreamParser:
         for line in stdout.split("\n"):
             self.parse_line(line)
 
+        return self.result()
+
+    def result(self) -> StreamParseResult:
+        """
+        Summarize the lines parsed so far (e.g., after feeding parse_line incrementally).
+
+        Returns:
+            StreamParseResult with aggregated data
+        """
         return StreamParseResult(
             session_id=self._session_id,
             is_error=self._is_error,
@@ -73,6 +73,11 @@ class ReeveConfig:
         self.pulse_api_port: int = int(os.getenv("PULSE_API_PORT", "8765"))
         self.pulse_api_token: Optional[str] = os.getenv("PULSE_API_TOKEN")
         self.pulse_max_concurrent: int = int(os.getenv("PULSE_MAX_CONCURRENT", "1"))
+        # Unset: derived from physical RAM by the executor
+        max_subprocesses_env = os.getenv("PULSE_MAX_SUBPROCESSES")
+        self.pulse_max_subprocesses: Optional[int] = (
+            int(max_subprocesses_env) if max_subprocesses_env else None
+        )
 
         # Telegram configuration (Phase 7)
         self.telegram_bot_token: Optional[str] = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -106,6 +111,7 @@ class ReeveConfig:
             f"  pulse_db_url={self.pulse_db_url},\n"
             f"  pulse_api_port={self.pulse_api_port},\n"
             f"  pulse_max_concurrent={self.pulse_max_concurrent},\n"
+            f"  pulse_max_subprocesses={self.pulse_max_subprocesses},\n"
             f"  hapi_command={self.hapi_command}\n"
             f")>"
         )
@@ -0,0 +1,51 @@
+"""
+Event loop selection for Reeve entry points.
+
+Runs coroutines on uvloop (libuv-backed, faster socket/subprocess I/O) when it
+is installed, falling back to the standard asyncio event loop otherwise
+(e.g., on Windows where uvloop is unavailable).
+"""
+
+import asyncio
+from typing import Any, Callable, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def get_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """
+    Get the uvloop event loop factory if uvloop is installed.
+
+    Returns:
+        uvloop.new_event_loop, or None to use the default asyncio loop
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion, preferring uvloop (drop-in for asyncio.run).
+
+    Args:
+        main: The coroutine to run
+
+    Returns:
+        The coroutine's return value
+    """
+    with asyncio.Runner(loop_factory=get_loop_factory()) as runner:
+        return runner.run(main)
+
+
+def loop_implementation() -> str:
+    """
+    Describe the running event loop implementation (for startup logging).
+
+    Returns:
+        Module-qualified class name, e.g. "uvloop.Loop" or "asyncio.unix_events._UnixSelectorEventLoop"
+    """
+    loop_cls = type(asyncio.get_running_loop())
+    return f"{loop_cls.__module__}.{loop_cls.__qualname__}"
@@ -0,0 +1,8 @@
+"""
+Text helpers shared by the daemon, API and MCP servers.
+"""
+
+
+def preview(prompt: str, limit: int) -> str:
+    """Truncate a prompt to `limit` characters, appending '...' if cut."""
+    return prompt[:limit] + "..." if len(prompt) > limit else prompt
@@ -7,7 +7,16 @@ supporting various formats including ISO 8601, relative times, and keywords.
 Used by MCP servers and API endpoints to provide flexible time input.
 """
 
+import functools
+import re
 from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+# "now" | "in <amount> <unit>", matched case-insensitively in one pass
+_KEYWORD_OR_RELATIVE_RE = re.compile(r"now|in\s+(\S+)\s+(\S+)", re.IGNORECASE)
+
+# Seconds per supported relative-time unit
+_UNIT_SECONDS = {"minute": 60, "hour": 3600, "day": 86400}
 
 
 def parse_time_string(time_str: str) -> datetime:
@@ -38,38 +47,49 @@ def parse_time_string(time_str: str) -> datetime:
         >>> parse_time_string("2026-01-20T09:00:00Z")
         datetime.datetime(2026, 1, 20, 9, 0, 0, tzinfo=datetime.timezone.utc)
     """
-    time_str = time_str.strip()
-
-    # ISO 8601 (check before lowercasing to preserve 'T')
-    if "T" in time_str or time_str.endswith("Z") or time_str.endswith("+00:00"):
-        return datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-
-    # Convert to lowercase for keyword/relative matching
-    time_str_lower = time_str.lower()
-
-    # Keyword: "now"
-    if time_str_lower == "now":
-        return datetime.now(timezone.utc)
-
-    # Relative: "in X hours/minutes/days"
-    if time_str_lower.startswith("in "):
-        parts = time_str_lower[3:].split()
-        if len(parts) == 2:
-            try:
-                amount = int(parts[0])
-            except ValueError:
-                raise ValueError(
-                    f"Invalid amount in time string: '{time_str}'. " f"Amount must be an integer."
-                )
-
-            unit = parts[1].rstrip("s")  # "hours" -> "hour", "minutes" -> "minute"
-
-            if unit == "minute":
-                return datetime.now(timezone.utc) + timedelta(minutes=amount)
-            elif unit == "hour":
-                return datetime.now(timezone.utc) + timedelta(hours=amount)
-            elif unit == "day":
-                return datetime.now(timezone.utc) + timedelta(days=amount)
+    absolute, offset_seconds = _parse_cached(time_str.strip())
+    if absolute is not None:
+        return absolute
+    return datetime.now(timezone.utc) + timedelta(seconds=offset_seconds)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_cached(time_str: str) -> Tuple[Optional[datetime], int]:
+    """
+    Parse a stripped time string, independent of the current time.
+
+    Callers repeat the same strings ("now", "in 1 hour"), so the parse is
+    memoized; only the final "now + offset" is computed per call.
+
+    Returns:
+        (absolute datetime, 0) for ISO 8601 input, or (None, offset in
+        seconds from now) for keywords and relative times
+
+    Raises:
+        ValueError: If the time string cannot be parsed or is in an unsupported format
+    """
+    # ISO 8601 (check before keyword matching to preserve 'T')
+    if "T" in time_str or time_str.endswith(("Z", "+00:00")):
+        return datetime.fromisoformat(time_str.replace("Z", "+00:00")), 0
+
+    # Keyword "now" or relative "in X hours/minutes/days", in a single match
+    match = _KEYWORD_OR_RELATIVE_RE.fullmatch(time_str)
+    if match:
+        amount_str, unit = match.groups()
+        if amount_str is None:
+            return None, 0
+
+        try:
+            amount = int(amount_str)
+        except ValueError:
+            raise ValueError(
+                f"Invalid amount in time string: '{time_str}'. " f"Amount must be an integer."
+            )
+
+        # "hours" -> "hour", "minutes" -> "minute"
+        unit_seconds = _UNIT_SECONDS.get(unit.lower().rstrip("s"))
+        if unit_seconds is not None:
+            return None, amount * unit_seconds
 
     # Fallback: raise error for unimplemented formats
     raise ValueError(
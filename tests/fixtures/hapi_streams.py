@@ -12,6 +12,9 @@ Usage:
         assert result.session_id == "test-session-123"
 """
 
+import asyncio
+from unittest.mock import MagicMock, patch
+
 # ============================================================================
 # Individual Events (raw JSON strings)
 # ============================================================================
@@ -253,3 +256,84 @@ def blank_lines_stream(session_id: str = "test-session-123") -> str:
             "",
         ]
     )
+
+
+# ============================================================================
+# Process Mocks
+# ============================================================================
+
+
+def mock_hapi_process(
+    stdout: bytes = b"", stderr: bytes = b"", returncode: int = 0, finishes: bool = True
+) -> MagicMock:
+    """
+    Mock of the subprocess transport PulseExecutor spawns Hapi with.
+
+    Once attached to a SubprocessProtocol (see patch_subprocess_exec), the output is
+    delivered on the next event loop iteration, followed by EOF and process exit.
+
+    Args:
+        stdout: Bytes the process writes to stdout
+        stderr: Bytes the process writes to stderr
+        returncode: Exit code reported once the process finishes
+        finishes: If False, the process only exits when killed (simulates a hung process)
+
+    Returns:
+        MagicMock transport with attach(protocol), get_returncode(), kill(), and close()
+    """
+    process = MagicMock()
+    state: dict = {"protocol": None, "returncode": None}
+
+    def exit_process(code: int) -> None:
+        if state["returncode"] is not None:
+            return
+        state["returncode"] = code
+        protocol = state["protocol"]
+        protocol.pipe_connection_lost(1, None)
+        protocol.pipe_connection_lost(2, None)
+        protocol.process_exited()
+        protocol.connection_lost(None)
+
+    def deliver_output() -> None:
+        protocol = state["protocol"]
+        protocol.pipe_data_received(1, stdout)
+        protocol.pipe_data_received(2, stderr)
+        if finishes:
+            exit_process(returncode)
+
+    def attach(protocol) -> None:
+        state["protocol"] = protocol
+        protocol.connection_made(process)
+        asyncio.get_running_loop().call_soon(deliver_output)
+
+    process.attach = attach
+    process.get_returncode = MagicMock(side_effect=lambda: state["returncode"])
+    process.kill = MagicMock(side_effect=lambda: exit_process(-9))
+    return process
+
+
+def patch_subprocess_exec(*processes: MagicMock, **kwargs):
+    """
+    Patch the running event loop's subprocess_exec to spawn mock Hapi processes.
+
+    Must be used from a running event loop. The returned mock records the calls, so
+    call_args[0] is (protocol_factory, *cmd) and call_args[1] holds e.g. cwd.
+
+    Args:
+        *processes: Mocks from mock_hapi_process() to attach, one per spawn (once
+            used up, each spawn gets a new empty successful process)
+        **kwargs: Passed to patch.object instead (e.g. side_effect=FileNotFoundError())
+
+    Returns:
+        The patch.object context manager
+    """
+    remaining = list(processes)
+
+    async def subprocess_exec(protocol_factory, *args, **exec_kwargs):
+        transport = remaining.pop(0) if remaining else mock_hapi_process()
+        protocol = protocol_factory()
+        transport.attach(protocol)
+        return transport, protocol
+
+    kwargs.setdefault("side_effect", subprocess_exec)
+    return patch.object(asyncio.get_running_loop(), "subprocess_exec", **kwargs)
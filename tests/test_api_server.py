@@ -230,6 +230,23 @@ def test_schedule_pulse_prompt_too_long(client: TestClient, auth_headers: dict):
     assert "detail" in data
 
 
+def test_schedule_pulse_rejects_unit_separator(
+    client: TestClient, auth_headers: dict, mock_queue: PulseQueue
+):
+    """Test that sticky notes and tags containing \\x1f are rejected before the queue."""
+    for field in ("sticky_notes", "tags"):
+        response = client.post(
+            "/api/pulse/schedule",
+            json={"prompt": "Check the unit separator", field: ["ok", "a\x1fb"]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 422
+        assert f"{field} must not contain" in response.text
+
+    mock_queue.schedule_pulse.assert_not_called()
+
+
 def test_schedule_pulse_invalid_time_format(client: TestClient, auth_headers: dict):
     """Test that invalid time strings are rejected."""
     response = client.post(
@@ -458,6 +475,38 @@ def test_health_check_with_auth(client: TestClient, auth_headers: dict):
     assert data["status"] == "healthy"
 
 
+def test_health_check_static_response(client: TestClient):
+    """Test that health check serves pre-rendered JSON and rejects other methods."""
+    response = client.get("/api/health")
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["content-length"] == str(len(response.content))
+
+    for method in ("POST", "PUT", "DELETE", "OPTIONS"):
+        response = client.request(method, "/api/health")
+        assert response.status_code == 405
+        assert response.headers["allow"] == "GET, HEAD"
+        assert response.json() == {"detail": "Method Not Allowed"}
+
+
+@pytest.mark.asyncio
+async def test_health_check_head_sends_headers_only():
+    """Test that HEAD gets the GET headers, including Content-Length, but no body."""
+    from reeve.api.server import _HEALTH_BODY, _HealthApp
+
+    messages: list = []
+
+    async def send(message):
+        messages.append(message)
+
+    await _HealthApp()({"type": "http", "method": "HEAD"}, AsyncMock(), send)
+
+    start, body = messages
+    assert start["status"] == 200
+    assert (b"content-length", str(len(_HEALTH_BODY)).encode()) in start["headers"]
+    assert body["body"] == b""
+
+
 # ========================================================================
 # GET /api/status - Daemon Status
 # ========================================================================
@@ -652,11 +701,75 @@ def test_get_pulse_detail_with_execution_data(
     assert data["execution_duration_ms"] == 90000
 
 
+# ========================================================================
+# POST /api/pulse/bulk - Bulk Pulse Detail Tests
+# ========================================================================
+
+
+def _detail_pulse(pulse_id: int) -> Pulse:
+    """Build a minimal pulse suitable for detail responses."""
+    return Pulse(
+        id=pulse_id,
+        scheduled_at=datetime(2026, 1, 20, 9, 0, tzinfo=timezone.utc),
+        prompt=f"Bulk pulse {pulse_id}",
+        priority=PulsePriority.NORMAL,
+        status=PulseStatus.PENDING,
+        created_by="system",
+        retry_count=0,
+        max_retries=3,
+        created_at=datetime(2026, 1, 19, 12, 0, tzinfo=timezone.utc),
+    )
+
+
+def test_bulk_get_pulses_preserves_order(
+    client: TestClient, auth_headers: dict, mock_queue: PulseQueue
+):
+    """Test bulk fetch returns details in request order and omits unknown IDs."""
+    # Queue returns rows in arbitrary order
+    mock_queue.get_pulses_by_ids = AsyncMock(return_value=[_detail_pulse(2), _detail_pulse(7)])
+
+    response = client.post("/api/pulse/bulk", headers=auth_headers, json={"ids": [7, 999, 2]})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [p["id"] for p in data] == [7, 2]
+    assert data[0]["prompt"] == "Bulk pulse 7"
+    mock_queue.get_pulses_by_ids.assert_called_once_with([7, 999, 2])
+
+
+def test_bulk_get_pulses_rejects_too_many_ids(client: TestClient, auth_headers: dict):
+    """Test bulk fetch enforces the 100-ID limit and a non-empty list."""
+    response = client.post(
+        "/api/pulse/bulk", headers=auth_headers, json={"ids": list(range(1, 102))}
+    )
+    assert response.status_code == 422
+
+    response = client.post("/api/pulse/bulk", headers=auth_headers, json={"ids": []})
+    assert response.status_code == 422
+
+
+def test_bulk_get_pulses_missing_auth(client: TestClient):
+    """Test bulk fetch requires authentication."""
+    response = client.post("/api/pulse/bulk", json={"ids": [1]})
+
+    assert response.status_code == 401
+
+
 # ========================================================================
 # GET /api/pulse/list - Pulse List Tests
 # ========================================================================
 
 
+def _stream(fetch):
+    """Turn a list-returning fake into a stream_pulses_by_status mock."""
+
+    async def stream(status, limit):
+        for pulse in await fetch(status, limit):
+            yield pulse
+
+    return MagicMock(side_effect=stream)
+
+
 def test_list_pulses_pending(client: TestClient, auth_headers: dict, mock_queue: PulseQueue):
     """Test listing pending pulses."""
     pending_pulses = [
@@ -683,7 +796,7 @@ def test_list_pulses_pending(client: TestClient, auth_headers: dict, mock_queue:
             return pending_pulses
         return []
 
-    mock_queue.get_pulses_by_status = AsyncMock(side_effect=mock_get_pulses_by_status)
+    mock_queue.stream_pulses_by_status = _stream(mock_get_pulses_by_status)
 
     response = client.get("/api/pulse/list?status=pending", headers=auth_headers)
 
@@ -695,7 +808,7 @@ def test_list_pulses_pending(client: TestClient, auth_headers: dict, mock_queue:
     assert data["pulses"][0]["status"] == "pending"
     assert data["pulses"][1]["id"] == 2
 
-    mock_queue.get_pulses_by_status.assert_called_once_with(status="pending", limit=20)
+    mock_queue.stream_pulses_by_status.assert_called_once_with(status="pending", limit=20)
 
 
 def test_list_pulses_failed(client: TestClient, auth_headers: dict, mock_queue: PulseQueue):
@@ -718,7 +831,7 @@ def test_list_pulses_failed(client: TestClient, auth_headers: dict, mock_queue:
             return failed_pulses
         return []
 
-    mock_queue.get_pulses_by_status = AsyncMock(side_effect=mock_get_pulses_by_status)
+    mock_queue.stream_pulses_by_status = _stream(mock_get_pulses_by_status)
 
     response = client.get("/api/pulse/list?status=failed", headers=auth_headers)
 
@@ -750,7 +863,7 @@ def test_list_pulses_completed(client: TestClient, auth_headers: dict, mock_queu
             return completed_pulses
         return []
 
-    mock_queue.get_pulses_by_status = AsyncMock(side_effect=mock_get_pulses_by_status)
+    mock_queue.stream_pulses_by_status = _stream(mock_get_pulses_by_status)
 
     response = client.get("/api/pulse/list?status=completed", headers=auth_headers)
 
@@ -779,7 +892,7 @@ def test_list_pulses_overdue(client: TestClient, auth_headers: dict, mock_queue:
             return overdue_pulses
         return []
 
-    mock_queue.get_pulses_by_status = AsyncMock(side_effect=mock_get_pulses_by_status)
+    mock_queue.stream_pulses_by_status = _stream(mock_get_pulses_by_status)
 
     response = client.get("/api/pulse/list?status=overdue", headers=auth_headers)
 
@@ -790,7 +903,7 @@ def test_list_pulses_overdue(client: TestClient, auth_headers: dict, mock_queue:
     # Note: status is still "pending" in the pulse object
     assert data["pulses"][0]["status"] == "pending"
 
-    mock_queue.get_pulses_by_status.assert_called_once_with(status="overdue", limit=20)
+    mock_queue.stream_pulses_by_status.assert_called_once_with(status="overdue", limit=20)
 
 
 def test_list_pulses_all(client: TestClient, auth_headers: dict, mock_queue: PulseQueue):
@@ -827,7 +940,7 @@ def test_list_pulses_all(client: TestClient, auth_headers: dict, mock_queue: Pul
             return all_pulses
         return []
 
-    mock_queue.get_pulses_by_status = AsyncMock(side_effect=mock_get_pulses_by_status)
+    mock_queue.stream_pulses_by_status = _stream(mock_get_pulses_by_status)
 
     response = client.get("/api/pulse/list?status=all", headers=auth_headers)
 
@@ -858,7 +971,7 @@ def test_list_pulses_limit(client: TestClient, auth_headers: dict, mock_queue: P
         # Return only up to the limit
         return many_pulses[:limit]
 
-    mock_queue.get_pulses_by_status = AsyncMock(side_effect=mock_get_pulses_by_status)
+    mock_queue.stream_pulses_by_status = _stream(mock_get_pulses_by_status)
 
     response = client.get("/api/pulse/list?status=pending&limit=5", headers=auth_headers)
 
@@ -867,7 +980,7 @@ def test_list_pulses_limit(client: TestClient, auth_headers: dict, mock_queue: P
     assert data["count"] == 5
     assert len(data["pulses"]) == 5
 
-    mock_queue.get_pulses_by_status.assert_called_once_with(status="pending", limit=5)
+    mock_queue.stream_pulses_by_status.assert_called_once_with(status="pending", limit=5)
 
 
 def test_list_pulses_invalid_status(client: TestClient, auth_headers: dict):
@@ -921,7 +1034,7 @@ def test_list_pulses_truncates_long_prompts(
     async def mock_get_pulses_by_status(status, limit):
         return pulses_with_long_prompt
 
-    mock_queue.get_pulses_by_status = AsyncMock(side_effect=mock_get_pulses_by_status)
+    mock_queue.stream_pulses_by_status = _stream(mock_get_pulses_by_status)
 
     response = client.get("/api/pulse/list?status=pending", headers=auth_headers)
 
@@ -932,6 +1045,20 @@ def test_list_pulses_truncates_long_prompts(
     assert data["pulses"][0]["prompt"].endswith("...")
 
 
+def test_list_pulses_queue_error(client: TestClient, auth_headers: dict, mock_queue: PulseQueue):
+    """Test list returns 500 when the queue fails mid-stream."""
+
+    async def mock_get_pulses_by_status(status, limit):
+        raise Exception("Database connection failed")
+
+    mock_queue.stream_pulses_by_status = _stream(mock_get_pulses_by_status)
+
+    response = client.get("/api/pulse/list?status=pending", headers=auth_headers)
+
+    assert response.status_code == 500
+    assert "Failed to retrieve pulses" in response.json()["detail"]
+
+
 # ========================================================================
 # GET /api/pulse/stats - Queue Statistics Tests
 # ========================================================================
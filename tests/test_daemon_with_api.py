@@ -29,6 +29,7 @@ def mock_config():
     config.pulse_api_port = 8765
     config.pulse_api_token = "test_token_123"
     config.pulse_max_concurrent = 5
+    config.pulse_max_subprocesses = None
     return config
 
 
@@ -43,7 +44,7 @@ def daemon(mock_config):
 
         # Mock queue methods
         daemon.queue.initialize = AsyncMock()
-        daemon.queue.get_due_pulses = AsyncMock(return_value=[])
+        daemon.queue.claim_due_pulses = AsyncMock(return_value=[])
         daemon.queue.close = AsyncMock()
 
         # Mock executor
@@ -5,7 +5,7 @@ Tests for debug tools: TimingBreakdown and trigger_pulse.
 import asyncio
 import logging
 import time
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -138,7 +138,9 @@ class TestExecutorDryRun:
     @pytest.mark.asyncio
     async def test_dry_run_does_not_spawn_subprocess(self, executor):
         """Test that dry_run doesn't actually spawn a subprocess."""
-        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
+        from tests.fixtures.hapi_streams import patch_subprocess_exec
+
+        with patch_subprocess_exec() as mock_subprocess:
             result = await executor.execute(
                 prompt="Test prompt",
                 dry_run=True,
@@ -191,19 +193,15 @@ class TestExecutorDryRun:
     @pytest.mark.asyncio
     async def test_normal_execution_still_works(self, executor):
         """Test that normal (non-dry-run) execution still spawns subprocess."""
-        from tests.fixtures.hapi_streams import success_stream
-
-        mock_process = AsyncMock()
-        mock_process.communicate.return_value = (
-            success_stream(session_id="test-123").encode(),
-            b"",
+        from tests.fixtures.hapi_streams import (
+            mock_hapi_process,
+            patch_subprocess_exec,
+            success_stream,
         )
-        mock_process.returncode = 0
 
-        with patch(
-            "asyncio.create_subprocess_exec",
-            return_value=mock_process,
-        ) as mock_subprocess:
+        mock_process = mock_hapi_process(success_stream(session_id="test-123").encode())
+
+        with patch_subprocess_exec(mock_process) as mock_subprocess:
             result = await executor.execute(
                 prompt="Test prompt",
                 dry_run=False,
@@ -0,0 +1,39 @@
+"""
+Unit tests for event loop selection utilities.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+from reeve.utils import event_loop
+
+
+def test_run_returns_coroutine_result():
+    """Test that run() executes the coroutine and returns its result."""
+
+    async def compute() -> int:
+        await asyncio.sleep(0)
+        return 42
+
+    assert event_loop.run(compute()) == 42
+
+
+def test_run_falls_back_to_default_loop_without_uvloop():
+    """Test that run() uses the standard asyncio loop when uvloop is unavailable."""
+
+    async def loop_module() -> str:
+        return type(asyncio.get_running_loop()).__module__
+
+    with patch.object(event_loop, "get_loop_factory", return_value=None):
+        assert event_loop.run(loop_module()).startswith("asyncio")
+
+
+def test_loop_implementation_names_running_loop():
+    """Test that loop_implementation() reports the running loop class."""
+
+    async def describe() -> str:
+        return event_loop.loop_implementation()
+
+    name = asyncio.run(describe())
+    assert name.startswith("asyncio.")
+    assert name.endswith("EventLoop")
@@ -4,12 +4,18 @@ Tests for Telegram Notifier MCP Server
 Tests the MCP tools provided by the Telegram Notifier MCP server.
 """
 
+import json
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import httpx
 import pytest
 
 
+def _sent_payload(call) -> dict:
+    """Decode the JSON body of a mocked `_client.post` call."""
+    return json.loads(call.kwargs["content"])
+
+
 class TestTelegramNotifierMCPTools:
     """Test the Telegram Notifier MCP tools."""
 
@@ -34,16 +40,14 @@ class TestTelegramNotifierMCPTools:
         mock_ctx = MagicMock()
         mock_ctx.session_id = "test-session-123"
 
-        # Mock httpx.AsyncClient
+        # Mock the shared httpx client
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
+        with patch.object(notification_module, "_client", mock_client):
             result = await send_notification(
                 ctx=mock_ctx,
                 message="Test notification",
@@ -55,13 +59,13 @@ class TestTelegramNotifierMCPTools:
             call_args = mock_client.post.call_args
 
             assert "sendMessage" in call_args[0][0]
-            assert call_args.kwargs["json"]["text"] == "Test notification"
-            assert call_args.kwargs["json"]["chat_id"] == "test_chat_456"
-            assert call_args.kwargs["json"]["disable_notification"] is False
+            assert _sent_payload(call_args)["text"] == "Test notification"
+            assert _sent_payload(call_args)["chat_id"] == "test_chat_456"
+            assert _sent_payload(call_args)["disable_notification"] is False
 
             # Verify auto-generated link button is present
-            assert "reply_markup" in call_args.kwargs["json"]
-            reply_markup = call_args.kwargs["json"]["reply_markup"]
+            assert "reply_markup" in _sent_payload(call_args)
+            reply_markup = _sent_payload(call_args)["reply_markup"]
             assert "inline_keyboard" in reply_markup
             link = "https://hapi.run/sessions/test-session-123"
             assert reply_markup["inline_keyboard"][0][0]["url"] == link
@@ -84,13 +88,11 @@ class TestTelegramNotifierMCPTools:
         mock_ctx = MagicMock()
         mock_ctx.session_id = "test-session-123"
 
-        # Mock httpx.AsyncClient to raise HTTPError
+        # Mock the shared httpx client to raise HTTPError
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(side_effect=httpx.HTTPError("Network error"))
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
+        with patch.object(notification_module, "_client", mock_client):
             result = await send_notification(
                 ctx=mock_ctx,
                 message="Test notification",
@@ -113,16 +115,14 @@ class TestTelegramNotifierMCPTools:
         mock_ctx = MagicMock()
         mock_ctx.session_id = "test-session-123"
 
-        # Mock httpx.AsyncClient
+        # Mock the shared httpx client
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
+        with patch.object(notification_module, "_client", mock_client):
             result = await send_notification(
                 ctx=mock_ctx,
                 message="Silent notification",
@@ -131,7 +131,7 @@ class TestTelegramNotifierMCPTools:
 
             # Verify disable_notification is True for silent priority
             call_args = mock_client.post.call_args
-            assert call_args.kwargs["json"]["disable_notification"] is True
+            assert _sent_payload(call_args)["disable_notification"] is True
             assert "✓ Notification with link sent successfully (silent)" in result
 
     @pytest.mark.asyncio
@@ -148,16 +148,14 @@ class TestTelegramNotifierMCPTools:
         mock_ctx = MagicMock()
         type(mock_ctx).session_id = PropertyMock(side_effect=RuntimeError("No session"))
 
-        # Mock httpx.AsyncClient
+        # Mock the shared httpx client
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
+        with patch.object(notification_module, "_client", mock_client):
             result = await send_notification(
                 ctx=mock_ctx,
                 message="Test notification",
@@ -165,5 +163,320 @@ class TestTelegramNotifierMCPTools:
 
             # Verify no link button is present
             call_args = mock_client.post.call_args
-            assert "reply_markup" not in call_args.kwargs["json"]
+            assert "reply_markup" not in _sent_payload(call_args)
             assert "✓ Notification sent successfully" in result
+
+    @pytest.mark.asyncio
+    async def test_lifespan_closes_shared_client(self):
+        """Test that the server lifespan closes the shared Telegram client."""
+        import importlib
+
+        import reeve.mcp.notification_server as notification_module
+
+        importlib.reload(notification_module)
+
+        mock_client = AsyncMock()
+        with patch.object(notification_module, "_client", mock_client):
+            async with notification_module._lifespan(notification_module.mcp):
+                mock_client.aclose.assert_not_called()
+
+            mock_client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_send_notification_retries_transient_errors(self):
+        """Test that 5xx responses and connection errors are retried with backoff."""
+        import importlib
+
+        import reeve.mcp.notification_server as notification_module
+
+        importlib.reload(notification_module)
+        from reeve.mcp.notification_server import send_notification
+
+        mock_ctx = MagicMock()
+        mock_ctx.session_id = None
+
+        unavailable = MagicMock(status_code=503)
+        ok = MagicMock(status_code=200)
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(
+            side_effect=[httpx.ConnectError("Connection reset"), unavailable, ok]
+        )
+
+        with (
+            patch.object(notification_module, "_client", mock_client),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            result = await send_notification(ctx=mock_ctx, message="Test notification")
+
+        assert mock_client.post.call_count == 3
+        assert mock_sleep.await_count == 2
+        # Exponential backoff: 1s then 2s base, plus up to 50% jitter
+        first_delay = mock_sleep.await_args_list[0].args[0]
+        second_delay = mock_sleep.await_args_list[1].args[0]
+        assert 1.0 <= first_delay <= 1.5
+        assert 2.0 <= second_delay <= 3.0
+        assert "✓ Notification sent successfully" in result
+
+    @pytest.mark.asyncio
+    async def test_send_notification_honors_retry_after(self):
+        """Test that a 429 response waits for the Retry-After interval."""
+        import importlib
+
+        import reeve.mcp.notification_server as notification_module
+
+        importlib.reload(notification_module)
+        from reeve.mcp.notification_server import send_notification
+
+        mock_ctx = MagicMock()
+        mock_ctx.session_id = None
+
+        rate_limited = MagicMock(status_code=429, headers={"Retry-After": "7"})
+        ok = MagicMock(status_code=200)
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(side_effect=[rate_limited, ok])
+
+        with (
+            patch.object(notification_module, "_client", mock_client),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            result = await send_notification(ctx=mock_ctx, message="Test notification")
+
+        mock_sleep.assert_awaited_once_with(7.0)
+        assert "✓ Notification sent successfully" in result
+
+    @pytest.mark.asyncio
+    async def test_send_notification_does_not_retry_client_errors(self):
+        """Test that 4xx responses (other than 429) fail without retrying."""
+        import importlib
+
+        import reeve.mcp.notification_server as notification_module
+
+        importlib.reload(notification_module)
+        from reeve.mcp.notification_server import send_notification
+
+        mock_ctx = MagicMock()
+        mock_ctx.session_id = None
+
+        bad_request = MagicMock(status_code=400)
+        bad_request.raise_for_status = MagicMock(
+            side_effect=httpx.HTTPStatusError(
+                "Bad Request", request=MagicMock(), response=MagicMock()
+            )
+        )
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=bad_request)
+
+        with (
+            patch.object(notification_module, "_client", mock_client),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            result = await send_notification(ctx=mock_ctx, message="Test notification")
+
+        mock_client.post.assert_called_once()
+        mock_sleep.assert_not_awaited()
+        assert "✗ Failed to send notification" in result
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_allows_burst_then_waits(self):
+        """Test that the token-bucket limiter spaces acquisitions once drained."""
+        import importlib
+
+        import reeve.mcp.notification_server as notification_module
+
+        importlib.reload(notification_module)
+
+        with (
+            patch.object(notification_module.time, "monotonic", return_value=100.0),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            limiter = notification_module._RateLimiter(2, 1.0)
+
+            # Bucket starts full: two tokens go out immediately
+            await limiter.acquire()
+            await limiter.acquire()
+            mock_sleep.assert_not_awaited()
+
+            # Third acquisition waits for one token to refill (0.5s at 2/sec)
+            await limiter.acquire()
+            mock_sleep.assert_awaited_once_with(0.5)
+
+    @pytest.mark.asyncio
+    async def test_send_notification_suppresses_recent_duplicates(self):
+        """Test that an identical message within the dedup window is not re-sent."""
+        import importlib
+
+        import reeve.mcp.notification_server as notification_module
+
+        importlib.reload(notification_module)
+        from reeve.mcp.notification_server import send_notification
+
+        mock_ctx = MagicMock()
+        mock_ctx.session_id = None
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=MagicMock(status_code=200))
+
+        # Patch sleep so the per-chat rate limiter doesn't slow the test down
+        with (
+            patch.object(notification_module, "_client", mock_client),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            first = await send_notification(ctx=mock_ctx, message="Flight UA123 delayed")
+            second = await send_notification(ctx=mock_ctx, message="Flight UA123 delayed")
+            different = await send_notification(ctx=mock_ctx, message="Flight UA123 boarding")
+
+        assert "✓ Notification sent successfully" in first
+        assert "suppressed (duplicate within 60s)" in second
+        assert "✓ Notification sent successfully" in different
+        assert mock_client.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_send_notification_failure_is_not_deduplicated(self):
+        """Test that a failed send doesn't suppress the retry of the same message."""
+        import importlib
+
+        import reeve.mcp.notification_server as notification_module
+
+        importlib.reload(notification_module)
+        from reeve.mcp.notification_server import send_notification
+
+        mock_ctx = MagicMock()
+        mock_ctx.session_id = None
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(
+            side_effect=[httpx.HTTPError("Network error"), MagicMock(status_code=200)]
+        )
+
+        with (
+            patch.object(notification_module, "_client", mock_client),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            first = await send_notification(ctx=mock_ctx, message="Test notification")
+            second = await send_notification(ctx=mock_ctx, message="Test notification")
+
+        assert "✗ Failed to send notification" in first
+        assert "✓ Notification sent successfully" in second
+
+    @pytest.mark.asyncio
+    async def test_send_notifications_batch(self):
+        """Test sending several notifications in one call with per-item results."""
+        import importlib
+
+        import reeve.mcp.notification_server as notification_module
+
+        importlib.reload(notification_module)
+        from reeve.mcp.notification_server import NotificationSpec, send_notifications_batch
+
+        mock_ctx = MagicMock()
+        mock_ctx.session_id = "test-session-123"
+
+        ok = MagicMock(status_code=200)
+        bad_request = MagicMock(status_code=400)
+        bad_request.raise_for_status = MagicMock(
+            side_effect=httpx.HTTPStatusError("Bad Request", request=MagicMock(), response=ok)
+        )
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(side_effect=[ok, bad_request])
+
+        with (
+            patch.object(notification_module, "_client", mock_client),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            result = await send_notifications_batch(
+                ctx=mock_ctx,
+                notifications=[
+                    NotificationSpec(message="Flight UA123 delayed", priority="critical"),
+                    NotificationSpec(message="*Bad* markdown", parse_mode="MarkdownV2"),
+                ],
+            )
+
+        lines = result.split("\n")
+        assert lines[0] == "1. ✓ Notification with link sent successfully (critical)"
+        assert lines[1].startswith("2. ✗ Failed to send notification")
+
+        payloads = [_sent_payload(call) for call in mock_client.post.call_args_list]
+        assert [p["text"] for p in payloads] == ["Flight UA123 delayed", "*Bad* markdown"]
+        assert all("reply_markup" in p for p in payloads)
+
+    @pytest.mark.asyncio
+    async def test_batch_tool_schema_lists_notification_fields(self):
+        """Test that the batch tool is registered with a typed notifications schema."""
+        import importlib
+
+        import reeve.mcp.notification_server as notification_module
+
+        importlib.reload(notification_module)
+
+        tools = {tool.name: tool for tool in await notification_module.mcp.list_tools()}
+        schema = tools["send_notifications_batch"].inputSchema
+
+        assert "notifications" in schema["required"]
+        assert "ctx" not in schema["properties"]
+
+    @pytest.mark.asyncio
+    async def test_payload_is_compact_utf8_json(self):
+        """Test that the request body is compact JSON with emoji left unescaped."""
+        import importlib
+
+        import reeve.mcp.notification_server as notification_module
+
+        importlib.reload(notification_module)
+        from reeve.mcp.notification_server import send_notification
+
+        mock_ctx = MagicMock()
+        mock_ctx.session_id = None
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=MagicMock(status_code=200))
+
+        with patch.object(notification_module, "_client", mock_client):
+            await send_notification(ctx=mock_ctx, message="🔔 Powder Alert")
+
+        call_args = mock_client.post.call_args
+        body = call_args.kwargs["content"]
+        assert call_args.kwargs["headers"]["Content-Type"] == "application/json"
+        assert "🔔 Powder Alert".encode() in body
+        assert b": " not in body and b", " not in body
+
+    @pytest.mark.asyncio
+    async def test_fire_and_forget_returns_before_send_and_drains_on_shutdown(self):
+        """Test that fire-and-forget sends are queued and awaited by the lifespan."""
+        import asyncio
+        import importlib
+
+        import reeve.mcp.notification_server as notification_module
+
+        importlib.reload(notification_module)
+        from reeve.mcp.notification_server import send_notification
+
+        mock_ctx = MagicMock()
+        mock_ctx.session_id = None
+
+        release = asyncio.Event()
+
+        async def slow_post(*args, **kwargs):
+            await release.wait()
+            return MagicMock(status_code=200)
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(side_effect=slow_post)
+
+        with patch.object(notification_module, "_client", mock_client):
+            async with notification_module._lifespan(notification_module.mcp):
+                result = await send_notification(
+                    ctx=mock_ctx, message="Still processing", fire_and_forget=True
+                )
+
+                assert result == "✓ Notification queued (normal)"
+                assert len(notification_module._background_sends) == 1
+                release.set()
+
+            # Lifespan exit waited for the queued send before closing the client
+            mock_client.post.assert_awaited_once()
+            mock_client.aclose.assert_awaited_once()
+            assert not notification_module._background_sends
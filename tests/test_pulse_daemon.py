@@ -10,7 +10,7 @@ Tests the daemon's core functionality:
 
 import asyncio
 import signal
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -36,6 +36,7 @@ def mock_config():
     config.pulse_api_port = 8765
     config.pulse_api_token = "test_token_123"
     config.pulse_max_concurrent = 5
+    config.pulse_max_subprocesses = None
     return config
 
 
@@ -43,8 +44,9 @@ def mock_config():
 def mock_queue():
     """Mock PulseQueue with AsyncMock."""
     queue = AsyncMock()
-    queue.get_due_pulses = AsyncMock(return_value=[])
-    queue.mark_processing = AsyncMock(return_value=True)
+    queue.claim_due_pulses = AsyncMock(return_value=[])
+    queue.get_next_scheduled_at = AsyncMock(return_value=None)
+    queue.change_token = MagicMock(return_value=None)
     queue.mark_completed = AsyncMock()
     queue.mark_failed = AsyncMock(return_value=None)
     queue.close = AsyncMock()
@@ -95,6 +97,13 @@ def mock_pulse():
     return pulse
 
 
+async def execute_pulse(daemon, pulse):
+    """Run daemon._execute_pulse with the fields the scheduler extracts from a claimed row."""
+    await daemon._execute_pulse(
+        pulse.id, pulse.prompt, pulse.session_id, pulse.sticky_notes, pulse.max_retries
+    )
+
+
 # ============================================================================
 # Pulse Execution Tests (6 tests)
 # ============================================================================
@@ -103,7 +112,7 @@ def mock_pulse():
 @pytest.mark.asyncio
 async def test_execute_pulse_success(daemon, mock_pulse):
     """Test successful pulse execution marks as COMPLETED with duration."""
-    await daemon._execute_pulse(mock_pulse)
+    await execute_pulse(daemon, mock_pulse)
 
     # Should mark as completed with duration
     daemon.queue.mark_completed.assert_called_once()
@@ -117,7 +126,7 @@ async def test_execute_pulse_with_sticky_notes(daemon, mock_pulse):
     """Test pulse execution uses executor.build_prompt() with sticky notes."""
     mock_pulse.sticky_notes = ["Check ticket prices", "Follow up on email"]
 
-    await daemon._execute_pulse(mock_pulse)
+    await execute_pulse(daemon, mock_pulse)
 
     # Should call build_prompt with sticky notes
     daemon.executor.build_prompt.assert_called_once_with(mock_pulse.prompt, mock_pulse.sticky_notes)
@@ -128,7 +137,7 @@ async def test_execute_pulse_with_session_id(daemon, mock_pulse):
     """Test pulse execution passes session_id to executor."""
     mock_pulse.session_id = "resume-session-456"
 
-    await daemon._execute_pulse(mock_pulse)
+    await execute_pulse(daemon, mock_pulse)
 
     # Should pass session_id to execute()
     daemon.executor.execute.assert_called_once()
@@ -141,7 +150,7 @@ async def test_execute_pulse_failure_marks_failed(daemon, mock_pulse):
     """Test executor failure calls mark_failed() with error message."""
     daemon.executor.execute.side_effect = RuntimeError("Hapi crashed")
 
-    await daemon._execute_pulse(mock_pulse)
+    await execute_pulse(daemon, mock_pulse)
 
     # Should mark as failed with error
     daemon.queue.mark_failed.assert_called_once()
@@ -157,7 +166,7 @@ async def test_execute_pulse_failure_creates_retry(daemon, mock_pulse):
     daemon.executor.execute.side_effect = RuntimeError("Network error")
     daemon.queue.mark_failed.return_value = 999  # Retry pulse ID
 
-    await daemon._execute_pulse(mock_pulse)
+    await execute_pulse(daemon, mock_pulse)
 
     # Should log retry pulse ID
     daemon.queue.mark_failed.assert_called_once()
@@ -180,7 +189,7 @@ async def test_execute_pulse_tracks_duration(daemon, mock_pulse):
 
     daemon.executor.execute.side_effect = delayed_execute
 
-    await daemon._execute_pulse(mock_pulse)
+    await execute_pulse(daemon, mock_pulse)
 
     # Duration should be >= 10ms
     call_args = daemon.queue.mark_completed.call_args
@@ -189,15 +198,15 @@ async def test_execute_pulse_tracks_duration(daemon, mock_pulse):
 
 
 # ============================================================================
-# Scheduler Loop Tests (8 tests)
+# Scheduler Loop Tests (12 tests)
 # ============================================================================
 
 
 @pytest.mark.asyncio
 async def test_scheduler_loop_gets_due_pulses(daemon, mock_pulse):
-    """Test scheduler calls get_due_pulses with limit based on available slots."""
+    """Test scheduler calls claim_due_pulses with limit based on available slots."""
     daemon.running = True
-    daemon.queue.get_due_pulses.return_value = []
+    daemon.queue.claim_due_pulses.return_value = []
 
     # Run for 1 iteration
     task = asyncio.create_task(daemon._scheduler_loop())
@@ -211,9 +220,9 @@ async def test_scheduler_loop_gets_due_pulses(daemon, mock_pulse):
     except asyncio.CancelledError:
         pass
 
-    # Should have called get_due_pulses with limit=min(10, max_concurrent)=5
-    assert daemon.queue.get_due_pulses.called
-    daemon.queue.get_due_pulses.assert_called_with(limit=5)
+    # Should have called claim_due_pulses with limit=min(10, max_concurrent)=5
+    assert daemon.queue.claim_due_pulses.called
+    daemon.queue.claim_due_pulses.assert_called_with(limit=5)
 
 
 @pytest.mark.asyncio
@@ -221,7 +230,7 @@ async def test_scheduler_loop_spawns_tasks(daemon, mock_pulse):
     """Test scheduler spawns asyncio tasks for each pulse."""
     daemon.running = True
     # Return pulse once, then empty list
-    daemon.queue.get_due_pulses.side_effect = [[mock_pulse], []]
+    daemon.queue.claim_due_pulses.side_effect = [[mock_pulse], []]
 
     # Run scheduler
     task = asyncio.create_task(daemon._scheduler_loop())
@@ -236,15 +245,16 @@ async def test_scheduler_loop_spawns_tasks(daemon, mock_pulse):
         pass
 
     # Should have marked as processing and executed
-    daemon.queue.mark_processing.assert_called_once_with(mock_pulse.id)
+    daemon.queue.claim_due_pulses.assert_any_call(limit=5)
+    daemon.executor.execute.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_scheduler_loop_skips_already_processing(daemon, mock_pulse):
-    """Test scheduler skips pulses that are already processing."""
+async def test_scheduler_loop_skips_pulses_claimed_elsewhere(daemon, mock_pulse):
+    """Test scheduler executes nothing when the claim finds no pending due pulses."""
     daemon.running = True
-    daemon.queue.get_due_pulses.return_value = [mock_pulse]
-    daemon.queue.mark_processing.return_value = False  # Already processing
+    # Due pulse already claimed (e.g., by another daemon): the claim returns nothing
+    daemon.queue.claim_due_pulses.return_value = []
 
     # Run scheduler
     task = asyncio.create_task(daemon._scheduler_loop())
@@ -284,8 +294,8 @@ async def test_scheduler_loop_respects_priority(daemon):
     )
     pulse_normal.id = 2
 
-    # get_due_pulses should return in priority order (mocked), then empty
-    daemon.queue.get_due_pulses.side_effect = [[pulse_critical, pulse_normal], []]
+    # claim_due_pulses should return in priority order (mocked), then empty
+    daemon.queue.claim_due_pulses.side_effect = [[pulse_critical, pulse_normal], []]
 
     # Run scheduler
     task = asyncio.create_task(daemon._scheduler_loop())
@@ -300,14 +310,14 @@ async def test_scheduler_loop_respects_priority(daemon):
         pass
 
     # Should have processed both pulses
-    assert daemon.queue.mark_processing.call_count == 2
+    assert daemon.executor.execute.call_count == 2
 
 
 @pytest.mark.asyncio
 async def test_scheduler_loop_polls_every_second(daemon):
     """Test scheduler sleeps 1 second between iterations."""
     daemon.running = True
-    daemon.queue.get_due_pulses.return_value = []
+    daemon.queue.claim_due_pulses.return_value = []
 
     start_time = asyncio.get_event_loop().time()
 
@@ -325,15 +335,15 @@ async def test_scheduler_loop_polls_every_second(daemon):
 
     elapsed = asyncio.get_event_loop().time() - start_time
 
-    # Should have called get_due_pulses 2-3 times in ~2.5 seconds
-    assert daemon.queue.get_due_pulses.call_count >= 2
+    # Should have called claim_due_pulses 2-3 times in ~2.5 seconds
+    assert daemon.queue.claim_due_pulses.call_count >= 2
 
 
 @pytest.mark.asyncio
 async def test_scheduler_loop_handles_database_errors(daemon):
     """Test scheduler backs off 5s on database errors without crashing."""
     daemon.running = True
-    daemon.queue.get_due_pulses.side_effect = [
+    daemon.queue.claim_due_pulses.side_effect = [
         Exception("Database connection lost"),
         [],  # Recovers on second call
     ]
@@ -350,8 +360,8 @@ async def test_scheduler_loop_handles_database_errors(daemon):
     except asyncio.CancelledError:
         pass
 
-    # Should have called get_due_pulses at least twice (error + recovery)
-    assert daemon.queue.get_due_pulses.call_count >= 1
+    # Should have called claim_due_pulses at least twice (error + recovery)
+    assert daemon.queue.claim_due_pulses.call_count >= 1
 
 
 @pytest.mark.asyncio
@@ -372,7 +382,7 @@ async def test_scheduler_loop_concurrent_execution(daemon):
         pulses.append(pulse)
 
     # Return pulses once, then empty list
-    daemon.queue.get_due_pulses.side_effect = [pulses, []]
+    daemon.queue.claim_due_pulses.side_effect = [pulses, []]
 
     # Run scheduler
     task = asyncio.create_task(daemon._scheduler_loop())
@@ -387,14 +397,14 @@ async def test_scheduler_loop_concurrent_execution(daemon):
         pass
 
     # Should have marked all 3 as processing
-    assert daemon.queue.mark_processing.call_count == 3
+    assert daemon.executor.execute.call_count == 3
 
 
 @pytest.mark.asyncio
 async def test_scheduler_loop_stops_on_shutdown(daemon):
     """Test scheduler exits when running=False."""
     daemon.running = True
-    daemon.queue.get_due_pulses.return_value = []
+    daemon.queue.claim_due_pulses.return_value = []
 
     # Start scheduler
     task = asyncio.create_task(daemon._scheduler_loop())
@@ -408,6 +418,153 @@ async def test_scheduler_loop_stops_on_shutdown(daemon):
     assert task.done()
 
 
+@pytest.mark.asyncio
+async def test_scheduler_loop_wake_checks_queue_immediately(daemon):
+    """Test wake() cuts the scheduler's idle wait short."""
+    daemon.running = True
+    daemon.queue.claim_due_pulses.return_value = []
+
+    task = asyncio.create_task(daemon._scheduler_loop())
+    await asyncio.sleep(0.1)
+    assert daemon.queue.claim_due_pulses.call_count == 1
+
+    # Well under the 1s idle wait
+    daemon.wake()
+    await asyncio.sleep(0.05)
+    assert daemon.queue.claim_due_pulses.call_count == 2
+
+    daemon.running = False
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_scheduler_loop_sleeps_until_next_pulse(daemon):
+    """Test scheduler re-checks when the next pending pulse is due, not a full second later."""
+    daemon.running = True
+    daemon.queue.claim_due_pulses.return_value = []
+    daemon.queue.get_next_scheduled_at.side_effect = [
+        datetime.now(timezone.utc) + timedelta(seconds=0.2),
+        None,
+        None,
+    ]
+
+    task = asyncio.create_task(daemon._scheduler_loop())
+    await asyncio.sleep(0.5)
+    daemon.running = False
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+    # Initial check, then a second one at ~0.2s when the next pulse came due
+    assert daemon.queue.claim_due_pulses.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_scheduler_loop_releases_finished_pulse_tasks(daemon, mock_pulse):
+    """Test a finished pulse's task isn't kept alive while the scheduler sleeps."""
+    import gc
+    import weakref
+
+    daemon.running = True
+    daemon.queue.claim_due_pulses.side_effect = [[mock_pulse], [], [], []]
+    del mock_pulse  # Drop the fixture's reference to the claimed row
+
+    task = asyncio.create_task(daemon._scheduler_loop())
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    (pulse_task,) = daemon.executing_pulses
+    pulse_ref = weakref.ref(pulse_task)
+    del pulse_task
+
+    # The pulse finishes (~10ms) while the scheduler is idle
+    await asyncio.sleep(0.1)
+    gc.collect()
+    assert daemon.executing_pulses == set()
+    assert pulse_ref() is None
+
+    daemon.running = False
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_scheduler_loop_drains_burst_before_sleeping(daemon):
+    """Test scheduler keeps claiming while claims come back full, then sleeps once."""
+    daemon.running = True
+
+    def make_pulses(first_id, count):
+        pulses = []
+        for pulse_id in range(first_id, first_id + count):
+            pulse = Pulse(scheduled_at=datetime.now(timezone.utc), prompt=f"Pulse {pulse_id}")
+            pulse.id = pulse_id
+            pulses.append(pulse)
+        return pulses
+
+    # Two full claims (5 free slots each time), then the queue runs dry
+    daemon.queue.claim_due_pulses.side_effect = [
+        make_pulses(1, 5),
+        make_pulses(6, 5),
+        make_pulses(11, 2),
+        [],
+    ]
+
+    task = asyncio.create_task(daemon._scheduler_loop())
+    await asyncio.sleep(0.3)
+    daemon.running = False
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+    # All 12 pulses ran; only the partial claim looked up the next pulse time
+    assert daemon.executor.execute.call_count == 12
+    assert daemon.queue.claim_due_pulses.call_count == 3
+    daemon.queue.get_next_scheduled_at.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_loop_wakes_on_database_change(daemon):
+    """Test scheduler re-checks when another process commits to a watched database."""
+    daemon.running = True
+    daemon.queue.claim_due_pulses.return_value = []
+    token = [((1, 100), (0, 0))]
+    daemon.queue.change_token = MagicMock(side_effect=lambda: token[0])
+
+    task = asyncio.create_task(daemon._scheduler_loop())
+    await asyncio.sleep(0.4)
+    # Idle with no changes: several 0.25s stat checks, but no re-query
+    assert daemon.queue.claim_due_pulses.call_count == 1
+
+    # Another process commits (WAL grows)
+    token[0] = ((1, 100), (2, 4096))
+    await asyncio.sleep(0.35)
+    assert daemon.queue.claim_due_pulses.call_count == 2
+
+    daemon.running = False
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+def test_daemon_registers_wake_with_queue(mock_config):
+    """Test the daemon's queue wakes the scheduler when pulses are scheduled in-process."""
+    daemon = PulseDaemon(mock_config)
+
+    assert daemon.queue.on_pulse_scheduled == daemon.wake
+
+
 # ============================================================================
 # Concurrency Limit Tests
 # ============================================================================
@@ -418,6 +575,7 @@ async def test_scheduler_respects_max_concurrent_limit(daemon):
     """Test that scheduler doesn't exceed max_concurrent pulses."""
     daemon.running = True
     daemon.max_concurrent = 2  # Limit to 2 concurrent
+    daemon._slots = asyncio.Semaphore(2)
 
     # Create 5 pulses
     pulses = []
@@ -432,17 +590,17 @@ async def test_scheduler_respects_max_concurrent_limit(daemon):
         pulses.append(pulse)
 
     # Return all 5 pulses (scheduler should limit what it fetches)
-    daemon.queue.get_due_pulses.return_value = pulses[:2]  # Return only up to limit
+    daemon.queue.claim_due_pulses.return_value = pulses[:2]  # Return only up to limit
 
     # Track actual fetch limit used
     fetch_limits_used = []
-    original_get_due_pulses = daemon.queue.get_due_pulses
+    original_claim_due_pulses = daemon.queue.claim_due_pulses
 
     async def track_fetch_limit(limit):
         fetch_limits_used.append(limit)
-        return await original_get_due_pulses(limit=limit)
+        return await original_claim_due_pulses(limit=limit)
 
-    daemon.queue.get_due_pulses = AsyncMock(side_effect=track_fetch_limit)
+    daemon.queue.claim_due_pulses = AsyncMock(side_effect=track_fetch_limit)
 
     # Run scheduler for one iteration
     task = asyncio.create_task(daemon._scheduler_loop())
@@ -457,7 +615,7 @@ async def test_scheduler_respects_max_concurrent_limit(daemon):
         pass
 
     # Should have fetched with limit=min(10, max_concurrent)=2
-    assert daemon.queue.get_due_pulses.called
+    assert daemon.queue.claim_due_pulses.called
     assert fetch_limits_used[0] == 2
 
 
@@ -466,18 +624,21 @@ async def test_scheduler_waits_when_at_capacity(daemon):
     """Test that scheduler waits when at max capacity."""
     daemon.running = True
     daemon.max_concurrent = 2
+    daemon._slots = asyncio.Semaphore(2)
 
-    # Pre-populate executing_pulses to simulate full capacity
+    # Take both slots to simulate full capacity
     async def slow_task():
         await asyncio.sleep(10)  # Long-running task
 
+    for _ in range(2):
+        await daemon._slots.acquire()
     task1 = asyncio.create_task(slow_task())
     task2 = asyncio.create_task(slow_task())
     daemon.executing_pulses = {task1, task2}
 
     # Reset the mock to track calls
-    daemon.queue.get_due_pulses.reset_mock()
-    daemon.queue.get_due_pulses.return_value = []
+    daemon.queue.claim_due_pulses.reset_mock()
+    daemon.queue.claim_due_pulses.return_value = []
 
     # Run scheduler for a brief time
     scheduler_task = asyncio.create_task(daemon._scheduler_loop())
@@ -502,8 +663,8 @@ async def test_scheduler_waits_when_at_capacity(daemon):
     except asyncio.CancelledError:
         pass
 
-    # Should NOT have called get_due_pulses since we were at capacity
-    daemon.queue.get_due_pulses.assert_not_called()
+    # Should NOT have called claim_due_pulses since we were at capacity
+    daemon.queue.claim_due_pulses.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -511,6 +672,7 @@ async def test_scheduler_resumes_after_capacity_freed(daemon):
     """Test that scheduler resumes execution after a slot frees up."""
     daemon.running = True
     daemon.max_concurrent = 2
+    daemon._slots = asyncio.Semaphore(2)
 
     # Create a quick-completing task to simulate a slot freeing up
     quick_task_completed = asyncio.Event()
@@ -520,6 +682,8 @@ async def test_scheduler_resumes_after_capacity_freed(daemon):
         quick_task_completed.set()
 
     # Start at capacity with one quick task
+    for _ in range(2):
+        await daemon._slots.acquire()
     quick = asyncio.create_task(quick_task())
 
     async def slow_task():
@@ -529,8 +693,8 @@ async def test_scheduler_resumes_after_capacity_freed(daemon):
     daemon.executing_pulses = {quick, slow}
 
     # Add done callbacks like the real scheduler does
-    quick.add_done_callback(daemon.executing_pulses.discard)
-    slow.add_done_callback(daemon.executing_pulses.discard)
+    quick.add_done_callback(daemon._on_pulse_done)
+    slow.add_done_callback(daemon._on_pulse_done)
 
     # Create a pulse to be fetched after capacity frees
     new_pulse = Pulse(
@@ -544,14 +708,14 @@ async def test_scheduler_resumes_after_capacity_freed(daemon):
     # Initially return empty (at capacity), then return pulse after quick task completes
     call_count = 0
 
-    async def conditional_get_due_pulses(limit):
+    async def conditional_claim_due_pulses(limit):
         nonlocal call_count
         call_count += 1
         if quick_task_completed.is_set():
             return [new_pulse]
         return []
 
-    daemon.queue.get_due_pulses = AsyncMock(side_effect=conditional_get_due_pulses)
+    daemon.queue.claim_due_pulses = AsyncMock(side_effect=conditional_claim_due_pulses)
 
     # Run scheduler
     scheduler_task = asyncio.create_task(daemon._scheduler_loop())
@@ -575,9 +739,9 @@ async def test_scheduler_resumes_after_capacity_freed(daemon):
         pass
 
     # Should have eventually fetched and processed the new pulse
-    assert daemon.queue.get_due_pulses.called
-    # Should have called mark_processing for the new pulse after capacity freed
-    daemon.queue.mark_processing.assert_called_with(99)
+    assert daemon.queue.claim_due_pulses.called
+    # Should have executed the new pulse after capacity freed
+    assert daemon.executor.execute.call_args.kwargs["prompt"] == "New pulse after capacity freed"
 
 
 # ============================================================================
@@ -616,7 +780,8 @@ async def test_shutdown_waits_for_in_flight(daemon):
     # All tasks should be complete
     assert task1.done()
     assert task2.done()
-    assert len(daemon.executing_pulses) == 2  # Set not auto-cleared in this test
+    # Finished tasks are released rather than held until shutdown completes
+    assert daemon.executing_pulses == set()
 
 
 @pytest.mark.asyncio
@@ -634,8 +799,8 @@ async def test_shutdown_timeout_cancels_tasks(daemon):
     task = asyncio.create_task(never_completes())
     daemon.executing_pulses = {task}
 
-    # Mock wait_for to timeout immediately
-    with patch("asyncio.wait_for", side_effect=asyncio.TimeoutError):
+    # Shorten the grace period so the wait times out immediately
+    with patch("reeve.pulse.daemon._SHUTDOWN_GRACE_PERIOD", 0.01):
         await daemon._handle_shutdown(signal.SIGTERM)
 
     # Give task a moment to process cancellation
@@ -667,7 +832,7 @@ async def test_shutdown_closes_resources(daemon):
 @pytest.mark.asyncio
 async def test_daemon_full_lifecycle(daemon, mock_pulse):
     """Test full daemon lifecycle: start, execute pulse, shutdown."""
-    daemon.queue.get_due_pulses.return_value = [mock_pulse]
+    daemon.queue.claim_due_pulses.return_value = [mock_pulse]
 
     # Mock the API server (not part of this test's focus)
     with patch.object(daemon, "_run_api_server", new_callable=AsyncMock):
@@ -687,7 +852,7 @@ async def test_daemon_full_lifecycle(daemon, mock_pulse):
         await start_task
 
         # Pulse should have been executed
-        daemon.queue.mark_processing.assert_called()
+        daemon.queue.claim_due_pulses.assert_called()
         daemon.executor.execute.assert_called()
         daemon.queue.mark_completed.assert_called()
 
@@ -708,7 +873,7 @@ async def test_daemon_concurrent_execution(daemon):
         pulses.append(pulse)
 
     # Return pulses once, then empty list
-    daemon.queue.get_due_pulses.side_effect = [pulses, []]
+    daemon.queue.claim_due_pulses.side_effect = [pulses, []]
 
     # Start scheduler
     daemon.running = True
@@ -723,8 +888,8 @@ async def test_daemon_concurrent_execution(daemon):
     except asyncio.CancelledError:
         pass
 
-    # All 5 pulses should be marked as processing
-    assert daemon.queue.mark_processing.call_count == 5
+    # All 5 claimed pulses should have been executed
+    assert daemon.executor.execute.call_count == 5
 
 
 @pytest.mark.asyncio
@@ -754,7 +919,7 @@ async def test_daemon_error_recovery(daemon, mock_pulse):
     pulse2.id = 2
 
     # Return pulses one at a time
-    daemon.queue.get_due_pulses.side_effect = [[pulse1], [pulse2], []]
+    daemon.queue.claim_due_pulses.side_effect = [[pulse1], [pulse2], []]
 
     # Start scheduler
     task = asyncio.create_task(daemon._scheduler_loop())
@@ -769,6 +934,6 @@ async def test_daemon_error_recovery(daemon, mock_pulse):
         pass
 
     # Should have processed both pulses
-    assert daemon.queue.mark_processing.call_count >= 2
+    assert daemon.executor.execute.call_count >= 2
     daemon.queue.mark_failed.assert_called_once()  # First pulse failed
     daemon.queue.mark_completed.assert_called_once()  # Second pulse succeeded
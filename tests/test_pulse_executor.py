@@ -10,11 +10,12 @@ Tests pulse execution by launching Hapi sessions, including:
 
 import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
 from reeve.pulse.executor import ExecutionResult, PulseExecutor
+from tests.fixtures.hapi_streams import mock_hapi_process, patch_subprocess_exec
 
 
 @pytest.fixture
@@ -96,11 +97,9 @@ async def test_execute_basic_success(executor, mock_desk):
     # Mock stream-json output with session_id
     stream_output = success_stream(session_id="test-session-123")
 
-    mock_process = AsyncMock()
-    mock_process.communicate = AsyncMock(return_value=(stream_output.encode(), b""))
-    mock_process.returncode = 0
+    mock_process = mock_hapi_process(stream_output.encode(), b"", returncode=0)
 
-    with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+    with patch_subprocess_exec(mock_process):
         result = await executor.execute(
             prompt="Test prompt",
             working_dir=str(mock_desk),
@@ -120,11 +119,9 @@ async def test_execute_with_session_id(executor, mock_desk):
 
     stream_output = success_stream(session_id="session-123")
 
-    mock_process = AsyncMock()
-    mock_process.communicate = AsyncMock(return_value=(stream_output.encode(), b""))
-    mock_process.returncode = 0
+    mock_process = mock_hapi_process(stream_output.encode(), b"", returncode=0)
 
-    with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+    with patch_subprocess_exec(mock_process) as mock_exec:
         result = await executor.execute(
             prompt="Continue work",
             session_id="session-123",
@@ -148,13 +145,9 @@ async def test_execute_with_stderr(executor, mock_desk):
 
     stream_output = success_stream(session_id="test-session")
 
-    mock_process = AsyncMock()
-    mock_process.communicate = AsyncMock(
-        return_value=(stream_output.encode(), b"Warning: deprecated API")
-    )
-    mock_process.returncode = 0
+    mock_process = mock_hapi_process(stream_output.encode(), b"Warning: deprecated API")
 
-    with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+    with patch_subprocess_exec(mock_process):
         result = await executor.execute(
             prompt="Test prompt",
             working_dir=str(mock_desk),
@@ -172,15 +165,13 @@ async def test_execute_uses_desk_path_by_default(executor):
 
     stream_output = success_stream(session_id="test-session")
 
-    mock_process = AsyncMock()
-    mock_process.communicate = AsyncMock(return_value=(stream_output.encode(), b""))
-    mock_process.returncode = 0
+    mock_process = mock_hapi_process(stream_output.encode(), b"", returncode=0)
 
     # Create the default desk path
     desk_path = Path("/tmp/test_desk")
     desk_path.mkdir(parents=True, exist_ok=True)
 
-    with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+    with patch_subprocess_exec(mock_process) as mock_exec:
         await executor.execute(prompt="Test")
 
     # Verify cwd argument
@@ -199,11 +190,9 @@ async def test_execute_uses_desk_path_by_default(executor):
 @pytest.mark.asyncio
 async def test_execute_nonzero_exit_code(executor, mock_desk):
     """Test execution failure with non-zero exit code."""
-    mock_process = AsyncMock()
-    mock_process.communicate = AsyncMock(return_value=(b"", b"Error: command failed"))
-    mock_process.returncode = 1
+    mock_process = mock_hapi_process(b"", b"Error: command failed", returncode=1)
 
-    with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+    with patch_subprocess_exec(mock_process):
         with pytest.raises(RuntimeError, match="Hapi execution failed.*exit code 1"):
             await executor.execute(
                 prompt="Test prompt",
@@ -214,10 +203,7 @@ async def test_execute_nonzero_exit_code(executor, mock_desk):
 @pytest.mark.asyncio
 async def test_execute_command_not_found(executor, mock_desk):
     """Test execution when Hapi command doesn't exist."""
-    with patch(
-        "asyncio.create_subprocess_exec",
-        side_effect=FileNotFoundError("hapi not found"),
-    ):
+    with patch_subprocess_exec(side_effect=FileNotFoundError("hapi not found")):
         with pytest.raises(RuntimeError, match="Hapi command not found"):
             await executor.execute(
                 prompt="Test prompt",
@@ -238,18 +224,10 @@ async def test_execute_working_dir_not_exists(executor):
 @pytest.mark.asyncio
 async def test_execute_timeout(executor, mock_desk):
     """Test execution timeout handling."""
-    mock_process = AsyncMock()
-
-    # Simulate timeout by having communicate never return
-    async def never_completes():
-        await asyncio.sleep(100)  # Sleep longer than timeout
-        return (b"", b"")
-
-    mock_process.communicate = never_completes
-    mock_process.kill = MagicMock()
-    mock_process.wait = AsyncMock()
+    # Simulate timeout by never closing the output pipes
+    mock_process = mock_hapi_process(finishes=False)
 
-    with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+    with patch_subprocess_exec(mock_process):
         # Use a very short timeout for testing
         with pytest.raises(RuntimeError, match="timed out"):
             await executor.execute(
@@ -265,12 +243,10 @@ async def test_execute_timeout(executor, mock_desk):
 @pytest.mark.asyncio
 async def test_execute_handles_utf8_errors(executor, mock_desk):
     """Test execution handles invalid UTF-8 in output."""
-    mock_process = AsyncMock()
     # Invalid UTF-8 bytes (not valid JSON)
-    mock_process.communicate = AsyncMock(return_value=(b"\xff\xfe Invalid UTF-8", b""))
-    mock_process.returncode = 0
+    mock_process = mock_hapi_process(b"\xff\xfe Invalid UTF-8")
 
-    with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+    with patch_subprocess_exec(mock_process):
         result = await executor.execute(
             prompt="Test prompt",
             working_dir=str(mock_desk),
@@ -283,6 +259,48 @@ async def test_execute_handles_utf8_errors(executor, mock_desk):
     assert result.session_id is None
 
 
+@pytest.mark.asyncio
+async def test_execute_keeps_only_output_tail(executor, mock_desk):
+    """Test that only the tail of stdout/stderr is retained, while all lines are parsed."""
+    from tests.fixtures.hapi_streams import INIT_EVENT, SUCCESS_RESULT
+
+    filler = "".join(f"status line {i}\n" for i in range(1000))
+    stdout = f"{INIT_EVENT}\n{filler}{SUCCESS_RESULT}\n".encode()
+    stderr = b"x" * (200 * 1024) + b"last warning"
+    mock_process = mock_hapi_process(stdout, stderr)
+
+    with (
+        patch_subprocess_exec(mock_process),
+        patch("reeve.pulse.executor._STDOUT_TAIL_LINES", 10),
+    ):
+        result = await executor.execute(prompt="Test prompt", working_dir=str(mock_desk))
+
+    # session_id comes from the first line even though it was dropped from the tail
+    assert result.session_id == "test-session-123"
+    assert result.stdout.count("\n") == 10
+    assert result.stdout.endswith(SUCCESS_RESULT + "\n")
+    assert len(result.stderr) == 64 * 1024
+    assert result.stderr.endswith("last warning")
+
+
+@pytest.mark.asyncio
+async def test_execute_skips_oversized_output_lines(executor, mock_desk):
+    """Test that a line longer than the stream limit is skipped rather than failing."""
+    from tests.fixtures.hapi_streams import success_stream
+
+    huge_line = b'{"type":"user","content":"' + b"a" * 300 + b'"}\n'
+    stdout = huge_line + success_stream(session_id="after-huge-line").encode()
+
+    with (
+        patch_subprocess_exec(mock_hapi_process(stdout)),
+        patch("reeve.pulse.executor._STREAM_LINE_LIMIT", 256),
+    ):
+        result = await executor.execute(prompt="Test prompt", working_dir=str(mock_desk))
+
+    assert result.session_id == "after-huge-line"
+    assert result.return_code == 0
+
+
 # ============================================================================
 # Configuration Tests
 # ============================================================================
@@ -311,6 +329,61 @@ def test_executor_custom_timeout():
     assert executor.timeout_seconds == 7200
 
 
+def test_executor_default_subprocess_limit_from_memory():
+    """Test that the default subprocess limit allows one Hapi process per 2 GB of RAM."""
+    page_size = 4096
+    pages = 9 * 1024**3 // page_size  # 9 GB
+    sysconf = {"SC_PAGE_SIZE": page_size, "SC_PHYS_PAGES": pages}
+
+    with patch("os.sysconf", side_effect=sysconf.__getitem__):
+        executor = PulseExecutor(hapi_command="hapi", desk_path="/tmp/desk")
+    assert executor.max_subprocesses == 4
+
+    with patch("os.sysconf", side_effect=ValueError):
+        executor = PulseExecutor(hapi_command="hapi", desk_path="/tmp/desk")
+    assert executor.max_subprocesses is None
+
+    executor = PulseExecutor(hapi_command="hapi", desk_path="/tmp/desk", max_subprocesses=2)
+    assert executor.max_subprocesses == 2
+
+
+@pytest.mark.asyncio
+async def test_executor_limits_concurrent_subprocesses(mock_desk):
+    """Test that executions beyond max_subprocesses wait for a running process to exit."""
+    executor = PulseExecutor(hapi_command="hapi", desk_path=str(mock_desk), max_subprocesses=1)
+    hung = mock_hapi_process(finishes=False)
+
+    with patch_subprocess_exec(hung) as mock_exec:
+        first = asyncio.create_task(executor.execute(prompt="First"))
+        second = asyncio.create_task(executor.execute(prompt="Second"))
+        await asyncio.sleep(0.05)
+
+        # The second execution waits while the first process is running
+        assert mock_exec.call_count == 1
+        assert not second.done()
+
+        hung.kill()
+        with pytest.raises(RuntimeError, match="exit code -9"):
+            await first
+        result = await second
+
+    assert mock_exec.call_count == 2
+    assert result.return_code == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_rechecks_desk_path_each_execution(mock_desk):
+    """Test that a desk removed after a successful run fails with a clear error."""
+    executor = PulseExecutor(hapi_command="hapi", desk_path=str(mock_desk))
+
+    with patch_subprocess_exec():
+        await executor.execute(prompt="First")
+        mock_desk.rmdir()
+
+        with pytest.raises(RuntimeError, match="Working directory does not exist"):
+            await executor.execute(prompt="Second", working_dir=str(mock_desk))
+
+
 # ============================================================================
 # Integration-style Tests
 # ============================================================================
@@ -330,11 +403,9 @@ async def test_full_execution_flow(executor, mock_desk):
     # Mock Hapi execution with stream-json output
     stream_output = success_stream(session_id="session-abc")
 
-    mock_process = AsyncMock()
-    mock_process.communicate = AsyncMock(return_value=(stream_output.encode(), b""))
-    mock_process.returncode = 0
+    mock_process = mock_hapi_process(stream_output.encode(), b"", returncode=0)
 
-    with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+    with patch_subprocess_exec(mock_process) as mock_exec:
         result = await executor.execute(
             prompt=full_prompt,
             session_id="session-abc",
@@ -360,18 +431,10 @@ async def test_full_execution_flow(executor, mock_desk):
 @pytest.mark.asyncio
 async def test_timeout_override_works(executor, mock_desk):
     """Test that timeout_override parameter works."""
-    mock_process = AsyncMock()
-
-    # Simulate a slow operation
-    async def slow_communicate():
-        await asyncio.sleep(0.5)
-        return (b"Output", b"")
+    # Simulate a slow operation (output so far, pipes still open)
+    mock_process = mock_hapi_process(b"Output\n", finishes=False)
 
-    mock_process.communicate = slow_communicate
-    mock_process.kill = MagicMock()
-    mock_process.wait = AsyncMock()
-
-    with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+    with patch_subprocess_exec(mock_process):
         # Should timeout with override of 0.1s
         with pytest.raises(RuntimeError, match="timed out"):
             await executor.execute(
@@ -391,11 +454,9 @@ async def test_working_dir_override(executor, tmp_path):
 
     stream_output = success_stream(session_id="test-session")
 
-    mock_process = AsyncMock()
-    mock_process.communicate = AsyncMock(return_value=(stream_output.encode(), b""))
-    mock_process.returncode = 0
+    mock_process = mock_hapi_process(stream_output.encode(), b"", returncode=0)
 
-    with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+    with patch_subprocess_exec(mock_process) as mock_exec:
         await executor.execute(
             prompt="Test",
             working_dir=str(custom_dir),
@@ -413,11 +474,9 @@ async def test_session_id_extraction_from_stream_json(executor, mock_desk):
 
     stream_output = success_stream(session_id="new-session-xyz")
 
-    mock_process = AsyncMock()
-    mock_process.communicate = AsyncMock(return_value=(stream_output.encode(), b""))
-    mock_process.returncode = 0
+    mock_process = mock_hapi_process(stream_output.encode(), b"", returncode=0)
 
-    with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+    with patch_subprocess_exec(mock_process):
         result = await executor.execute(
             prompt="Test prompt",
             working_dir=str(mock_desk),
@@ -436,11 +495,9 @@ async def test_session_id_extraction_with_prefix_text(executor, mock_desk):
     # Real hapi output has terminal sequences and status messages before JSON events
     stream_output = realistic_terminal_prefix_stream()
 
-    mock_process = AsyncMock()
-    mock_process.communicate = AsyncMock(return_value=(stream_output.encode(), b""))
-    mock_process.returncode = 0
+    mock_process = mock_hapi_process(stream_output.encode(), b"", returncode=0)
 
-    with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+    with patch_subprocess_exec(mock_process):
         result = await executor.execute(
             prompt="Test prompt",
             working_dir=str(mock_desk),
@@ -454,12 +511,10 @@ async def test_session_id_extraction_with_prefix_text(executor, mock_desk):
 @pytest.mark.asyncio
 async def test_session_id_none_on_invalid_json(executor, mock_desk):
     """Test that session_id is None when JSON parsing fails."""
-    mock_process = AsyncMock()
     # Return non-JSON output
-    mock_process.communicate = AsyncMock(return_value=(b"Plain text output", b""))
-    mock_process.returncode = 0
+    mock_process = mock_hapi_process(b"Plain text output")
 
-    with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+    with patch_subprocess_exec(mock_process):
         result = await executor.execute(
             prompt="Test prompt",
             working_dir=str(mock_desk),
@@ -470,20 +525,37 @@ async def test_session_id_none_on_invalid_json(executor, mock_desk):
     assert result.return_code == 0
 
 
+@pytest.mark.parametrize("use_uvloop", [False, True], ids=["asyncio", "uvloop"])
+def test_execute_real_subprocess_on_event_loops(mock_desk, tmp_path, use_uvloop):
+    """Test executing a real process on both the default loop and uvloop (the daemon's)."""
+    from tests.fixtures.hapi_streams import success_stream
+
+    if use_uvloop:
+        uvloop = pytest.importorskip("uvloop")
+        loop_factory = uvloop.new_event_loop
+    else:
+        loop_factory = None
+
+    stream_file = tmp_path / "stream.jsonl"
+    stream_file.write_text(success_stream(session_id="real-session"))
+    fake_hapi = tmp_path / "hapi"
+    fake_hapi.write_text(f"#!/bin/sh\ncat '{stream_file}'\necho warning >&2\n")
+    fake_hapi.chmod(0o755)
+
+    executor = PulseExecutor(hapi_command=str(fake_hapi), desk_path=str(mock_desk))
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        result = runner.run(executor.execute(prompt="Test prompt"))
+
+    assert result.session_id == "real-session"
+    assert result.stderr == "warning\n"
+    assert result.return_code == 0
+
+
 # ============================================================================
 # Stream JSON Integration Tests
 # ============================================================================
 
 
-@pytest.fixture
-def mock_process():
-    """Create a mock process for use in stream-json tests."""
-    mock_proc = AsyncMock()
-    mock_proc.returncode = 0
-    mock_proc.communicate = AsyncMock(return_value=(b"", b""))
-    return mock_proc
-
-
 class TestStreamJsonIntegration:
     """Tests for stream-json output parsing."""
 
@@ -492,16 +564,11 @@ class TestStreamJsonIntegration:
         """Session ID is extracted from stream-json output."""
         from tests.fixtures.hapi_streams import success_stream
 
-        mock_process = AsyncMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(
-            return_value=(
-                success_stream(session_id="stream-session-456").encode(),
-                b"",
-            )
+        mock_process = mock_hapi_process(
+            success_stream(session_id="stream-session-456").encode(), returncode=0
         )
 
-        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+        with patch_subprocess_exec(mock_process):
             result = await executor.execute(
                 prompt="Test prompt",
                 working_dir=str(mock_desk),
@@ -515,16 +582,12 @@ class TestStreamJsonIntegration:
         """Error messages come from parsed stdout, not empty stderr."""
         from tests.fixtures.hapi_streams import error_stream
 
-        mock_process = AsyncMock()
-        mock_process.returncode = 1
-        mock_process.communicate = AsyncMock(
-            return_value=(
-                error_stream(error_msg="API rate limited").encode(),
-                b"",  # stderr is empty (realistic)
-            )
+        # stderr is empty (realistic)
+        mock_process = mock_hapi_process(
+            error_stream(error_msg="API rate limited").encode(), returncode=1
         )
 
-        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+        with patch_subprocess_exec(mock_process):
             with pytest.raises(RuntimeError) as exc_info:
                 await executor.execute(
                     prompt="Test prompt",
@@ -539,19 +602,14 @@ class TestStreamJsonIntegration:
         """Session ID is captured even when execution fails."""
         from tests.fixtures.hapi_streams import error_stream
 
-        mock_process = AsyncMock()
-        mock_process.returncode = 1
-        mock_process.communicate = AsyncMock(
-            return_value=(
-                error_stream(session_id="failed-session-789").encode(),
-                b"",
-            )
+        mock_process = mock_hapi_process(
+            error_stream(session_id="failed-session-789").encode(), returncode=1
         )
 
         # The session_id is in the result even though we raise
         # We need to check the executor's parse result
         # For now, just verify the error is raised with proper message
-        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+        with patch_subprocess_exec(mock_process):
             with pytest.raises(RuntimeError):
                 await executor.execute(
                     prompt="Test prompt",
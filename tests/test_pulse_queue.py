@@ -72,6 +72,36 @@ async def test_schedule_pulse_with_all_fields(queue):
     assert pulse.max_retries == 5
 
 
+@pytest.mark.asyncio
+async def test_schedule_pulse_batches_concurrent_calls(queue):
+    """Test that concurrent schedules share a transaction and a bad pulse only fails itself."""
+    from sqlalchemy import event
+    from sqlalchemy.exc import StatementError
+
+    commits = []
+    event.listen(queue.engine.sync_engine, "commit", lambda conn: commits.append(conn))
+
+    now = datetime.now(timezone.utc)
+    pulse_ids = await asyncio.gather(
+        *(queue.schedule_pulse(scheduled_at=now, prompt=f"Test {i}") for i in range(10))
+    )
+    assert len(commits) == 1
+    assert len(set(pulse_ids)) == 10
+    for i, pid in enumerate(pulse_ids):
+        pulse = await queue.get_pulse(pid)
+        assert pulse.prompt == f"Test {i}"
+
+    good, error = await asyncio.gather(
+        queue.schedule_pulse(scheduled_at=now, prompt="Good"),
+        # The packed sticky-note format can't store its separator character
+        queue.schedule_pulse(scheduled_at=now, prompt="Bad", sticky_notes=["a\x1fb"]),
+        return_exceptions=True,
+    )
+    assert isinstance(error, StatementError)
+    assert isinstance(error.orig, ValueError)
+    assert (await queue.get_pulse(good)).prompt == "Good"
+
+
 @pytest.mark.asyncio
 async def test_get_due_pulses_empty(queue):
     """Test getting due pulses when queue is empty."""
@@ -248,6 +278,19 @@ async def test_mark_processing_already_processing(queue):
     assert success is False
 
 
+@pytest.mark.asyncio
+async def test_mark_processing_race(tmp_path):
+    """Test that concurrent mark_processing calls on one pulse let exactly one win."""
+    q = PulseQueue(f"sqlite+aiosqlite:///{tmp_path / 'pulses.db'}")
+    await q.initialize()
+    try:
+        pulse_id = await q.schedule_pulse(scheduled_at=datetime.now(timezone.utc), prompt="Test")
+        results = await asyncio.gather(*(q.mark_processing(pulse_id) for _ in range(5)))
+        assert sorted(results) == [False, False, False, False, True]
+    finally:
+        await q.close()
+
+
 @pytest.mark.asyncio
 async def test_mark_processing_nonexistent_pulse(queue):
     """Test that marking nonexistent pulse fails."""
@@ -255,6 +298,70 @@ async def test_mark_processing_nonexistent_pulse(queue):
     assert success is False
 
 
+@pytest.mark.asyncio
+async def test_claim_due_pulses(queue):
+    """Test claiming due pulses marks them processing in one statement."""
+    now = datetime.now(timezone.utc)
+    past = now - timedelta(minutes=5)
+
+    low_id = await queue.schedule_pulse(scheduled_at=past, prompt="Low", priority=PulsePriority.LOW)
+    critical_id = await queue.schedule_pulse(
+        scheduled_at=past, prompt="Critical", priority=PulsePriority.CRITICAL
+    )
+    normal_id = await queue.schedule_pulse(scheduled_at=past, prompt="Normal")
+    future_id = await queue.schedule_pulse(scheduled_at=now + timedelta(hours=1), prompt="Future")
+
+    # Limit applies in priority order, and claimed pulses come back ordered
+    claimed = await queue.claim_due_pulses(limit=2)
+    assert [p.id for p in claimed] == [critical_id, normal_id]
+    assert all(p.status == PulseStatus.PROCESSING for p in claimed)
+
+    # Claimed pulses are not handed out again
+    claimed = await queue.claim_due_pulses(limit=10)
+    assert [p.id for p in claimed] == [low_id]
+    assert await queue.claim_due_pulses() == []
+
+    future = await queue.get_pulse(future_id)
+    assert future.status == PulseStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_claim_due_pulses_loads_only_execution_columns(queue):
+    """Test claimed pulses carry what execution needs but not tags or audit fields."""
+    from sqlalchemy import inspect
+
+    await queue.schedule_pulse(
+        scheduled_at=datetime.now(timezone.utc),
+        prompt="Run me",
+        session_id="session-1",
+        sticky_notes=["note"],
+        tags=["tag"],
+        max_retries=2,
+    )
+
+    [pulse] = await queue.claim_due_pulses()
+    assert (pulse.prompt, pulse.session_id, pulse.sticky_notes, pulse.max_retries) == (
+        "Run me",
+        "session-1",
+        ["note"],
+        2,
+    )
+    assert {"tags", "created_by", "created_at", "error_message"} <= inspect(pulse).unloaded
+
+
+@pytest.mark.asyncio
+async def test_get_pulses_by_ids(queue):
+    """Test fetching several pulses in one query, skipping unknown IDs."""
+    now = datetime.now(timezone.utc)
+    first = await queue.schedule_pulse(scheduled_at=now, prompt="First")
+    second = await queue.schedule_pulse(scheduled_at=now, prompt="Second")
+
+    pulses = await queue.get_pulses_by_ids([second, 99999, first])
+
+    assert sorted(p.id for p in pulses) == sorted([first, second])
+    assert await queue.get_pulses_by_ids([]) == []
+
+
 @pytest.mark.asyncio
 async def test_mark_completed(queue):
     """Test marking pulse as completed."""
@@ -270,6 +377,29 @@ async def test_mark_completed(queue):
     assert pulse.execution_duration_ms == 5000
 
 
+@pytest.mark.asyncio
+async def test_mark_completed_batches_concurrent_calls(queue):
+    """Test that concurrent completions are all written (batched) and unknown IDs are ignored."""
+    now = datetime.now(timezone.utc)
+    pulse_ids = [await queue.schedule_pulse(scheduled_at=now, prompt=f"Test {i}") for i in range(5)]
+
+    await asyncio.gather(
+        *(
+            queue.mark_completed(pid, execution_duration_ms=100 * i)
+            for i, pid in enumerate(pulse_ids)
+        ),
+        queue.mark_completed(99999, execution_duration_ms=1),
+    )
+
+    for i, pid in enumerate(pulse_ids):
+        pulse = await queue.get_pulse(pid)
+        assert pulse.status == PulseStatus.COMPLETED
+        assert pulse.executed_at is not None
+        assert pulse.executed_at.tzinfo is not None
+        assert pulse.execution_duration_ms == 100 * i
+    assert await queue.get_pulse(99999) is None
+
+
 @pytest.mark.asyncio
 async def test_mark_failed_without_retry(queue):
     """Test marking pulse as failed without retry."""
@@ -321,6 +451,44 @@ async def test_mark_failed_with_retry(queue):
     assert 50 < time_diff < 70  # Should be ~60 seconds (1 minute)
 
 
+@pytest.mark.asyncio
+async def test_mark_failed_retry_copies_context_in_two_statements(queue):
+    """Test the retry carries the pulse's context and mark_failed costs an UPDATE and an INSERT."""
+    from sqlalchemy import event
+
+    pulse_id = await queue.schedule_pulse(
+        scheduled_at=datetime.now(timezone.utc),
+        prompt="Test",
+        priority=PulsePriority.HIGH,
+        session_id="session-1",
+        sticky_notes=["note"],
+        tags=["tag"],
+        created_by="api",
+        max_retries=2,
+    )
+
+    statements = []
+    event.listen(
+        queue.engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement.split()[0]),
+    )
+    retry_id = await queue.mark_failed(pulse_id, error_message="Boom")
+    assert statements == ["UPDATE", "INSERT"]
+
+    original = await queue.get_pulse(pulse_id)
+    assert (original.status, original.error_message) == (PulseStatus.FAILED, "Boom")
+    retry = await queue.get_pulse(retry_id)
+    assert retry.priority == PulsePriority.HIGH
+    assert retry.session_id == "session-1"
+    assert retry.sticky_notes == ["note"]
+    assert retry.tags == ["tag"]
+    assert retry.created_by == "retry_api"
+    assert retry.max_retries == 2
+
+    assert await queue.mark_failed(99999, error_message="Missing") is None
+
+
 @pytest.mark.asyncio
 async def test_retry_exponential_backoff(queue):
     """Test that retry delays follow 2^retry_count pattern."""
@@ -514,6 +682,74 @@ async def test_timezone_awareness(queue):
     assert pulse.created_at.tzinfo is not None
 
 
+@pytest.mark.asyncio
+async def test_priority_and_status_stored_as_small_integers(queue):
+    """Test that enums are stored as their declaration index and loaded back as members."""
+    from sqlalchemy import text
+
+    now = datetime.now(timezone.utc)
+    pulse_id = await queue.schedule_pulse(
+        scheduled_at=now, prompt="Test", priority=PulsePriority.LOW
+    )
+    await queue.mark_processing(pulse_id)
+
+    async with queue.engine.connect() as conn:
+        row = (
+            await conn.execute(
+                text("SELECT priority, status FROM pulses WHERE id = :id"), {"id": pulse_id}
+            )
+        ).one()
+    assert tuple(row) == (3, 1)  # LOW, PROCESSING
+
+    pulse = await queue.get_pulse(pulse_id)
+    assert pulse.priority is PulsePriority.LOW
+    assert pulse.status is PulseStatus.PROCESSING
+
+
+@pytest.mark.asyncio
+async def test_due_pulses_read_in_index_order(queue):
+    """Test the due-pulse query is served by idx_pulse_due without a sort step."""
+    from reeve.pulse.models import Pulse
+    from reeve.pulse.queue import _select_due_pulses
+
+    stmt = _select_due_pulses(Pulse, datetime.now(timezone.utc), 10)
+    async with queue.engine.connect() as conn:
+        compiled = stmt.compile(conn.sync_connection)
+        plan = (
+            await conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {compiled}",
+                tuple(compiled.construct_params()[name] for name in compiled.positiontup),
+            )
+        ).all()
+
+    details = " ".join(row[-1] for row in plan)
+    assert "idx_pulse_due" in details
+    assert "TEMP B-TREE" not in details
+
+
+@pytest.mark.asyncio
+async def test_overdue_pulses_use_pending_index(queue):
+    """Test the overdue listing is served by the partial idx_pulse_pending_sched."""
+    from reeve.pulse.queue import _select_pulses_by_status
+
+    past = datetime.now(timezone.utc) - timedelta(hours=1)
+    for i in range(20):
+        pulse_id = await queue.schedule_pulse(scheduled_at=past, prompt=f"Pulse {i}")
+        if i % 4:
+            await queue.cancel_pulse(pulse_id)
+
+    stmt = _select_pulses_by_status("overdue", 10)
+    async with queue.engine.connect() as conn:
+        await conn.exec_driver_sql("ANALYZE")
+        # Render values as stored (status as its SMALLINT) so the planner can
+        # match the index's WHERE clause
+        compiled = stmt.compile(conn.sync_connection, compile_kwargs={"literal_binds": True})
+        plan = (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}")).all()
+
+    details = " ".join(row[-1] for row in plan)
+    assert "idx_pulse_pending_sched" in details
+
+
 @pytest.mark.asyncio
 async def test_get_pulse_nonexistent(queue):
     """Test getting a pulse that doesn't exist."""
@@ -532,9 +768,311 @@ async def test_empty_sticky_notes_and_tags(queue):
     assert pulse.tags == []
 
 
+@pytest.mark.asyncio
+async def test_sticky_notes_and_tags_stored_as_packed_text(queue):
+    """Test that string lists are packed into TEXT on SQLite and round-trip exactly."""
+    from sqlalchemy import text
+
+    now = datetime.now(timezone.utc)
+    pulse_id = await queue.schedule_pulse(
+        scheduled_at=now, prompt="Test", sticky_notes=["a, b", ""], tags=["daily"]
+    )
+
+    async with queue.engine.connect() as conn:
+        row = (
+            await conn.execute(
+                text("SELECT sticky_notes, tags FROM pulses WHERE id = :id"), {"id": pulse_id}
+            )
+        ).one()
+    assert tuple(row) == ("\x1fa, b\x1f", "\x1fdaily")
+
+    pulse = await queue.get_pulse(pulse_id)
+    assert pulse.sticky_notes == ["a, b", ""]
+    assert pulse.tags == ["daily"]
+
+
 @pytest.mark.asyncio
 async def test_pulse_queue_close(queue):
     """Test that close() properly disposes the engine."""
     # Queue is created by fixture, just test close doesn't crash
     await queue.close()
     # Can't easily verify disposal, but at least it shouldn't error
+
+
+@pytest.mark.asyncio
+async def test_sqlite_connections_use_wal(tmp_path):
+    """Test that file-backed SQLite connections get WAL mode, NORMAL sync, and cache tuning."""
+    from sqlalchemy import text
+
+    q = PulseQueue(f"sqlite+aiosqlite:///{tmp_path / 'pulses.db'}")
+    try:
+        async with q.engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            # synchronous=NORMAL is 1
+            assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1
+            assert (await conn.execute(text("PRAGMA mmap_size"))).scalar() == 256 * 1024 * 1024
+            assert (await conn.execute(text("PRAGMA cache_size"))).scalar() == -64 * 1024
+            assert (await conn.execute(text("PRAGMA busy_timeout"))).scalar() == 5000
+            # temp_store=MEMORY is 2
+            assert (await conn.execute(text("PRAGMA temp_store"))).scalar() == 2
+    finally:
+        await q.close()
+
+
+@pytest.mark.asyncio
+async def test_get_next_scheduled_at(queue):
+    """Test get_next_scheduled_at returns the earliest pending pulse time."""
+    assert await queue.get_next_scheduled_at() is None
+
+    now = datetime.now(timezone.utc)
+    later_id = await queue.schedule_pulse(scheduled_at=now + timedelta(hours=2), prompt="Later")
+    sooner_id = await queue.schedule_pulse(scheduled_at=now + timedelta(hours=1), prompt="Sooner")
+
+    assert await queue.get_next_scheduled_at() == now + timedelta(hours=1)
+
+    # Non-pending pulses are ignored
+    await queue.cancel_pulse(sooner_id)
+    assert await queue.get_next_scheduled_at() == now + timedelta(hours=2)
+
+    await queue.mark_processing(later_id)
+    assert await queue.get_next_scheduled_at() is None
+
+
+@pytest.mark.asyncio
+async def test_stream_pulses_by_status_matches_list(queue, monkeypatch):
+    """Test streaming yields the same pulses, in order, as get_pulses_by_status."""
+    monkeypatch.setattr("reeve.pulse.queue._STREAM_BATCH_SIZE", 2)
+
+    now = datetime.now(timezone.utc)
+    for i in range(5):
+        await queue.schedule_pulse(scheduled_at=now - timedelta(minutes=i), prompt=f"Test {i}")
+    await queue.schedule_pulse(scheduled_at=now + timedelta(hours=1), prompt="Future")
+
+    for status, limit in (("pending", 20), ("overdue", 20), ("all", 3), ("failed", 20)):
+        listed = await queue.get_pulses_by_status(status, limit)
+        streamed = [p async for p in queue.stream_pulses_by_status(status, limit)]
+        assert [p.id for p in streamed] == [p.id for p in listed]
+
+    assert len([p async for p in queue.stream_pulses_by_status("overdue")]) == 5
+
+
+@pytest.mark.asyncio
+async def test_get_pulse_stats(queue):
+    """Test get_pulse_stats counts each category (and zeros on an empty queue)."""
+    assert await queue.get_pulse_stats() == {
+        "pending": 0,
+        "overdue": 0,
+        "failed": 0,
+        "completed_today": 0,
+        "processing": 0,
+    }
+
+    now = datetime.now(timezone.utc)
+    await queue.schedule_pulse(scheduled_at=now + timedelta(hours=1), prompt="Future")
+    await queue.schedule_pulse(scheduled_at=now - timedelta(hours=1), prompt="Overdue")
+    processing_id = await queue.schedule_pulse(scheduled_at=now, prompt="Processing")
+    await queue.mark_processing(processing_id)
+    completed_id = await queue.schedule_pulse(scheduled_at=now, prompt="Completed")
+    await queue.mark_completed(completed_id, execution_duration_ms=100)
+    failed_id = await queue.schedule_pulse(scheduled_at=now, prompt="Failed")
+    await queue.mark_failed(failed_id, "Error", should_retry=False)
+
+    assert await queue.get_pulse_stats() == {
+        "pending": 2,
+        "overdue": 1,
+        "failed": 1,
+        "completed_today": 1,
+        "processing": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_stats_are_cached_until_a_write(queue, monkeypatch):
+    """Test stats are reused between writes, refreshed after a commit, and expire."""
+    from sqlalchemy import event
+
+    statements = []
+    event.listen(
+        queue.engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    assert (await queue.get_pulse_stats())["pending"] == 0
+    assert (await queue.get_execution_stats())["total_completed"] == 0
+    queried = len(statements)
+    assert (await queue.get_pulse_stats())["pending"] == 0
+    assert (await queue.get_execution_stats())["total_completed"] == 0
+    assert len(statements) == queried
+
+    # Any commit through the queue invalidates the cache
+    await queue.schedule_pulse(scheduled_at=datetime.now(timezone.utc), prompt="Test")
+    assert (await queue.get_pulse_stats())["pending"] == 1
+
+    # And entries expire on their own
+    monkeypatch.setattr("reeve.pulse.queue._STATS_TTL", 0.0)
+    await queue.schedule_pulse(scheduled_at=datetime.now(timezone.utc), prompt="Test")
+    await queue.get_pulse_stats()
+    queried = len(statements)
+    await queue.get_pulse_stats()
+    assert len(statements) > queried
+
+
+@pytest.mark.asyncio
+async def test_stats_computed_across_a_commit_are_not_cached(queue):
+    """Test a commit landing mid-computation keeps the stale result out of the cache."""
+    calls = []
+
+    async def compute():
+        calls.append(None)
+        if len(calls) == 1:
+            await queue.schedule_pulse(scheduled_at=datetime.now(timezone.utc), prompt="Test")
+        return {"calls": len(calls), "items": []}
+
+    assert (await queue._cached_stats("test", compute))["calls"] == 1
+    assert (await queue._cached_stats("test", compute))["calls"] == 2
+    assert (await queue._cached_stats("test", compute))["calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_stats_are_copied_for_callers(queue):
+    """Test callers can't modify the cached result through nested lists."""
+    stats = await queue.get_execution_stats()
+    stats["recent_failures"].append({"id": 1})
+
+    assert (await queue.get_execution_stats())["recent_failures"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_execution_stats(queue):
+    """Test get_execution_stats totals, average duration, and recent failures."""
+    stats = await queue.get_execution_stats()
+    assert stats == {
+        "total_completed": 0,
+        "total_failed": 0,
+        "success_rate": 0.0,
+        "avg_duration_ms": 0.0,
+        "recent_failures": [],
+    }
+
+    now = datetime.now(timezone.utc)
+    for duration_ms in (100, 300):
+        pulse_id = await queue.schedule_pulse(scheduled_at=now, prompt="Completed")
+        await queue.mark_completed(pulse_id, execution_duration_ms=duration_ms)
+    failed_id = await queue.schedule_pulse(scheduled_at=now, prompt="x" * 150)
+    await queue.mark_failed(failed_id, "Boom", should_retry=False)
+    # Still pending: not part of the execution stats
+    await queue.schedule_pulse(scheduled_at=now, prompt="Pending")
+
+    stats = await queue.get_execution_stats()
+    assert stats["total_completed"] == 2
+    assert stats["total_failed"] == 1
+    assert stats["success_rate"] == 66.67
+    assert stats["avg_duration_ms"] == 200.0
+    assert stats["recent_failures"] == [
+        {"id": failed_id, "prompt": "x" * 100 + "...", "error_message": "Boom"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_on_pulse_scheduled_callback(queue):
+    """Test the on_pulse_scheduled callback fires when pending pulses are added or moved."""
+    calls = []
+    queue.on_pulse_scheduled = lambda: calls.append(True)
+
+    now = datetime.now(timezone.utc)
+    pulse_id = await queue.schedule_pulse(scheduled_at=now, prompt="Test pulse")
+    assert len(calls) == 1
+
+    await queue.reschedule_pulse(pulse_id, now + timedelta(minutes=5))
+    assert len(calls) == 2
+
+    # Retry pulses count as newly scheduled
+    await queue.mark_processing(pulse_id)
+    await queue.mark_failed(pulse_id, error_message="boom")
+    assert len(calls) == 3
+
+    # Cancelling doesn't schedule anything
+    await queue.cancel_pulse(pulse_id)
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_change_token_tracks_commits_from_other_connections(tmp_path):
+    """Test change_token changes when another queue instance commits to the same file."""
+    db_url = f"sqlite+aiosqlite:///{tmp_path / 'pulses.db'}"
+    watcher = PulseQueue(db_url)
+    writer = PulseQueue(db_url)
+    try:
+        await watcher.initialize()
+        before = watcher.change_token()
+        assert before is not None
+
+        await writer.schedule_pulse(scheduled_at=datetime.now(timezone.utc), prompt="Test")
+        assert watcher.change_token() != before
+    finally:
+        await watcher.close()
+        await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_change_token_unavailable_for_memory_database(queue):
+    """Test in-memory databases report no change token (callers fall back to polling)."""
+    assert queue.change_token() is None
+
+
+@pytest.mark.asyncio
+async def test_pool_size(tmp_path):
+    """Test pool_size sizes file-backed pools and is ignored for in-memory databases."""
+    file_queue = PulseQueue(f"sqlite+aiosqlite:///{tmp_path / 'pulses.db'}", pool_size=12)
+    memory_queue = PulseQueue("sqlite+aiosqlite:///:memory:", pool_size=12)
+    try:
+        assert file_queue.engine.sync_engine.pool.size() == 12
+        assert memory_queue.engine.sync_engine.pool.__class__.__name__ == "StaticPool"
+    finally:
+        await file_queue.close()
+        await memory_queue.close()
+
+
+@pytest.mark.asyncio
+async def test_initialize_prewarms_pool(tmp_path):
+    """Test initialize() opens pool_size connections up front and returns them to the pool."""
+    q = PulseQueue(f"sqlite+aiosqlite:///{tmp_path / 'pulses.db'}", pool_size=4)
+    try:
+        await q.initialize()
+        assert q.engine.sync_engine.pool.checkedin() == 4
+        assert q.engine.sync_engine.pool.checkedout() == 0
+    finally:
+        await q.close()
+
+
+@pytest.mark.asyncio
+async def test_read_accessors_issue_one_query(queue):
+    """Test each read accessor costs exactly one SQL statement (no per-row lazy loads)."""
+    from sqlalchemy import event
+
+    now = datetime.now(timezone.utc)
+    pulse_ids = [
+        await queue.schedule_pulse(scheduled_at=now, prompt=f"Test {i}", tags=["t"])
+        for i in range(3)
+    ]
+
+    statements = []
+    event.listen(
+        queue.engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    for call in (
+        queue.get_due_pulses(),
+        queue.get_upcoming_pulses(),
+        queue.get_pulse(pulse_ids[0]),
+        queue.get_pulses_by_ids(pulse_ids),
+        queue.get_pulses_by_status("pending"),
+    ):
+        statements.clear()
+        result = await call
+        pulses = result if isinstance(result, list) else [result]
+        assert pulses and all(p.tags == ["t"] for p in pulses)
+        assert len(statements) == 1, statements
@@ -1,7 +1,7 @@
 """
 Tests for Pulse Server Helper Functions
 
-Tests the time parsing and emoji helper functions from the Pulse Queue MCP server.
+Tests the time parsing, emoji, and preview helper functions from the Pulse Queue MCP server.
 """
 
 from datetime import datetime, timedelta, timezone
@@ -113,27 +113,50 @@ class TestTimeParsingHelper:
         assert abs((result2 - result3).total_seconds()) < 1
 
 
-class TestEmojiHelpers:
-    """Test the emoji helper functions."""
+class TestEmojiTables:
+    """Test the emoji lookup tables."""
 
     def test_priority_emoji(self):
-        """Test priority emoji mapping."""
-        from reeve.mcp.pulse_server import _priority_emoji
-
-        assert _priority_emoji("critical") == "🚨"
-        assert _priority_emoji("high") == "🔔"
-        assert _priority_emoji("normal") == "⏰"
-        assert _priority_emoji("low") == "📋"
-        assert _priority_emoji("deferred") == "🕐"
-        assert _priority_emoji("unknown") == ""  # Unknown priority
+        """Test priority emoji mapping covers every priority."""
+        from reeve.mcp.pulse_server import _PRIORITY_EMOJI
+        from reeve.pulse.enums import PulsePriority
+
+        assert _PRIORITY_EMOJI == {
+            "critical": "🚨",
+            "high": "🔔",
+            "normal": "⏰",
+            "low": "📋",
+            "deferred": "🕐",
+        }
+        assert set(_PRIORITY_EMOJI) == {p.value for p in PulsePriority}
 
     def test_status_emoji(self):
-        """Test status emoji mapping."""
-        from reeve.mcp.pulse_server import _status_emoji
-
-        assert _status_emoji("pending") == "⏳"
-        assert _status_emoji("processing") == "⚙️"
-        assert _status_emoji("completed") == "✅"
-        assert _status_emoji("failed") == "❌"
-        assert _status_emoji("cancelled") == "🚫"
-        assert _status_emoji("unknown") == ""  # Unknown status
+        """Test status emoji mapping covers every status."""
+        from reeve.mcp.pulse_server import _STATUS_EMOJI
+        from reeve.pulse.enums import PulseStatus
+
+        assert _STATUS_EMOJI == {
+            "pending": "⏳",
+            "processing": "⚙️",
+            "completed": "✅",
+            "failed": "❌",
+            "cancelled": "🚫",
+        }
+        assert set(_STATUS_EMOJI) == {s.value for s in PulseStatus}
+
+
+class TestPreviewHelper:
+    """Test the shared preview helper function."""
+
+    def test_preview_truncates_long_prompts(self):
+        """Test that prompts over the limit are cut and marked with '...'."""
+        from reeve.utils.text import preview
+
+        assert preview("a" * 61, 60) == "a" * 60 + "..."
+
+    def test_preview_keeps_short_prompts(self):
+        """Test that prompts at or under the limit are returned unchanged."""
+        from reeve.utils.text import preview
+
+        assert preview("a" * 60, 60) == "a" * 60
+        assert preview("short", 100) == "short"
@@ -84,6 +84,48 @@ class TestPulseQueueMCPTools:
         finally:
             pulse_server_module.queue = original_queue
 
+    @pytest.mark.asyncio
+    async def test_schedule_pulse_rejects_unit_separator(self):
+        """Test sticky notes containing \\x1f are rejected with a clear error."""
+        import reeve.mcp.pulse_server as pulse_server_module
+        from reeve.mcp.pulse_server import schedule_pulse
+
+        mock_queue = AsyncMock()
+        original_queue = pulse_server_module.queue
+        pulse_server_module.queue = mock_queue
+
+        try:
+            result = await schedule_pulse(
+                ctx=MagicMock(),
+                scheduled_at="now",
+                prompt="Test pulse",
+                sticky_notes=["a\x1fb"],
+            )
+
+            assert "✗ Failed to schedule pulse" in result
+            assert "sticky_notes must not contain" in result
+            mock_queue.schedule_pulse.assert_not_called()
+        finally:
+            pulse_server_module.queue = original_queue
+
+    @pytest.mark.asyncio
+    async def test_queue_created_lazily_and_reused(self, tmp_path, monkeypatch):
+        """Test that the pulse queue is only created on first use, then shared."""
+        import reeve.mcp.pulse_server as pulse_server_module
+
+        monkeypatch.setattr(pulse_server_module, "queue", None)
+        monkeypatch.setattr(
+            pulse_server_module, "_DB_URL", f"sqlite+aiosqlite:///{tmp_path / 'pulses.db'}"
+        )
+
+        queue = pulse_server_module._get_queue()
+        try:
+            assert pulse_server_module.queue is queue
+            assert pulse_server_module._get_queue() is queue
+            assert str(tmp_path / "pulses.db") in str(queue.engine.url)
+        finally:
+            await queue.close()
+
 
 class TestPulseQueueMCPIntegration:
     """Integration tests with real PulseQueue."""
@@ -133,3 +175,34 @@ class TestPulseQueueMCPIntegration:
             await queue.close()
         finally:
             pulse_server_module.queue = original_queue
+
+    @pytest.mark.asyncio
+    async def test_far_future_pulse_formatting(self):
+        """Test timestamp formatting in confirmations and far-off list rows."""
+        import reeve.mcp.pulse_server as pulse_server_module
+        from reeve.mcp.pulse_server import list_upcoming_pulses, schedule_pulse
+        from reeve.pulse.queue import PulseQueue
+
+        queue = PulseQueue("sqlite+aiosqlite:///:memory:")
+        await queue.initialize()
+        original_queue = pulse_server_module.queue
+        pulse_server_module.queue = queue
+
+        mock_ctx = MagicMock()
+        mock_ctx.session_id = None
+
+        try:
+            result = await schedule_pulse(
+                ctx=mock_ctx,
+                scheduled_at="2099-03-05T07:08:09Z",
+                prompt="Far future formatting pulse",
+                priority="low",
+            )
+            assert "Scheduled: 2099-03-05 07:08:09+00:00" in result
+
+            result = await list_upcoming_pulses()
+            assert "Mar 05 07:08" in result
+
+            await queue.close()
+        finally:
+            pulse_server_module.queue = original_queue
@@ -23,6 +23,7 @@ def mock_config():
     config.pulse_api_port = 8765
     config.pulse_api_token = "test_token_123"
     config.pulse_max_concurrent = 5
+    config.pulse_max_subprocesses = None
     return config
 
 
@@ -61,6 +62,13 @@ def mock_pulse():
     return pulse
 
 
+async def execute_pulse(daemon, pulse):
+    """Run daemon._execute_pulse with the fields the scheduler extracts from a claimed row."""
+    await daemon._execute_pulse(
+        pulse.id, pulse.prompt, pulse.session_id, pulse.sticky_notes, pulse.max_retries
+    )
+
+
 @pytest.fixture
 async def daemon(mock_config, mock_queue, mock_executor):
     """Create daemon with mocked dependencies."""
@@ -76,7 +84,7 @@ async def test_permanent_failure_triggers_sentinel(daemon, mock_pulse):
     daemon.queue.mark_failed.return_value = None
 
     with patch("reeve.sentinel.send_alert") as mock_alert:
-        await daemon._execute_pulse(mock_pulse)
+        await execute_pulse(daemon, mock_pulse)
 
         mock_alert.assert_called_once()
         call_args = mock_alert.call_args
@@ -92,7 +100,7 @@ async def test_retried_failure_does_not_trigger_sentinel(daemon, mock_pulse):
     daemon.queue.mark_failed.return_value = 999
 
     with patch("reeve.sentinel.send_alert") as mock_alert:
-        await daemon._execute_pulse(mock_pulse)
+        await execute_pulse(daemon, mock_pulse)
         mock_alert.assert_not_called()
 
 
@@ -102,7 +110,7 @@ async def test_sentinel_failure_does_not_crash_daemon(daemon, mock_pulse):
     daemon.queue.mark_failed.return_value = None
 
     with patch("reeve.sentinel.send_alert", side_effect=Exception("Sentinel broken")):
-        await daemon._execute_pulse(mock_pulse)
+        await execute_pulse(daemon, mock_pulse)
         daemon.queue.mark_failed.assert_called_once()
 
 
@@ -124,6 +132,6 @@ async def test_successful_pulse_does_not_trigger_sentinel(daemon, mock_pulse):
     daemon.queue.mark_completed = AsyncMock()
 
     with patch("reeve.sentinel.send_alert") as mock_alert:
-        await daemon._execute_pulse(mock_pulse)
+        await execute_pulse(daemon, mock_pulse)
         mock_alert.assert_not_called()
         daemon.queue.mark_completed.assert_called_once()
@@ -313,6 +313,14 @@ class TestEdgeCases:
         # Should not have events from first stream
         assert len(result2.events) == 2
 
+    def test_trailing_text_after_json(self):
+        """Test that text trailing a JSON event on the same line is ignored."""
+        parser = HapiStreamParser()
+        event = parser.parse_line(']9;9;"/home/user/desk"' + INIT_EVENT + "\x1b[0m")
+
+        assert event is not None
+        assert event.session_id == "test-session-123"
+
     def test_empty_stdout(self):
         """Test parsing empty stdout."""
         parser = HapiStreamParser()
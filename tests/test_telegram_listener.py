@@ -2,15 +2,15 @@
 Unit tests for TelegramListener.
 
 Tests the Telegram integration functionality:
-1. Offset Management - Persistence and error handling (6 tests)
-2. Telegram Polling - API interactions and error cases (7 tests)
-3. Message Processing - Filtering, formatting, and pulse triggering (7 tests)
+1. Offset Management - Persistence and error handling (7 tests)
+2. Telegram Polling - API interactions and error cases (13 tests)
+3. Message Processing - Filtering, formatting, and pulse triggering (8 tests)
 4. API Integration - Pulse trigger via HTTP API (5 tests)
-5. Error Handling - Exponential backoff and shutdown logic (5 tests)
+5. Error Handling - Exponential backoff and shutdown logic (7 tests)
 6. Signal Handling - Graceful shutdown (3 tests)
 7. Integration Tests - End-to-end workflows (2 tests)
 
-Total: 35 tests covering initialization, message flow, error recovery, and lifecycle management.
+Total: 45 tests covering initialization, message flow, error recovery, and lifecycle management.
 """
 
 import asyncio
@@ -53,7 +53,7 @@ def listener(mock_config):
 
 
 # ============================================================================
-# 1. OFFSET MANAGEMENT TESTS (6 tests)
+# 1. OFFSET MANAGEMENT TESTS (7 tests)
 # ============================================================================
 
 
@@ -136,8 +136,22 @@ def test_atomic_write_verification(listener, tmp_path):
     assert not temp_file.exists()
 
 
+def test_save_offset_skips_unchanged_offset(listener, tmp_path):
+    """Test saving an offset that is already on disk does not rewrite the file."""
+    listener.offset_file = tmp_path / "telegram_offset.txt"
+    listener.offset_file.write_text("500\n")
+    assert listener._load_offset() == 500
+
+    with patch("os.replace") as mock_replace:
+        listener._save_offset(500)
+        mock_replace.assert_not_called()
+
+    listener._save_offset(501)
+    assert listener.offset_file.read_text().strip() == "501"
+
+
 # ============================================================================
-# 2. TELEGRAM POLLING TESTS (7 tests)
+# 2. TELEGRAM POLLING TESTS (13 tests)
 # ============================================================================
 
 
@@ -322,8 +336,147 @@ async def test_handle_401_unauthorized(listener):
         await listener._get_updates()
 
 
+@pytest.mark.asyncio
+async def test_polling_loop_repolls_without_delay(listener):
+    """Test successful polls go straight back to long polling without sleeping."""
+
+    polls = []
+
+    async def get_updates():
+        polls.append(1)
+        if len(polls) == 2:
+            listener.running = False
+        return {"ok": True, "result": []}
+
+    listener.running = True
+    with patch.object(listener, "_get_updates", side_effect=get_updates):
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await listener._polling_loop()
+
+    assert len(polls) == 2
+    assert call(1) not in mock_sleep.await_args_list
+
+
+@pytest.mark.asyncio
+async def test_polling_loop_pauses_after_failed_poll(listener):
+    """Test a failed poll (None response) pauses before retrying."""
+
+    async def get_updates():
+        listener.running = False
+        return None
+
+    listener.running = True
+    with patch.object(listener, "_get_updates", side_effect=get_updates):
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await listener._polling_loop()
+
+    mock_sleep.assert_awaited_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_polling_loop_processes_batch_concurrently(listener, tmp_path):
+    """Test a batch is processed concurrently and a failing update doesn't block the offset."""
+    listener.offset_file = tmp_path / "telegram_offset.txt"
+    updates = [{"update_id": 100}, {"update_id": 101}, {"update_id": 102}]
+    in_flight = []
+    max_in_flight = 0
+
+    async def process_update(update):
+        nonlocal max_in_flight
+        in_flight.append(update["update_id"])
+        max_in_flight = max(max_in_flight, len(in_flight))
+        await asyncio.sleep(0)
+        in_flight.remove(update["update_id"])
+        if update["update_id"] == 101:
+            raise ValueError("boom")
+
+    async def get_updates():
+        listener.running = False
+        return {"ok": True, "result": updates}
+
+    listener.running = True
+    with patch.object(listener, "_get_updates", side_effect=get_updates):
+        with patch.object(listener, "_process_update", side_effect=process_update):
+            await listener._polling_loop()
+
+    assert max_in_flight == 3
+    assert listener.last_update_id == 103
+
+
+@pytest.mark.asyncio
+async def test_polling_loop_batches_offset_writes(listener, tmp_path):
+    """Test the offset file is only written once enough updates accumulate."""
+    listener.offset_file = tmp_path / "telegram_offset.txt"
+    batches = [
+        [{"update_id": i} for i in range(1, 11)],
+        [{"update_id": i} for i in range(11, 21)],
+    ]
+
+    async def get_updates():
+        batch = batches.pop(0)
+        listener.running = bool(batches)
+        return {"ok": True, "result": batch}
+
+    listener.running = True
+    with patch.object(listener, "_get_updates", side_effect=get_updates):
+        with patch.object(listener, "_process_update", new_callable=AsyncMock):
+            with patch.object(listener, "_save_offset", wraps=listener._save_offset) as mock_save:
+                await listener._polling_loop()
+
+    # 10 updates stay in memory; the second batch crosses the 16-update threshold
+    mock_save.assert_called_once_with(21)
+    assert listener._dirty_offset_count == 0
+
+
+@pytest.mark.asyncio
+async def test_verify_bot_token_prefetches_first_batch(listener):
+    """Test token verification uses getUpdates(timeout=0) and keeps the batch for the loop."""
+    batch = {"ok": True, "result": [{"update_id": 7}]}
+    seen_timeouts = []
+
+    async def get_updates():
+        seen_timeouts.append(listener._updates_params["timeout"])
+        return batch
+
+    with patch.object(listener, "_get_updates", side_effect=get_updates):
+        await listener._verify_bot_token()
+
+    assert seen_timeouts == [0]
+    assert listener._updates_params["timeout"] == 100
+    assert listener._prefetched_updates is batch
+
+    async def stop_polling():
+        listener.running = False
+        return {"ok": True, "result": []}
+
+    listener.running = True
+    with patch.object(listener, "_get_updates", side_effect=stop_polling) as mock_get:
+        with patch.object(listener, "_process_update", new_callable=AsyncMock) as mock_process:
+            await listener._polling_loop()
+
+    # First iteration consumes the prefetched batch without polling again
+    mock_process.assert_awaited_once_with({"update_id": 7})
+    assert listener.last_update_id == 8
+    assert mock_get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_verify_bot_token_invalid(listener):
+    """Test token verification raises when Telegram rejects the token."""
+    with patch.object(
+        listener,
+        "_get_updates",
+        new_callable=AsyncMock,
+        side_effect=RuntimeError("Invalid bot token (401 Unauthorized)"),
+    ):
+        with pytest.raises(RuntimeError, match="Invalid bot token"):
+            await listener._verify_bot_token()
+
+    assert listener._updates_params["timeout"] == 100
+
+
 # ============================================================================
-# 3. MESSAGE PROCESSING TESTS (7 tests)
+# 3. MESSAGE PROCESSING TESTS (8 tests)
 # ============================================================================
 
 
@@ -374,6 +527,16 @@ async def test_filter_wrong_chat_id(listener):
         mock_trigger.assert_not_called()
 
 
+def test_non_numeric_chat_id_rejected(mock_config):
+    """Test a non-integer TELEGRAM_CHAT_ID fails fast at construction."""
+    with patch.dict(
+        "os.environ",
+        {"TELEGRAM_BOT_TOKEN": "test_token_123", "TELEGRAM_CHAT_ID": "not-a-chat"},
+    ):
+        with pytest.raises(ValueError, match="TELEGRAM_CHAT_ID must be an integer"):
+            TelegramListener(mock_config)
+
+
 @pytest.mark.asyncio
 async def test_skip_non_text_messages(listener):
     """Test processing photo/sticker message (no 'text' field), verify skipped."""
@@ -614,7 +777,7 @@ async def test_verify_tags_included(listener):
 
 
 # ============================================================================
-# 5. ERROR HANDLING TESTS (5 tests)
+# 5. ERROR HANDLING TESTS (7 tests)
 # ============================================================================
 
 
@@ -692,14 +855,61 @@ async def test_fatal_errors_trigger_immediate_shutdown(listener):
     assert listener.shutdown_event.is_set()
 
 
+@pytest.mark.asyncio
+async def test_backoff_interrupted_by_shutdown(listener):
+    """Test a pending backoff returns as soon as shutdown is requested."""
+    listener.error_count = 7  # Next backoff would be 256s
+
+    backoff = asyncio.create_task(listener._handle_error(Exception("Test error"), "test context"))
+    await asyncio.sleep(0)
+    listener._handle_shutdown(signal.SIGTERM)
+
+    await asyncio.wait_for(backoff, timeout=1)
+    assert listener.error_count == 8
+
+
+@pytest.mark.asyncio
+async def test_traceback_only_for_early_errors_or_debug(listener, caplog):
+    """Test hot-path error logs skip tracebacks once per-message errors keep repeating."""
+    import logging
+
+    # Successful polls keep the poll error count at zero; it must not matter here
+    listener.error_count = 0
+    mock_session = MagicMock()
+    mock_session.post = MagicMock(side_effect=RuntimeError("boom"))
+    listener.api_session = mock_session
+
+    with caplog.at_level(logging.INFO, logger="reeve.telegram"):
+        for _ in range(5):
+            assert await listener._trigger_pulse("Test message", "Alice") is None
+
+    errors = [r for r in caplog.records if r.levelno == logging.ERROR]
+    assert [bool(r.exc_info) for r in errors] == [True] * 3 + [False] * 2
+    assert listener.message_error_count == 5
+
+    # The predicate only reads the count
+    assert listener._should_log_traceback() is False
+    assert listener.message_error_count == 5
+
+    listener.logger.setLevel(logging.DEBUG)
+    assert listener._should_log_traceback() is True
+    listener.logger.setLevel(logging.NOTSET)
+
+    # A message that triggers a pulse starts the count over
+    update = {"update_id": 1, "message": {"chat": {"id": 12345}, "text": "Hello Reeve!"}}
+    with patch.object(listener, "_trigger_pulse", new_callable=AsyncMock, return_value=42):
+        await listener._process_update(update)
+    assert listener.message_error_count == 0
+    assert listener._should_log_traceback() is True
+
+
 # ============================================================================
 # 6. SIGNAL HANDLING TESTS (3 tests)
 # ============================================================================
 
 
-@pytest.mark.asyncio
-async def test_sigterm_triggers_graceful_shutdown(listener, tmp_path):
-    """Test SIGTERM signal triggers graceful shutdown."""
+def test_sigterm_triggers_graceful_shutdown(listener, tmp_path):
+    """Test SIGTERM signal triggers graceful shutdown without writing from the handler."""
     import signal
 
     listener.running = True
@@ -707,53 +917,53 @@ async def test_sigterm_triggers_graceful_shutdown(listener, tmp_path):
     listener.offset_file = tmp_path / "telegram_offset.txt"
 
     # Simulate SIGTERM handler
-    await listener._handle_shutdown(signal.SIGTERM)
+    listener._handle_shutdown(signal.SIGTERM)
 
     # Verify shutdown state
     assert listener.running is False
     assert listener.shutdown_event.is_set()
 
-    # Verify offset was saved
-    assert listener.offset_file.exists()
-    assert listener.offset_file.read_text().strip() == "12345"
+    # The final offset is flushed by start() once the polling loop returns
+    assert not listener.offset_file.exists()
 
 
-@pytest.mark.asyncio
-async def test_sigint_triggers_shutdown(listener, tmp_path):
+def test_sigint_triggers_shutdown(listener):
     """Test SIGINT (Ctrl+C) triggers shutdown."""
     import signal
 
     listener.running = True
-    listener.last_update_id = 67890
-    listener.offset_file = tmp_path / "telegram_offset.txt"
 
     # Simulate SIGINT handler (Ctrl+C)
-    await listener._handle_shutdown(signal.SIGINT)
+    listener._handle_shutdown(signal.SIGINT)
 
     # Verify shutdown state
     assert listener.running is False
     assert listener.shutdown_event.is_set()
 
-    # Verify offset was saved
-    assert listener.offset_file.exists()
-    assert listener.offset_file.read_text().strip() == "67890"
-
 
 @pytest.mark.asyncio
 async def test_offset_saved_during_shutdown(listener, tmp_path):
-    """Test offset is saved during shutdown."""
+    """Test offset is saved exactly once when start() unwinds after a shutdown signal."""
     import signal
 
-    listener.running = True
-    listener.last_update_id = 99999
     listener.offset_file = tmp_path / "telegram_offset.txt"
 
-    with patch.object(listener, "_save_offset", wraps=listener._save_offset) as mock_save:
-        # Trigger shutdown
-        await listener._handle_shutdown(signal.SIGTERM)
+    async def polling_loop():
+        listener.last_update_id = 99999
+        listener._dirty_offset_count = 1
+        listener._handle_shutdown(signal.SIGTERM)
 
-        # Verify _save_offset was called with correct ID
-        mock_save.assert_called_once_with(99999)
+    with patch.object(listener, "_verify_bot_token", new_callable=AsyncMock):
+        with patch.object(listener, "_register_signal_handlers"):
+            with patch.object(listener, "_polling_loop", side_effect=polling_loop):
+                with patch.object(
+                    listener, "_save_offset", wraps=listener._save_offset
+                ) as mock_save:
+                    await listener.start()
+
+    # Verify _save_offset was called once with correct ID
+    mock_save.assert_called_once_with(99999)
+    assert listener.offset_file.read_text().strip() == "99999"
 
 
 # ============================================================================
@@ -858,12 +1068,8 @@ async def test_full_lifecycle(listener, tmp_path):
 
                 # Trigger shutdown
                 listener.last_update_id = 12345
-                await listener._handle_shutdown(signal.SIGTERM)
+                listener._handle_shutdown(signal.SIGTERM)
 
                 # Verify lifecycle
                 assert listener.running is False
                 assert listener.shutdown_event.is_set()
-
-                # Verify offset was saved
-                assert listener.offset_file.exists()
-                assert listener.offset_file.read_text().strip() == "12345"
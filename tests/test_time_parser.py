@@ -7,13 +7,15 @@ Tests the flexible time string parsing functionality, including:
 - Keywords ("now")
 - Case insensitivity
 - Error handling for invalid formats
+- Memoized parsing of repeated strings
 """
 
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import pytest
 
-from reeve.utils.time_parser import parse_time_string
+from reeve.utils.time_parser import _parse_cached, parse_time_string
 
 
 class TestParseTimeString:
@@ -217,3 +219,17 @@ class TestParseTimeString:
         """Test that error messages mention supported formats."""
         with pytest.raises(ValueError, match="Supported formats"):
             parse_time_string("invalid")
+
+    def test_repeated_relative_string_is_cached_but_stays_relative(self):
+        """Test that cached relative strings are still offset from the current time."""
+        _parse_cached.cache_clear()
+
+        first = parse_time_string("in 2 hours")
+        with patch("reeve.utils.time_parser.datetime") as mock_datetime:
+            later = datetime.now(timezone.utc) + timedelta(minutes=10)
+            mock_datetime.now.return_value = later
+            second = parse_time_string("in 2 hours")
+
+        assert _parse_cached.cache_info().hits == 1
+        assert second == later + timedelta(hours=2)
+        assert second > first